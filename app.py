@@ -1,7 +1,8 @@
+import sys, queue
 import customtkinter as ctk
-from utils.helpers import load_settings, save_settings, get_theme, build_fonts, load_icon
-from game_modes.yugioh.gui import YuGiOhFrame
-from game_modes.mtg.gui import MTGFrame
+from utils.helpers import load_settings, save_settings, flush_settings, get_settings_store, get_theme, build_fonts, font_tuple, load_icon
+from utils.screens import ScreenManager, FrameRegistry
+from utils.profiler import profiler
 
 class CardGameApp(ctk.CTk):
     def __init__(self):
@@ -13,29 +14,68 @@ class CardGameApp(ctk.CTk):
         self.resizable(False, False)
 
         # 🔧 Load global configuration
-        self.config_data = load_settings()
-        self.colour_theme = get_theme(self.config_data)
-        self.fonts = build_fonts(self.colour_theme)
+        with profiler.phase("load_settings"):
+            load_settings()
+        with profiler.phase("get_theme"):
+            self.colour_theme = get_theme(self.config_data)
+        self.fonts = {}  # filled by load_assets() once the menu is on screen
+        self.icons = {}
+        ctk.set_appearance_mode(self.config_data["global"]["selected_theme"])
+        self.current_frame = None
+        self.frames = FrameRegistry(max_frames=2)  # suspended games survive trips to the menu
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # 🔄 Follow changes made by other instances sharing config.json
+        self._config_events = queue.SimpleQueue()
+        store = get_settings_store()
+        store.add_listener(lambda config, sections: self._config_events.put(sections))
+        store.start_watching()
+        self.after(250, self._poll_config_events)
+
+        # 🗂️ Menu screens are built once and re-packed on navigation
+        self.screens = ScreenManager(self)
+        self.screens.register("main_menu", self.build_main_menu)
+        self.screens.register("settings", self.build_settings_menu)
+
+        with profiler.phase("draw_main_menu"):
+            self.draw_main_menu()
+
+        # 🎨 Paint the menu first; icons and fonts follow on the next idle pass
+        self.after_idle(profiler.mark, "first_paint")
+        self.after_idle(self.load_assets)
+
+    @property
+    def config_data(self):
+        """Current read-only Config; change it through save_settings."""
+        return get_settings_store().config
+
+    def load_assets(self):
+        """Build fonts and icons. Runs after the first paint, or on demand before a screen needs them."""
+        if self.icons:
+            return
+        with profiler.phase("build_fonts"):
+            self.fonts = build_fonts(self.colour_theme)
+        # Themed icons carry both colours, so toggling the theme needs no reload
         self.icons = {
-            "back": load_icon("arrow_left", size=(17,17), mode=self.config_data["global"]["selected_theme"]),
-            "settings": load_icon("settings", size=(17,17), mode=self.config_data["global"]["selected_theme"]),
-            "reset": load_icon("reset", size=(17,17), mode=self.config_data["global"]["selected_theme"]),
+            "back": load_icon("arrow_left", size=(17,17), mode="auto"),
+            "settings": load_icon("settings", size=(17,17), mode="auto"),
+            "reset": load_icon("reset", size=(17,17), mode="auto"),
             "plus": load_icon("plus", size=(17,17)),
             "minus": load_icon("minus", size=(17,17))
         }
-        ctk.set_appearance_mode(self.config_data["global"]["selected_theme"])
-        self.current_frame = None
-
-        self.draw_main_menu()
+        if self.screens.current == "main_menu":
+            self.screens.refresh()
 
     # -------------------------------
     # Main Menu
     # -------------------------------
     def draw_main_menu(self, animate=False):
         self.clear_window()
+        self.screens.show("main_menu")
 
+    def build_main_menu(self, parent):
         # Root container
-        frame = ctk.CTkFrame(self)
+        frame = ctk.CTkFrame(parent)
         frame.pack(expand=True, fill="both")
 
         # ----------------------------
@@ -54,7 +94,7 @@ class CardGameApp(ctk.CTk):
         title_label = ctk.CTkLabel(
             top_bar,
             text="Choose your Game",
-            font=self.fonts["heading"],
+            font=self.fonts.get("heading") or font_tuple(self.colour_theme, "heading"),
             pady=6
         )
         title_label.grid(row=0, column=1, padx=5)
@@ -63,7 +103,7 @@ class CardGameApp(ctk.CTk):
         settings_button = ctk.CTkButton(
             top_bar,
             text="",
-            image=self.icons["settings"],
+            image=self.icons.get("settings"),
             text_color=self.colour_theme["text_primary"],
             fg_color="transparent",
             hover=False,
@@ -91,17 +131,27 @@ class CardGameApp(ctk.CTk):
                       width=200, height=40,
                       command=self.start_mtg).pack(pady=10)
 
+        def refresh():
+            # The first paint happens before load_assets(); pick the real font and icon up afterwards
+            if self.icons:
+                title_label.configure(font=self.fonts["heading"])
+                settings_button.configure(image=self.icons["settings"])
+
+        return refresh
+
     # -------------------------------
     # Screen Loaders
     # -------------------------------
     def start_yugioh(self):
+        # Game modes (and pygame) are only imported once picked
+        from game_modes.yugioh.gui import YuGiOhFrame
         self.switch_to(YuGiOhFrame, self.config_data)
 
     def start_mtg(self):
+        from game_modes.mtg.gui import MTGFrame
         self.switch_to(MTGFrame, self.config_data)
 
     def back_to_main_menu(self):
-        self.clear_window()
         self.draw_main_menu()
         self.geometry("300x200")
 
@@ -114,9 +164,22 @@ class CardGameApp(ctk.CTk):
     # Frame Switching
     # -------------------------------
     def switch_to(self, FrameClass, config_data):
+        with profiler.phase(f"switch_to {FrameClass.__name__}"):
+            self._switch_to(FrameClass, config_data)
+
+    def _switch_to(self, FrameClass, config_data):
+        self.load_assets()
         self.clear_window()
 
-        self.current_frame = FrameClass(self, config_data)
+        # Resume a suspended game if we have one, otherwise start a new one
+        frame = self.frames.get(FrameClass)
+        if frame is None:
+            frame = FrameClass(self, config_data)
+            self.frames.add(FrameClass, frame)
+        else:
+            frame.on_resume()
+
+        self.current_frame = frame
         self.current_frame.pack(fill="both", expand=True)
 
         # Determine target window size
@@ -129,16 +192,24 @@ class CardGameApp(ctk.CTk):
 
 
     def clear_window(self):
-        for widget in self.winfo_children():
-            widget.destroy()
+        """Hide the cached menu screens and suspend the active game frame."""
+        self.screens.hide()
+        if self.current_frame is not None:
+            self.current_frame.pack_forget()
+            self.current_frame.on_suspend()
+            self.current_frame = None
 
     
     # -------------------------------
     # Settings Menu
     # -------------------------------
     def show_settings_menu(self):
+        self.load_assets()
         self.clear_window()
-        frame = ctk.CTkFrame(self)
+        self.screens.show("settings")
+
+    def build_settings_menu(self, parent):
+        frame = ctk.CTkFrame(parent)
         frame.pack(expand=True, fill="both")
 
         # 🔹 Top Bar
@@ -190,13 +261,10 @@ class CardGameApp(ctk.CTk):
         theme_switch = ctk.CTkSwitch(
             theme_row,
             text="",  # no label text, since we have our own label
-            command=lambda: self.toggle_theme(theme_switch, self.show_settings_menu)
+            command=lambda: self.toggle_theme(theme_switch)
         )
         theme_switch.pack(side="right", anchor="e")
 
-        if self.config_data["global"]["selected_theme"] == "dark":
-            theme_switch.select()
-
         # Volume row (label + slider side by side)
         volume_row = ctk.CTkFrame(content, fg_color="transparent")
         volume_row.pack(fill="x", padx=30, pady=(10, 10))
@@ -225,27 +293,113 @@ class CardGameApp(ctk.CTk):
             return slider
 
         volume_slider = make_volume_slider(volume_row)
-        volume_slider.set(self.config_data["global"].get("volume", 0.5))
         volume_slider.pack(side="right", fill="x", expand=True)
 
+        # Low-latency audio row
+        latency_row = ctk.CTkFrame(content, fg_color="transparent")
+        latency_row.pack(fill="x", padx=30, pady=(0, 10))
+
+        latency_label = ctk.CTkLabel(latency_row, text="Low-latency Audio", font=self.fonts["body"])
+        latency_label.pack(side="left", anchor="w")
+
+        latency_switch = ctk.CTkSwitch(
+            latency_row,
+            text="",
+            command=lambda: self.set_low_latency(bool(latency_switch.get()))
+        )
+        latency_switch.pack(side="right", anchor="e")
+
+        # Audio sleep row: close the audio device after this much silence
+        sleep_choices = {"Never": 0, "30 s": 30, "1 min": 60, "5 min": 300}
+        sleep_row = ctk.CTkFrame(content, fg_color="transparent")
+        sleep_row.pack(fill="x", padx=30, pady=(0, 10))
+
+        sleep_label = ctk.CTkLabel(sleep_row, text="Audio Sleep", font=self.fonts["body"])
+        sleep_label.pack(side="left", anchor="w")
+
+        sleep_menu = ctk.CTkOptionMenu(
+            sleep_row,
+            values=list(sleep_choices),
+            width=100,
+            command=lambda choice: save_settings({"global": {"audio_idle_timeout": sleep_choices[choice]}})
+        )
+        sleep_menu.pack(side="right", anchor="e")
+
+        def refresh():
+            # Sync controls with the current config each time the screen is shown
+            if self.config_data["global"]["selected_theme"] == "dark":
+                theme_switch.select()
+            else:
+                theme_switch.deselect()
+            volume_slider.set(self.config_data["global"].get("volume", 0.5))
+            if self.config_data["global"]["low_latency"]:
+                latency_switch.select()
+            else:
+                latency_switch.deselect()
+            timeout = self.config_data["global"]["audio_idle_timeout"]
+            sleep_menu.set(next((k for k, v in sleep_choices.items() if v == timeout), f"{timeout} s"))
+
+        return refresh
+
     # -------------------------------
     # Handlers
     # -------------------------------
-    def toggle_theme(self, switch, function):
+    def toggle_theme(self, switch, function=None):
         theme = "dark" if switch.get() else "light"
-        self.config_data["global"]["selected_theme"] = theme
         save_settings({"global": {"selected_theme": theme}})
         ctk.set_appearance_mode(theme)
-        self.icons = {
-            "back": load_icon("arrow_left", size=(20,20), mode=theme),
-            "settings": load_icon("settings", size=(20,20), mode=theme),
-            "reset": load_icon("reset", size=(17,17), mode=theme),
-            "plus": load_icon("plus", size=(17,17)),
-            "minus": load_icon("minus", size=(17,17))
-        }
         self.colour_theme = get_theme(self.config_data)
-        function()
+
+        # Cached screens hold colours from the old theme
+        self.screens.invalidate()
+        for frame in self.frames:
+            if frame is not self.current_frame:
+                frame.screens.invalidate(rebuild=False)
+        if function:
+            function()
+
+    def _poll_config_events(self):
+        sections = set()
+        while not self._config_events.empty():
+            sections.update(self._config_events.get())
+        if sections:
+            self.apply_external_settings(sections)
+        self.after(250, self._poll_config_events)
+
+    def apply_external_settings(self, sections):
+        """Apply settings another app instance wrote to config.json."""
+        if "global" in sections:
+            theme = self.config_data["global"]["selected_theme"]
+            ctk.set_appearance_mode(theme)
+            self.colour_theme = get_theme(self.config_data)
+
+            self.screens.invalidate()
+            for frame in self.frames:
+                sfx = getattr(frame, "sfx", None)
+                if sfx is not None:
+                    sfx.set_volume(self.config_data["global"]["volume"])
+                if frame is not self.current_frame:
+                    frame.screens.invalidate(rebuild=False)
+        if self.current_frame is not None:
+            self.current_frame.on_settings_changed(sections)
+
+    def on_close(self):
+        flush_settings()  # don't lose a debounced write on exit
+        loudness = sys.modules.get("utils.loudness")
+        if loudness is not None:
+            loudness.save_cache()
+        self.destroy()
+
+    def set_low_latency(self, enabled):
+        """Switch the audio profile. The mixer buffer is fixed once open, so it applies from the next start."""
+        from utils import sound
+        save_settings({"global": {"low_latency": enabled}})
+        if enabled and not self.config_data["global"]["audio_buffer"]:
+            # First use on this machine: find the smallest buffer that keeps up
+            sound.load_async(sound.calibrate_low_latency)
+
+        if sound.mixer_is_open():
+            print("ℹ️ Audio profile change takes effect the next time the app starts.")
 
     def set_volume(self, value):
-        self.config_data["global"]["volume"] = round(float(value), 2)
-        save_settings({"global": {"volume": self.config_data["global"]["volume"]}})
+        save_settings({"global": {"volume": round(float(value), 2)}})
@@ -0,0 +1,109 @@
+import os, sys, json, subprocess, tracemalloc
+from benchmarks.harness import benchmark, time_it
+from utils import helpers, sound
+from game_modes.yugioh.theme import SoundThemeManager, THEME_MAP
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# ----------------------------
+# Icons
+# ----------------------------
+def _clear_icon_caches():
+    helpers._icon_cache.clear()
+    helpers._icon_variants.clear()
+
+
+@benchmark("icons.load_icon.cold")
+def bench_icon_cold():
+    return time_it(lambda: helpers.load_icon("settings", size=(17, 17), mode="auto"),
+                   setup=_clear_icon_caches, repeat=20, number=1)
+
+
+@benchmark("icons.load_icon.warm")
+def bench_icon_warm():
+    return time_it(lambda: helpers.load_icon("settings", size=(17, 17), mode="auto"))
+
+
+# ----------------------------
+# Sound themes
+# ----------------------------
+def _register_theme_benchmarks():
+    for theme_name, folder in THEME_MAP.items():
+        def bench(theme_name=theme_name):
+            manager = SoundThemeManager(THEME_MAP)
+            # Cold: every repeat decodes the four clips from disk again
+            return time_it(lambda: manager.load_theme(theme_name),
+                           setup=sound.clear_sound_cache, repeat=5, number=1)
+
+        benchmark(f"sound.load_theme.{folder}")(bench)
+
+
+_register_theme_benchmarks()
+
+
+# ----------------------------
+# Memory
+# ----------------------------
+# Peak RSS only ever grows, so each measurement runs in a fresh interpreter.
+# ru_maxrss covers SDL's decoded buffers, which tracemalloc can't see.
+def _reset_peak_rss():
+    """Reset the peak RSS to the current RSS where the OS allows it (Linux)."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass  # the peak then also covers start-up, so the result is a lower bound
+
+
+def _peak_rss_kib():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # bytes on macOS, KiB elsewhere
+
+
+def memory_probe(theme_names):
+    """Load the given themes from a cold cache and print peak memory as JSON (run in a subprocess)."""
+    sound.ensure_mixer()
+    manager = SoundThemeManager(THEME_MAP)
+    sound.clear_sound_cache()
+
+    _reset_peak_rss()
+    before = _peak_rss_kib()
+    tracemalloc.start()
+    for theme_name in theme_names:
+        manager.load_theme(theme_name)
+    _, python_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    after = _peak_rss_kib()
+
+    print(json.dumps({
+        "rss_kib": None if before is None else after - before,
+        "python_kib": round(python_peak / 1024, 1),
+    }))
+
+
+def _run_probe(theme_names):
+    code = f"from benchmarks.assets import memory_probe; memory_probe({list(theme_names)!r})"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")])))
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True).stdout
+    probe = json.loads(output.strip().splitlines()[-1])
+
+    # Fall back to the Python-side peak where there is no ru_maxrss
+    value = probe["rss_kib"] if probe["rss_kib"] is not None else probe["python_kib"]
+    return {"unit": "KiB", "value": value, **probe}
+
+
+@benchmark("memory.load_theme.basic")
+def bench_memory_one_theme():
+    return _run_probe(["Basic"])
+
+
+@benchmark("memory.load_theme.all")
+def bench_memory_all_themes():
+    return _run_probe(list(THEME_MAP))
@@ -0,0 +1,112 @@
+import sys, json, time, platform, statistics
+from timeit import Timer
+
+# ----------------------------
+# Registry
+# ----------------------------
+# Suite modules register their benchmarks at import with @benchmark. Each one
+# returns a result dict; time_it() covers the common "call this repeatedly"
+# case, and memory-style benchmarks build their own.
+BENCHMARKS = {}  # name -> function() -> result dict
+
+
+def benchmark(name: str):
+    def register(function):
+        BENCHMARKS[name] = function
+        return function
+    return register
+
+
+def time_it(function, setup=None, repeat=7, number=None, min_time=0.2):
+    """Time function() and return per-call statistics in microseconds.
+
+    setup() runs before every repeat and is not timed (use it to clear caches
+    for cold-path benchmarks, together with number=1). Without number, the
+    loop count is picked so one repeat takes at least min_time seconds.
+    """
+    if number is None:
+        if setup:
+            setup()
+        number, _ = Timer(function).autorange()
+        number = max(1, int(number * min_time / 0.2))
+
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        samples.append((time.perf_counter() - start) / number * 1e6)
+
+    return {
+        "unit": "us",
+        "median": round(statistics.median(samples), 3),
+        "min": round(min(samples), 3),
+        "max": round(max(samples), 3),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+# ----------------------------
+# Reports
+# ----------------------------
+def machine_info():
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def load_report(path: str):
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def save_report(path: str, report: dict):
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def compare(current: dict, baseline: dict, threshold: float = 0.2):
+    """Return (regressions, rows) comparing scores against a baseline report.
+
+    Lower is better for every benchmark. One regresses when its score is
+    more than threshold (as a fraction) above the baseline's. Benchmarks
+    missing from the baseline are listed as new, never as regressions.
+    """
+    rows, regressions = [], []
+    old_results = baseline.get("results", {})
+    for name, result in current.get("results", {}).items():
+        new_score, old_score = score(result), score(old_results.get(name))
+        if new_score is None or not old_score:
+            rows.append((name, None, new_score, None, "new"))
+            continue
+        change = new_score / old_score - 1
+        status = "REGRESSION" if change > threshold else "ok"
+        if status == "REGRESSION":
+            regressions.append(name)
+        rows.append((name, old_score, new_score, change, status))
+    return regressions, rows
+
+
+def score(result):
+    """The number a result is compared by: median time, or value for one-shot measurements."""
+    if not result:
+        return None
+    return result.get("median", result.get("value"))
+
+
+def format_rows(rows, unit_of):
+    lines = [f"{'benchmark':<40} {'baseline':>12} {'current':>12} {'change':>8}  status"]
+    for name, old, new, change, status in rows:
+        unit = unit_of(name)
+        old_text = "-" if old is None else f"{old:.1f}{unit}"
+        new_text = "-" if new is None else f"{new:.1f}{unit}"
+        change_text = "-" if change is None else f"{change:+.0%}"
+        lines.append(f"{name:<40} {old_text:>12} {new_text:>12} {change_text:>8}  {status}")
+    return "\n".join(lines)
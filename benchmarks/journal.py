@@ -0,0 +1,61 @@
+import os, time, tempfile
+from benchmarks.harness import benchmark, time_it
+from core import journal
+from core.yugioh import Game, LifePointController
+
+# ----------------------------
+# Match journal overhead
+# ----------------------------
+# What one LP change costs the caller with a journal attached (the fsync
+# happens on the writer thread), and how well a burst is grouped into fsyncs.
+
+
+def _journaled_controller(directory):
+    controller = LifePointController(Game(starting_lp=8000))
+    match_journal = journal.open_match(directory, "yugioh", journal.match_header("yugioh", 8000, ("P1", "P2")))
+    match_journal.attach(controller.bus)
+    return controller, match_journal
+
+
+def _change(controller):
+    def change():
+        controller.change_lp(1, -100)
+        controller.change_lp(1, 100)
+    return change
+
+
+@benchmark("journal.change_lp.plain")
+def bench_plain():
+    return time_it(_change(LifePointController(Game(starting_lp=8000))))
+
+
+@benchmark("journal.change_lp.journaled")
+def bench_journaled():
+    with tempfile.TemporaryDirectory(prefix="cgu-journal-") as directory:
+        controller, match_journal = _journaled_controller(directory)
+        try:
+            return time_it(_change(controller))
+        finally:
+            match_journal.close()
+
+
+@benchmark("journal.burst.records_per_fsync")
+def bench_group_commit(operations=5000):
+    with tempfile.TemporaryDirectory(prefix="cgu-journal-") as directory:
+        controller, match_journal = _journaled_controller(directory)
+        start = time.perf_counter()
+        for i in range(operations):
+            controller.change_lp(1 + i % 2, -1)
+        match_journal.close()
+        elapsed = time.perf_counter() - start
+        stats = match_journal.stats()
+        size = os.path.getsize(match_journal.path)
+
+    return {
+        "unit": "records",
+        "value": round(stats["records"] / max(1, stats["commits"]), 1),
+        "records": stats["records"],
+        "commits": stats["commits"],
+        "bytes_per_record": round(size / stats["records"], 1),
+        "durable_ms": round(elapsed * 1000, 1),  # until the last record is fsynced
+    }
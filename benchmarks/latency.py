@@ -0,0 +1,123 @@
+"""Audio latency harness.
+
+    python -m benchmarks.latency               # every buffer size, plus buffer calibration
+    python -m benchmarks.latency --samples 50
+
+For each mixer buffer size, a fresh interpreter opens the mixer and queues
+a silent clip in the LP_counting role through the AudioEngine
+(utils.latency.probe, the same probe buffer calibration uses). It then times how long it takes for
+the mixer to report a channel busy. That covers the queue hand-off and
+the engine thread, and is what the Tk thread actually waits for. The
+device buffer itself adds up to buffer_ms on top before the sound is
+audible, so that is reported alongside.
+
+The idle probe measures what an open but silent device costs in process CPU
+time, against the same stretch with the device closed by the idle policy.
+It also measures wake latency: play() on a closed device until a channel is
+busy.
+"""
+import os, sys, json, time, argparse, statistics, subprocess
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.harness import benchmark
+from utils.latency import BUFFER_SIZES, calibrate_buffer, run_probe, run_python, wait_for
+
+
+def _cpu_percent(seconds):
+    start_cpu, start = time.process_time(), time.perf_counter()
+    time.sleep(seconds)
+    return (time.process_time() - start_cpu) / (time.perf_counter() - start) * 100
+
+
+def idle_probe(idle_s, samples):
+    """Measure idle CPU with the device open and suspended, and wake latency (run in a subprocess)."""
+    import pygame
+    from utils import sound
+    from utils.audio_engine import AudioEngine
+
+    engine = AudioEngine()
+    clip = sound.get_cached_sound("yugioh", "basic", "Refresh.wav")
+    engine.play("Refresh", clip)
+    wait_for(pygame.mixer.get_busy)
+    engine.stop_all()
+    wait_for(lambda: not pygame.mixer.get_busy())
+    open_cpu = _cpu_percent(idle_s)
+
+    wake = []
+    suspended_cpu = []
+    for _ in range(samples):
+        # Close the device the way the engine does once the timeout has passed
+        sound.suspend_mixer(0)
+        suspended_cpu.append(_cpu_percent(idle_s / samples))
+        start = time.perf_counter()
+        engine.play("Refresh", clip)
+        wait_for(lambda: pygame.mixer.get_init() and pygame.mixer.get_busy())
+        wake.append((time.perf_counter() - start) * 1000)
+        engine.stop_all()
+        wait_for(lambda: not pygame.mixer.get_busy())
+
+    wake.sort()
+    print(json.dumps({
+        "open_cpu_percent": round(open_cpu, 3),
+        "suspended_cpu_percent": round(statistics.mean(suspended_cpu), 3),
+        "wake_median_ms": round(statistics.median(wake), 3),
+        "wake_max_ms": round(wake[-1], 3),
+        "samples": samples,
+    }))
+
+
+def run_idle_probe(idle_s=2.0, samples=10):
+    return run_python(f"from benchmarks.latency import idle_probe; idle_probe({idle_s}, {samples})")
+
+
+def _register():
+    for buffer_size in BUFFER_SIZES:
+        def bench(buffer_size=buffer_size):
+            result = run_probe(buffer_size)
+            return {"unit": "ms", "value": result["median_ms"], **result}
+
+        benchmark(f"audio.play_to_busy.{buffer_size}")(bench)
+
+
+_register()
+
+
+@benchmark("audio.idle")
+def bench_idle():
+    result = run_idle_probe()
+    return {"unit": "ms", "value": result["wake_median_ms"], **result}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure audio latency across mixer buffer sizes.")
+    parser.add_argument("--samples", type=int, default=30, help="plays per buffer size (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    from utils.sound import MIXER_FREQUENCY
+    print(f"{'buffer':>8} {'buffer_ms':>10} {'play->busy':>11} {'p95':>8} {'wake p99 late':>14} {'calibration':>12}")
+    chosen, calibration = calibrate_buffer(MIXER_FREQUENCY, duration_s=0.25)
+    for buffer_size in BUFFER_SIZES:
+        result = run_probe(buffer_size, args.samples)
+        checked = calibration.get(buffer_size)
+        late_text = "-" if checked is None else f"{checked['p99_late_ms']:.2f}ms"
+        verdict = "-" if checked is None else "pass" if checked["passed"] else "reject"
+        print(f"{buffer_size:>8} {result['buffer_ms']:>8.2f}ms {result['median_ms']:>9.3f}ms "
+              f"{result['p95_ms']:>6.3f}ms {late_text:>14} {verdict:>12}")
+
+    print(f"\nℹ️ Low-latency mode would pick a {chosen}-sample buffer on this machine.")
+
+    idle = run_idle_probe()
+    print(f"ℹ️ Idle CPU: {idle['open_cpu_percent']:.2f}% with the device open, "
+          f"{idle['suspended_cpu_percent']:.2f}% suspended; wake latency "
+          f"{idle['wake_median_ms']:.2f}ms median, {idle['wake_max_ms']:.2f}ms worst")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
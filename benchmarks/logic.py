@@ -0,0 +1,68 @@
+from benchmarks.harness import benchmark, time_it
+from core.yugioh import Player, Game, LifePointController
+from core.mtg import Game as MTGGame, MTGLifeController
+
+
+# ----------------------------
+# Yu-Gi-Oh player maths
+# ----------------------------
+@benchmark("yugioh.player.damage")
+def bench_damage():
+    player = Player("Player 1", 8000)
+    return time_it(lambda: player.damage(100))
+
+
+@benchmark("yugioh.player.heal")
+def bench_heal():
+    player = Player("Player 1", 8000)
+    return time_it(lambda: player.heal(100))
+
+
+@benchmark("yugioh.player.halve_lp")
+def bench_halve_lp():
+    player = Player("Player 1", 8000)
+
+    def halve():
+        player.lp = 8000
+        player.halve_lp()
+
+    return time_it(halve)
+
+
+@benchmark("yugioh.controller.change_lp")
+def bench_change_lp():
+    # Headless, as the CLI and load tests drive it
+    controller = LifePointController(Game(starting_lp=8000))
+
+    def change():
+        controller.change_lp(1, -100)
+        controller.change_lp(1, 100)
+
+    return time_it(change)
+
+
+@benchmark("yugioh.controller.undo_redo")
+def bench_undo_redo():
+    controller = LifePointController(Game(starting_lp=8000))
+    controller.change_lp(1, -100)
+
+    def undo_redo():
+        controller.undo()
+        controller.redo()
+
+    return time_it(undo_redo)
+
+
+# ----------------------------
+# MTG
+# ----------------------------
+@benchmark("mtg.game.reset")
+def bench_mtg_reset():
+    game = MTGGame(starting_life=20)
+    return time_it(game.reset)
+
+
+@benchmark("mtg.controller.change_life")
+def bench_change_life():
+    controller = MTGLifeController(MTGGame(starting_life=20))
+    return time_it(lambda: controller.change_life(1, -1))
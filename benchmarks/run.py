@@ -0,0 +1,98 @@
+"""Headless benchmark runner.
+
+    python -m benchmarks.run                      # run everything, write bench_output.json
+    python -m benchmarks.run -k sound -k icons    # only names containing "sound" or "icons"
+    python -m benchmarks.run --save-baseline      # store results as benchmarks/baseline.json
+    python -m benchmarks.run --compare            # flag regressions against that baseline
+
+The exit status is 1 when --compare finds a regression.
+"""
+import os, sys, argparse, tempfile
+
+# No display or sound card needed
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+SUITES = ["benchmarks.logic", "benchmarks.settings", "benchmarks.assets", "benchmarks.latency", "benchmarks.journal"]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the CardGameUtility benchmarks.")
+    parser.add_argument("-k", dest="filters", action="append", default=[], metavar="TEXT",
+                        help="only run benchmarks whose name contains TEXT (repeatable)")
+    parser.add_argument("--list", action="store_true", help="list benchmark names and exit")
+    parser.add_argument("--output", default="bench_output.json", metavar="PATH",
+                        help="where to write the JSON results (default: %(default)s)")
+    parser.add_argument("--save-baseline", nargs="?", const=DEFAULT_BASELINE, metavar="PATH",
+                        help="also store the results as a baseline")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, metavar="PATH",
+                        help="compare against a baseline and flag regressions")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="slowdown that counts as a regression, as a fraction (default: %(default)s)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    output = os.path.abspath(args.output)
+    baseline_out = args.save_baseline and os.path.abspath(args.save_baseline)
+    compare_with = args.compare and os.path.abspath(args.compare)
+
+    from importlib import import_module
+    from benchmarks import harness
+
+    with tempfile.TemporaryDirectory(prefix="cgu-bench-") as scratch:
+        # Settings benchmarks read and write config.json in the working directory
+        cwd = os.getcwd()
+        os.chdir(scratch)
+        try:
+            for suite in SUITES:
+                import_module(suite)
+
+            names = [name for name in harness.BENCHMARKS
+                     if not args.filters or any(text in name for text in args.filters)]
+            if args.list:
+                print("\n".join(names))
+                return 0
+
+            results = {}
+            for name in names:
+                print(f"  {name} ...", end="", flush=True)
+                try:
+                    results[name] = harness.BENCHMARKS[name]()
+                except Exception as e:
+                    print(f" failed: {e}")
+                    continue
+                result = results[name]
+                print(f" {harness.score(result):.4g}{result['unit']}")
+
+            from utils.helpers import flush_settings
+            flush_settings()
+        finally:
+            os.chdir(cwd)
+
+    report = {"machine": harness.machine_info(), "results": results}
+    harness.save_report(output, report)
+    print(f"ℹ️ Results written to {output}")
+    if baseline_out:
+        harness.save_report(baseline_out, report)
+        print(f"ℹ️ Baseline written to {baseline_out}")
+
+    if compare_with:
+        baseline = harness.load_report(compare_with)
+        regressions, rows = harness.compare(report, baseline, args.threshold)
+        print()
+        print(harness.format_rows(rows, lambda name: results[name]["unit"]))
+        if regressions:
+            print(f"\n⚠️ {len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
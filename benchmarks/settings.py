@@ -0,0 +1,27 @@
+import itertools
+from benchmarks.harness import benchmark, time_it
+from utils.helpers import load_settings, save_settings, flush_settings
+
+# run.py switches into a temporary directory first, so these read and write a
+# scratch config.json rather than the real one.
+
+
+@benchmark("settings.load_settings")
+def bench_load_settings():
+    load_settings()
+    flush_settings()  # write the defaults once so later loads take the fast path
+    # Fixed loop count: every load builds a new SettingsStore
+    return time_it(load_settings, number=50)
+
+
+@benchmark("settings.save_flush_load_roundtrip")
+def bench_roundtrip():
+    load_settings()
+    volumes = itertools.cycle([0.25, 0.5, 0.75])
+
+    def roundtrip():
+        save_settings({"global": {"volume": next(volumes)}})
+        flush_settings()
+        load_settings()
+
+    return time_it(roundtrip, number=20)
@@ -0,0 +1,218 @@
+"""Headless driver for the game engines: no display, no audio.
+
+    python cli.py yugioh                    # interactive prompt
+    python cli.py mtg --starting 40
+    python cli.py yugioh -q < ops.txt       # scripted; only errors and 'show' print
+    python cli.py yugioh -c "damage 1 1000" -c "halve 2" -c show
+    python cli.py yugioh --journal journals --resume   # journal the match; pick up a crashed one
+
+Commands go through the same controllers the GUI uses, so a script
+exercises exactly the game logic behind the buttons.
+"""
+import sys, cmd, time, shlex, argparse
+from core import yugioh, mtg, journal
+from core.events import LifeChanged, LifeReset
+
+
+# ----------------------------
+# Views
+# ----------------------------
+class PrintView:
+    """Reports game events as text instead of animating them."""
+
+    def __init__(self, game, bus, quiet=False):
+        self.game = game
+        if not quiet:
+            bus.subscribe(LifeChanged, self.on_changed)
+            bus.subscribe(LifeReset, self.on_reset)
+
+    def on_changed(self, event):
+        name = (self.game.player1 if event.player_num == 1 else self.game.player2).name
+        print(f"{name}: {event.old} -> {event.new}")
+
+    def on_reset(self, event):
+        print("Both players reset")
+
+
+# ----------------------------
+# Shells
+# ----------------------------
+class GameShell(cmd.Cmd):
+    """Commands shared by every game; subclasses add the game's own."""
+
+    def __init__(self, interactive):
+        super().__init__()
+        self.prompt = f"{self.game_name}> " if interactive else ""
+        self.use_rawinput = interactive
+        self.operations = 0
+        self.failed = False
+
+    def _player_and_value(self, arg, needs_value=True):
+        parts = shlex.split(arg)
+        if len(parts) != (2 if needs_value else 1) or parts[0] not in ("1", "2"):
+            raise ValueError("usage: <player 1|2>" + (" <amount>" if needs_value else ""))
+        return int(parts[0]), int(parts[1]) if needs_value else None
+
+    def onecmd(self, line):
+        try:
+            stop = super().onecmd(line)
+        except ValueError as e:
+            print(f"⚠️ {e}")
+            self.failed = True
+            return False
+        name = self.parseline(line)[0]
+        if name not in (None, "show", "help", "quit", "EOF") and hasattr(self, "do_" + name):
+            self.operations += 1
+        return stop
+
+    def default(self, line):
+        print(f"⚠️ Unknown command: {line}")
+        self.failed = True
+
+    def emptyline(self):
+        return False
+
+    def do_show(self, arg):
+        """show: print both players' totals."""
+        for player in (self.game.player1, self.game.player2):
+            print(f"{player.name}: {self.total(player)}")
+
+    def do_undo(self, arg):
+        """undo: revert the last change."""
+        if not self.controller.undo():
+            print("Nothing to undo")
+
+    def do_redo(self, arg):
+        """redo: re-apply the last undone change."""
+        if not self.controller.redo():
+            print("Nothing to redo")
+
+    def do_quit(self, arg):
+        """quit: leave the shell."""
+        return True
+
+    def do_EOF(self, arg):
+        if self.use_rawinput:
+            print()
+        return True
+
+
+class YuGiOhShell(GameShell):
+    game_name = "yugioh"
+
+    def __init__(self, starting=8000, quiet=False, interactive=True):
+        self.game = yugioh.Game(starting_lp=starting)
+        self.controller = yugioh.LifePointController(self.game)
+        self.view = PrintView(self.game, self.controller.bus, quiet)
+        super().__init__(interactive)
+
+    def total(self, player):
+        return player.lp
+
+    def do_damage(self, arg):
+        """damage <player> <amount>: take LP away."""
+        player_num, value = self._player_and_value(arg)
+        self.controller.change_lp(player_num, -abs(value))
+
+    def do_heal(self, arg):
+        """heal <player> <amount>: add LP."""
+        player_num, value = self._player_and_value(arg)
+        self.controller.change_lp(player_num, abs(value))
+
+    def do_lp(self, arg):
+        """lp <player> <+/-amount>: change LP by a signed amount."""
+        self.controller.change_lp(*self._player_and_value(arg))
+
+    def do_halve(self, arg):
+        """halve <player>: halve a player's LP."""
+        player_num, _ = self._player_and_value(arg, needs_value=False)
+        self.controller.halve_lp(player_num)
+
+    def do_reset(self, arg):
+        """reset: both players back to the starting LP."""
+        self.controller.reset_all_lp()
+
+
+class MTGShell(GameShell):
+    game_name = "mtg"
+
+    def __init__(self, starting=20, quiet=False, interactive=True):
+        self.game = mtg.Game(starting_life=starting)
+        self.controller = mtg.MTGLifeController(self.game)
+        self.view = PrintView(self.game, self.controller.bus, quiet)
+        super().__init__(interactive)
+
+    def total(self, player):
+        return player.life
+
+    def do_life(self, arg):
+        """life <player> <+/-amount>: change life by a signed amount."""
+        self.controller.change_life(*self._player_and_value(arg))
+
+    def do_reset(self, arg):
+        """reset: both players back to the starting life."""
+        self.controller.reset_life()
+
+
+SHELLS = {"yugioh": YuGiOhShell, "mtg": MTGShell}
+
+
+def open_journal(shell, args):
+    game = shell.game
+
+    def resume(path):
+        if not args.resume:
+            return False
+        attribute = "lp" if args.game == "yugioh" else "life"
+        journal.replay(path, game, lambda player_num, total: setattr(game.get_player(player_num), attribute, total))
+        print(f"ℹ️ Resumed {path}")
+        return True
+
+    starting = game.starting_lp if args.game == "yugioh" else game.starting_life
+    header = journal.match_header(args.game, starting, (game.player1.name, game.player2.name))
+    match_journal = journal.open_match(args.journal, args.game, header, resume)
+    match_journal.attach(shell.controller.bus)
+    return match_journal
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Drive a game engine from the command line.")
+    parser.add_argument("game", choices=sorted(SHELLS))
+    parser.add_argument("--starting", type=int, help="starting LP / life (default: the game's usual)")
+    parser.add_argument("-c", dest="commands", action="append", metavar="COMMAND",
+                        help="run COMMAND instead of reading from stdin (repeatable)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="don't print each change")
+    parser.add_argument("--stats", action="store_true", help="print operation count and rate at the end")
+    parser.add_argument("--journal", metavar="DIR", help="journal every change to a match file in DIR")
+    parser.add_argument("--resume", action="store_true", help="with --journal, replay an unfinished match first")
+    args = parser.parse_args(argv)
+
+    interactive = args.commands is None and sys.stdin.isatty()
+    options = {"quiet": args.quiet, "interactive": interactive}
+    if args.starting is not None:
+        options["starting"] = args.starting
+    shell = SHELLS[args.game](**options)
+    match_journal = open_journal(shell, args) if args.journal else None
+
+    start = time.perf_counter()
+    if args.commands is not None:
+        for command in args.commands:
+            if shell.onecmd(command):
+                break
+    else:
+        shell.cmdloop()
+    elapsed = time.perf_counter() - start
+    if match_journal is not None:
+        match_journal.close()
+
+    if args.stats:
+        rate = shell.operations / elapsed if elapsed else 0.0
+        print(f"ℹ️ {shell.operations} operations in {elapsed * 1000:.1f}ms ({rate:,.0f}/s)", file=sys.stderr)
+        if match_journal is not None:
+            stats = match_journal.stats()
+            print(f"ℹ️ Journal: {stats['records']} records in {stats['commits']} fsyncs", file=sys.stderr)
+    return 1 if shell.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2 @@
+# Game engines and controllers with no GUI or audio imports, so they can be
+# scripted, load-tested or run inside a server without a display.
@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+
+# ----------------------------
+# Events
+# ----------------------------
+# Published by the controllers after the game state has changed. Both games
+# use the same events; "life" means LP in Yu-Gi-Oh.
+
+
+@dataclass(frozen=True, slots=True)
+class LifeChanged:
+    player_num: int
+    old: int
+    new: int
+    cause: str  # "damage", "heal", "halve", "adjust", "undo", "redo"
+
+
+@dataclass(frozen=True, slots=True)
+class LifeReset:
+    totals: tuple  # (player 1, player 2) after the reset
+
+
+def coalesce(earlier: LifeChanged, later: LifeChanged):
+    """One change covering two consecutive changes to the same player."""
+    return LifeChanged(later.player_num, earlier.old, later.new, later.cause)
+
+
+# ----------------------------
+# Bus
+# ----------------------------
+class EventBus:
+    """Synchronous publish/subscribe keyed by event class.
+
+    Handlers run on the publishing thread, in subscription order, before
+    publish() returns. Views that touch Tk should collect events and apply
+    them on their own schedule (see utils.animation.FrameBatcher).
+    """
+
+    def __init__(self):
+        self._handlers = {}  # event class -> [handler]
+
+    def subscribe(self, event_type, handler):
+        """Call handler(event) for every published event_type. Returns a function that unsubscribes."""
+        self._handlers.setdefault(event_type, []).append(handler)
+
+        def unsubscribe():
+            handlers = self._handlers.get(event_type, [])
+            if handler in handlers:
+                handlers.remove(handler)
+
+        return unsubscribe
+
+    def publish(self, event):
+        for handler in tuple(self._handlers.get(type(event), ())):
+            handler(event)
@@ -0,0 +1,81 @@
+from array import array
+
+# ----------------------------
+# Undo / redo history
+# ----------------------------
+# Records are (player, before, after, cause) deltas stored column-wise in
+# fixed-size typed arrays used as a ring buffer, so a marathon match keeps
+# the same few KiB however many changes it sees: once full, the oldest record
+# is overwritten. Recording, undo and redo are all O(1).
+CAUSES = ("damage", "heal", "halve", "adjust")
+_CAUSE_CODES = {cause: code for code, cause in enumerate(CAUSES)}
+DEFAULT_CAPACITY = 512
+TOTAL_MIN, TOTAL_MAX = -2 ** 63, 2 ** 63 - 1  # what the "q" columns can hold
+
+
+def clamp_change(total, amount):
+    """amount, limited so total + amount stays a total the history can record."""
+    return max(TOTAL_MIN - total, min(amount, TOTAL_MAX - total))
+
+
+class History:
+    """Fixed-capacity undo / redo log of LP or life changes."""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self._player = array("B", bytes(capacity))
+        self._before = array("q", bytes(8 * capacity))
+        self._after = array("q", bytes(8 * capacity))
+        self._cause = array("B", bytes(capacity))
+        self._start = 0  # slot of the oldest record
+        self._count = 0  # records stored, including undone ones still available to redo
+        self._cursor = 0  # records currently applied; undo steps back from here
+
+    def __len__(self):
+        return self._count
+
+    def can_undo(self):
+        return self._cursor > 0
+
+    def can_redo(self):
+        return self._cursor < self._count
+
+    def record(self, player_num, before, after, cause):
+        """Add a change. Anything that was undone can no longer be redone.
+
+        Raises OverflowError, with nothing recorded, for a total outside TOTAL_MIN..TOTAL_MAX.
+        """
+        if not (TOTAL_MIN <= before <= TOTAL_MAX and TOTAL_MIN <= after <= TOTAL_MAX):
+            raise OverflowError(f"total out of range: {before} -> {after}")
+        self._count = self._cursor
+        if self._count == self.capacity:
+            self._start = (self._start + 1) % self.capacity
+            self._count -= 1
+        slot = (self._start + self._count) % self.capacity
+        self._player[slot] = player_num
+        self._before[slot] = before
+        self._after[slot] = after
+        self._cause[slot] = _CAUSE_CODES[cause]
+        self._count += 1
+        self._cursor = self._count
+
+    def undo(self):
+        """Step back one record and return it as (player_num, before, after, cause), or None."""
+        if not self._cursor:
+            return None
+        self._cursor -= 1
+        return self._read(self._cursor)
+
+    def redo(self):
+        """Re-apply the last undone record and return it, or None."""
+        if self._cursor == self._count:
+            return None
+        self._cursor += 1
+        return self._read(self._cursor - 1)
+
+    def clear(self):
+        self._start = self._count = self._cursor = 0
+
+    def _read(self, position):
+        slot = (self._start + position) % self.capacity
+        return self._player[slot], self._before[slot], self._after[slot], CAUSES[self._cause[slot]]
@@ -0,0 +1,272 @@
+"""Append-only match journal with group-commit fsync and crash recovery.
+
+Every LifeChanged / LifeReset published on a controller's bus becomes one
+JSON line in <directory>/<game>-<timestamp>.jsonl:
+
+    {"start": "yugioh", "starting": 8000, "names": ["Player 1", "Player 2"], "time": ...}
+    {"p": 1, "old": 8000, "new": 7000, "c": "damage"}
+    {"reset": [8000, 8000]}
+    {"end": true}
+
+append() only queues the line, so the Tk thread never waits on the disk. A
+writer thread collects whatever arrives within GROUP_COMMIT_MS, then writes
+it and fsyncs it together. A journal with no end line was cut short by a
+crash or power loss, unless another running instance still holds its lock.
+Replaying it rebuilds the totals and the undo history.
+"""
+import os, json, time, threading
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from core.events import LifeChanged, LifeReset
+from core.history import CAUSES
+
+GROUP_COMMIT_MS = 50  # how long the writer waits for more lines before one fsync covers them all
+KEEP_FINISHED = 20  # finished journals kept per game; older ones are deleted
+
+
+class Journal:
+    def __init__(self, path, header=None):
+        """Open path for appending. A header is written for a new journal; pass None when resuming one."""
+        self.path = path
+        self.records = 0
+        self.commits = 0  # fsyncs
+        self._pending = []
+        self._lock = threading.Condition()
+        self._closed = False
+        self._unsubscribe = []
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._owner = _lock_journal(path)
+        if self._owner is None:
+            raise RuntimeError(f"{path} is in use by another instance")
+        _truncate_torn_tail(path)
+        self._file = open(path, "a", encoding="utf-8")
+        if header is not None:
+            self.append(header)
+        self._thread = threading.Thread(target=self._run, name="match-journal", daemon=True)
+        self._thread.start()
+
+    # ----------------------------
+    # Recording
+    # ----------------------------
+    def attach(self, bus):
+        """Journal every change published on bus."""
+        self._unsubscribe += [
+            bus.subscribe(LifeChanged, self._on_changed),
+            bus.subscribe(LifeReset, lambda e: self.append({"reset": list(e.totals)})),
+        ]
+
+    def _on_changed(self, e):
+        # The hot path: ints and a fixed cause word, so skip json.dumps
+        self._queue(f'{{"p":{e.player_num},"old":{e.old},"new":{e.new},"c":"{e.cause}"}}\n')
+
+    def append(self, record):
+        self._queue(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def _queue(self, line):
+        with self._lock:
+            if self._closed:
+                return
+            self._pending.append(line)
+            self.records += 1
+            if len(self._pending) == 1:
+                self._lock.notify()
+
+    def close(self, finished=True):
+        """Flush everything; with finished, mark the match as ended so it isn't offered for recovery."""
+        for unsubscribe in self._unsubscribe:
+            unsubscribe()
+        self._unsubscribe = []
+        if finished:
+            self.append({"end": True})
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._lock.notify()
+        self._thread.join()
+        self._file.close()
+        _unlock_journal(self._owner)
+
+    def stats(self):
+        return {"records": self.records, "commits": self.commits}
+
+    # ----------------------------
+    # Writer thread
+    # ----------------------------
+    def _run(self):
+        while True:
+            with self._lock:
+                while not self._pending and not self._closed:
+                    self._lock.wait()
+                if not self._closed:
+                    # Give a burst (key repeat, a replayed script) time to join this commit
+                    self._lock.wait(GROUP_COMMIT_MS / 1000)
+                batch, self._pending = self._pending, []
+                closed = self._closed
+
+            if batch:
+                try:
+                    self._file.write("".join(batch))
+                    self._file.flush()
+                    os.fsync(self._file.fileno())
+                    self.commits += 1
+                except OSError as e:
+                    print(f"⚠️ Could not write match journal: {e}")
+            if closed:
+                return
+
+
+def _truncate_torn_tail(path):
+    """Cut a half-written last line (from a crash mid-write) so appends start on a fresh line."""
+    try:
+        with open(path, "rb+") as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+    except FileNotFoundError:
+        pass
+
+
+# <journal>.lock stays on disk for as long as the journal does. Unlinking it
+# while locked would let another process lock the old inode, or remove a
+# lock file a third one had just created; prune() deletes it with the journal.
+def _lock_journal(path):
+    """Take a non-blocking exclusive lock marking path as open. Returns the lock handle, or None if taken."""
+    handle = open(path + ".lock", "a+")
+    try:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        handle.close()
+        return None
+    return handle
+
+
+def _unlock_journal(handle):
+    handle.close()  # closing releases the lock
+
+
+def in_use(path):
+    """True while another Journal (in any process) has path open."""
+    handle = _lock_journal(path)
+    if handle is None:
+        return True
+    _unlock_journal(handle)
+    return False
+
+
+# ----------------------------
+# Files
+# ----------------------------
+def match_header(game, starting, names):
+    return {"start": game, "starting": starting, "names": list(names), "time": round(time.time(), 3)}
+
+
+def new_journal_path(directory, game):
+    return os.path.join(directory, f"{game}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.jsonl")
+
+
+def read_records(path):
+    """Every complete record in a journal; a torn last line is ignored."""
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                break
+    return records
+
+
+def find_incomplete(directory, game):
+    """Return the newest journal for game that has no end record, or None."""
+    if not os.path.isdir(directory):
+        return None
+    names = sorted((n for n in os.listdir(directory) if n.startswith(f"{game}-") and n.endswith(".jsonl")), reverse=True)
+    for name in names:
+        path = os.path.join(directory, name)
+        try:
+            records = read_records(path)
+        except OSError:
+            continue
+        if records and "start" in records[0] and "end" not in records[-1] and not in_use(path):
+            return path
+    return None
+
+
+def finish(path):
+    """Mark a journal as ended without replaying it (recovery declined)."""
+    Journal(path).close()
+
+
+def prune(directory, game, keep=KEEP_FINISHED):
+    """Delete all but the newest keep finished journals for game."""
+    if not os.path.isdir(directory):
+        return
+    names = sorted(n for n in os.listdir(directory) if n.startswith(f"{game}-") and n.endswith(".jsonl"))
+    for name in names[:-keep] if keep else names:
+        path = os.path.join(directory, name)
+        try:
+            with open(path, "rb") as f:
+                f.seek(max(0, os.path.getsize(path) - 32))
+                finished = b'"end"' in f.read()
+            if finished:
+                os.remove(path)
+                if os.path.exists(path + ".lock"):
+                    os.remove(path + ".lock")
+        except OSError:
+            pass
+
+
+def open_match(directory, game, header, resume=None):
+    """Start journaling a match of game.
+
+    If the last match was cut short, resume(path) is asked first; when it
+    replays the journal and returns True, recording continues in that
+    journal. Otherwise it is marked finished and a new one is started.
+    """
+    path = find_incomplete(directory, game)
+    if path is not None:
+        if resume is not None and resume(path):
+            return Journal(path)
+        finish(path)
+    prune(directory, game)
+    return Journal(new_journal_path(directory, game), header)
+
+
+# ----------------------------
+# Recovery
+# ----------------------------
+def replay(path, game, set_total):
+    """Rebuild a game from a journal.
+
+    set_total(player_num, value) writes a player's total. The game's history
+    is rebuilt too, so undo keeps working after recovery. Returns the header.
+    """
+    records = read_records(path)
+    header = records[0] if records and "start" in records[0] else {}
+    game.history.clear()
+    for record in records[1:]:
+        if "reset" in record:
+            for player_num, total in enumerate(record["reset"], start=1):
+                set_total(player_num, total)
+            game.history.clear()
+        elif "p" in record:
+            set_total(record["p"], record["new"])
+            cause = record["c"]
+            if cause == "undo":
+                game.history.undo()
+            elif cause == "redo":
+                game.history.redo()
+            elif cause in CAUSES:
+                game.history.record(record["p"], record["old"], record["new"], cause)
+    return header
@@ -0,0 +1,103 @@
+from core.events import EventBus, LifeChanged, LifeReset
+from core.history import History, clamp_change
+
+# --------------------
+# Player Class
+# --------------------
+
+class Player:
+    def __init__(self, name: str, starting_life: int = 20):
+        self.name = name
+        self.life = starting_life
+
+    def adjust_life(self, amount: int):
+        """Increase or decrease life points."""
+        self.life += amount
+
+
+
+# --------------------
+# Game Class
+# --------------------
+
+class Game:
+    def __init__(self, starting_life=20, player1_name="Player 1", player2_name="Player 2"):
+        self.player1 = Player(player1_name, starting_life)
+        self.player2 = Player(player2_name, starting_life)
+        self.starting_life = starting_life
+        self.history = History()  # recent life changes, for undo / redo
+
+    def get_player(self, player_num):
+        return self.player1 if player_num == 1 else self.player2
+
+    def reset(self):
+        """Reset both players to starting life points and forget the history."""
+        self.player1.life = self.starting_life
+        self.player2.life = self.starting_life
+        self.history.clear()
+
+    def undo(self):
+        """Revert the last recorded change. Returns (player_num, before, after, cause) or None."""
+        record = self.history.undo()
+        if record is not None:
+            self.get_player(record[0]).life = record[1]
+        return record
+
+    def redo(self):
+        """Re-apply the last undone change."""
+        record = self.history.redo()
+        if record is not None:
+            self.get_player(record[0]).life = record[2]
+        return record
+
+
+# --------------------
+# Controller
+# --------------------
+
+class MTGLifeController:
+    """Applies life changes to a Game and publishes LifeChanged / LifeReset on its EventBus."""
+
+    def __init__(self, game, bus=None):
+        self.game = game
+        self.bus = bus or EventBus()
+
+    def get_player(self, player_num):
+        return self.game.get_player(player_num)
+
+    def change_life(self, player_num, value):
+        """Adjust life and return the new total."""
+        player = self.get_player(player_num)
+        old_value = player.life
+        player.adjust_life(clamp_change(old_value, value))
+        self._changed(player_num, old_value, player.life, "adjust")
+        return player.life
+
+    def reset_life(self):
+        self.game.reset()
+        self.bus.publish(LifeReset((self.game.player1.life, self.game.player2.life)))
+
+    def undo(self):
+        """Revert the last change and publish it. Returns False if there was nothing to undo."""
+        record = self.game.undo()
+        if record is None:
+            return False
+        player_num, before, after, _ = record
+        self.bus.publish(LifeChanged(player_num, after, before, "undo"))
+        return True
+
+    def redo(self):
+        record = self.game.redo()
+        if record is None:
+            return False
+        player_num, before, after, _ = record
+        self.bus.publish(LifeChanged(player_num, before, after, "redo"))
+        return True
+
+    def _changed(self, player_num, old_value, new_value, cause):
+        try:
+            self.game.history.record(player_num, old_value, new_value, cause)
+        except OverflowError:
+            self.get_player(player_num).life = old_value  # never leave a change half-applied
+            raise ValueError(f"Life out of range: {old_value} -> {new_value}") from None
+        self.bus.publish(LifeChanged(player_num, old_value, new_value, cause))
@@ -0,0 +1,130 @@
+from core.events import EventBus, LifeChanged, LifeReset
+from core.history import History, clamp_change
+
+# --------------------
+# Player Class
+# --------------------
+
+class Player: #Individual players object
+    def __init__(self, name, starting_lp):
+        self.name = name #player name
+        self.lp = starting_lp #starting lifepoint value
+    
+    def damage(self, value): #reduce life point value by given value
+        self.lp = max(0, self.lp - value)
+    
+    def heal(self, value): #heal life point value by given value
+        self.lp += value
+
+    def halve_lp(self): #halve the life point value
+        self.lp //= 2
+
+    def reset_lp(self, default_lp): #reset life points to the starting value
+        self.lp = default_lp
+
+
+# --------------------
+# Game Class
+# --------------------
+
+class Game: #Game object for two player objects that are playing together, with a starting lifepoint value for both players defaulted to 8000.
+    def __init__(self, starting_lp):
+        self.starting_lp = starting_lp
+        self.player1 = Player("Player 1", starting_lp) #create player 1 object
+        self.player2 = Player("Player 2", starting_lp) #create player 2 object
+        self.history = History() #recent LP changes, for undo / redo
+
+    def get_player(self, number): #return either player 1 or 2 object depending on given number
+        if number == 1:
+            return self.player1
+        elif number == 2:
+            return self.player2
+        else:
+            return None
+
+    def reset(self, starting_lp=None): #new game: both players back to the starting LP, history cleared
+        if starting_lp is not None:
+            self.starting_lp = starting_lp
+        self.player1.reset_lp(self.starting_lp)
+        self.player2.reset_lp(self.starting_lp)
+        self.history.clear()
+
+    def undo(self): #revert the last recorded change; returns (player_num, before, after, cause) or None
+        record = self.history.undo()
+        if record is not None:
+            self.get_player(record[0]).lp = record[1]
+        return record
+
+    def redo(self): #re-apply the last undone change
+        record = self.history.redo()
+        if record is not None:
+            self.get_player(record[0]).lp = record[2]
+        return record
+
+
+# --------------------
+# Controller
+# --------------------
+
+class LifePointController:
+    """Applies LP changes to a Game and publishes what changed on its EventBus.
+
+    Views (the GUI, the CLI) subscribe to LifeChanged / LifeReset on
+    controller.bus. Confirmation dialogs are the view's business, before
+    calling in here.
+    """
+
+    def __init__(self, game, bus=None):
+        self.game = game
+        self.bus = bus or EventBus()
+
+    def get_player(self, player_num):
+        return self.game.player1 if player_num == 1 else self.game.player2
+
+    def change_lp(self, player_num, value):
+        """Increase or decrease LP for a player. Returns the new LP."""
+        player = self.get_player(player_num)
+        old_value = player.lp
+        value = clamp_change(old_value, value)
+        if value < 0:
+            player.damage(abs(value))
+        else:
+            player.heal(value)
+        self._changed(player_num, old_value, player.lp, "damage" if value < 0 else "heal")
+        return player.lp
+
+    def halve_lp(self, player_num):
+        player = self.get_player(player_num)
+        old_value = player.lp
+        player.halve_lp()
+        self._changed(player_num, old_value, player.lp, "halve")
+        return player.lp
+
+    def reset_all_lp(self, starting_lp=None):
+        self.game.reset(starting_lp)
+        self.bus.publish(LifeReset((self.game.player1.lp, self.game.player2.lp)))
+
+    def undo(self):
+        """Revert the last change; views animate it back like any other change. Returns False if there was none."""
+        record = self.game.undo()
+        if record is None:
+            return False
+        player_num, before, after, _ = record
+        self.bus.publish(LifeChanged(player_num, after, before, "undo"))
+        return True
+
+    def redo(self):
+        record = self.game.redo()
+        if record is None:
+            return False
+        player_num, before, after, _ = record
+        self.bus.publish(LifeChanged(player_num, before, after, "redo"))
+        return True
+
+    def _changed(self, player_num, old_value, new_value, cause):
+        try:
+            self.game.history.record(player_num, old_value, new_value, cause)
+        except OverflowError:
+            self.get_player(player_num).lp = old_value  # never leave a change half-applied
+            raise ValueError(f"LP out of range: {old_value} -> {new_value}") from None
+        self.bus.publish(LifeChanged(player_num, old_value, new_value, cause))
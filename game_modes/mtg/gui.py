@@ -1,15 +1,18 @@
 import customtkinter as ctk
 from tkinter import messagebox
-from utils.helpers import save_settings
+from utils.helpers import save_settings, get_config_path, UNDO_KEYS
+from utils.screens import ScreenManager
+from utils.animation import get_animator, FrameBatcher
+from utils.counter import LifeCounter
 from game_modes.mtg.game import Game
 from game_modes.mtg.logic import MTGLifeController
+from core.events import LifeChanged, LifeReset, coalesce
+from core import journal
 
 class MTGFrame(ctk.CTkFrame):
     def __init__(self, master, config_data):
         super().__init__(master)
         self.master = master
-        self.config_data = config_data
-        self.settings = config_data["mtg"]
         self.selected_player = None
         self.temp_value = ctk.IntVar(value=0)
 
@@ -21,27 +24,41 @@ class MTGFrame(ctk.CTkFrame):
         )
 
         # Controller
-        self.controller = MTGLifeController(self)
+        self.controller = MTGLifeController(self.game)
 
-        # StringVars for UI
-        self.p1_life = ctk.StringVar(value=str(self.game.player1.life))
-        self.p2_life = ctk.StringVar(value=str(self.game.player2.life))
+        # Game changes arrive as events and reach the screen at most once per frame
+        self.life_updates = FrameBatcher(self, self.apply_life_updates)
+        self.controller.bus.subscribe(
+            LifeChanged, lambda event: self.life_updates.push(event.player_num, event, merge=coalesce))
+        self.controller.bus.subscribe(LifeReset, self.on_life_reset)
 
-        self.build_ui()
+        # Every life change goes to an on-disk journal, so a crash doesn't lose the game
+        self.journal = self.open_journal()
 
-        # Key bindings for keyboard control
-        self.master.bind("<Up>", lambda e: self.increment())
-        self.master.bind("<Down>", lambda e: self.decrement())
-        self.master.bind("<Return>", lambda e: self.confirm_change())
+        # Life counters (created with the main screen)
+        self.life_counters = {}
+        self.animator = get_animator(master)
+
+        # Screens are built once and switched with pack_forget / pack
+        self.screens = ScreenManager(self)
+        self.screens.register("main", self.build_ui)
+        self.screens.register("settings", self.build_settings_screen)
+        self.change_screen("main")
+        self.bind_keys()
+
+    @property
+    def settings(self):
+        """Read-only view of the current MTG settings."""
+        return self.master.config_data["mtg"]
 
     # ----------------------------
     # UI Setup
     # ----------------------------
-    def build_ui(self):
+    def build_ui(self, screen):
         # ----------------------------
         # Top Bar
         # ----------------------------
-        top_bar = ctk.CTkFrame(self, fg_color="transparent")
+        top_bar = ctk.CTkFrame(screen, fg_color="transparent")
         top_bar.pack(fill="x", side="top", pady=(10, 0), padx=5)
         top_bar.grid_columnconfigure(0, weight=1)  # left spacer
         top_bar.grid_columnconfigure(1, weight=3)  # title area
@@ -81,31 +98,40 @@ class MTGFrame(ctk.CTkFrame):
             width=40,
             height=40,
             corner_radius=8,
-            command=lambda: self.change_screen(self.show_settings_screen)
+            command=lambda: self.change_screen("settings")
         )
         settings_button.grid(row=0, column=2, sticky="e", padx=5)
 
         # ----------------------------
         # Reset Button
         # ----------------------------
-        reset_button = ctk.CTkButton(
-            self,
-            text="",
-            image=self.master.icons["reset"],
-            fg_color="transparent",
-            hover_color=self.master.colour_theme["button_hover"],
-            font=("Arial", 12),
-            width=40,
-            height=40,
-            corner_radius=8,
-            command=self.confirm_reset
-        )
-        reset_button.pack(side="top", expand=True)
+        # Undo and redo sit either side of it
+        actions = ctk.CTkFrame(screen, fg_color="transparent")
+        actions.pack(side="top", expand=True)
+
+        def action_button(command, image=None, text=""):
+            return ctk.CTkButton(
+                actions,
+                text=text,
+                image=image,
+                text_color=self.master.colour_theme["text_primary"],
+                fg_color="transparent",
+                hover_color=self.master.colour_theme["button_hover"],
+                font=("Arial", 20),
+                width=40,
+                height=40,
+                corner_radius=8,
+                command=command
+            )
+
+        action_button(self.controller.undo, text="↶").pack(side="left")
+        action_button(self.confirm_reset, image=self.master.icons["reset"]).pack(side="left")
+        action_button(self.controller.redo, text="↷").pack(side="left")
 
         # ----------------------------
         # Main Area (Players)
         # ----------------------------
-        main_area = ctk.CTkFrame(self, fg_color="transparent")
+        main_area = ctk.CTkFrame(screen, fg_color="transparent")
         main_area.pack(expand=True, fill="both", padx=20, pady=(10, 5))
 
         player_box_size = 230
@@ -123,15 +149,18 @@ class MTGFrame(ctk.CTkFrame):
         self.p1_frame.pack_propagate(False)
         self.p1_frame.bind("<Button-1>", lambda e: self.select_player(1))
 
-        ctk.CTkLabel(self.p1_frame,
+        p1_name = ctk.CTkLabel(self.p1_frame,
             text=self.game.player1.name,
             font=("Arial", 14, "bold"),
             text_color=self.master.colour_theme["text_primary"],
-            pady=6).pack(pady=(10, 5))
-        ctk.CTkLabel(self.p1_frame,
-            textvariable=self.p1_life,
+            pady=6)
+        p1_name.pack(pady=(10, 5))
+        self.life_counters[1] = LifeCounter(self.p1_frame,
+            value=self.game.player1.life,
             font=("Arial", 36),
-            text_color=self.master.colour_theme["text_primary"]).pack()
+            text_color=self.master.colour_theme["text_primary"],
+            max_scale=42 / 36)
+        self.life_counters[1].pack()
         self.p1_pending_label = ctk.CTkLabel(
             self.p1_frame,
             text="",
@@ -153,15 +182,18 @@ class MTGFrame(ctk.CTkFrame):
         self.p2_frame.pack_propagate(False)
         self.p2_frame.bind("<Button-1>", lambda e: self.select_player(2))
 
-        ctk.CTkLabel(self.p2_frame,
+        p2_name = ctk.CTkLabel(self.p2_frame,
             text=self.game.player2.name,
             font=("Arial", 14, "bold"),
             text_color=self.master.colour_theme["text_primary"],
-            pady=6).pack(pady=(10, 5))
-        ctk.CTkLabel(self.p2_frame,
-            textvariable=self.p2_life,
+            pady=6)
+        p2_name.pack(pady=(10, 5))
+        self.life_counters[2] = LifeCounter(self.p2_frame,
+            value=self.game.player2.life,
             font=("Arial", 36),
-            text_color=self.master.colour_theme["text_primary"]).pack()
+            text_color=self.master.colour_theme["text_primary"],
+            max_scale=42 / 36)
+        self.life_counters[2].pack()
         self.p2_pending_label = ctk.CTkLabel(self.p2_frame,
             text="",
             font=("Arial", 20, "bold"),
@@ -172,7 +204,7 @@ class MTGFrame(ctk.CTkFrame):
         # ----------------------------
         # Control Bar
         # ----------------------------
-        control_bar = ctk.CTkFrame(self, fg_color="transparent")
+        control_bar = ctk.CTkFrame(screen, fg_color="transparent")
         control_bar.pack(pady=(10, 10))
 
         # Inner centered layout
@@ -188,6 +220,13 @@ class MTGFrame(ctk.CTkFrame):
 
         ctk.CTkButton(center_group, text="", image=self.master.icons["plus"],
                     width=50, height=40, command=self.increment).grid(row=0, column=2, padx=10)
+
+        def refresh():
+            # Names can change from the settings screen
+            p1_name.configure(text=self.game.player1.name)
+            p2_name.configure(text=self.game.player2.name)
+
+        return refresh
         
     # ----------------------------
     # Core actions
@@ -295,93 +334,166 @@ class MTGFrame(ctk.CTkFrame):
     # Animation
     # ----------------------------
     def animate_life_change(self, player_num, old, new):
-        # Identify target player
-        if player_num == 1:
-            label_widget = self.p1_frame.winfo_children()[1]
-            life_var = self.p1_life
-        else:
-            label_widget = self.p2_frame.winfo_children()[1]
-            life_var = self.p2_life
+        counter = self.life_counters[player_num]
+
+        # A new change replaces a running effect; put the counter back to rest first
+        key = (self, "life", player_num)
+        if self.animator.is_running(key):
+            self.animator.cancel(key)
+            counter.reset_effects()
 
         # Detect change type
         is_damage = new < old
         is_heal = new > old
-        animation_duration = 150
+        phase = None
 
         # -----------------------------
         # DAMAGE: Flash text visibility
         # -----------------------------
         if is_damage:
             flashes = 10  # number of flickers (even number)
-            visible_color = self.master.colour_theme["text_primary"]
+            flash_ms = 70
+            swap_at = 475  # ms, when the new total appears
             invisible_color = self.master.colour_theme["container_bg"]  # blend into background
-            count = 0
-            total_duration = flashes // 2 * animation_duration
-
-            self.after(total_duration // 2 + 100, lambda: life_var.set(str(new)))
-
-            def flicker():
-                nonlocal count
-                if count < flashes:
+            duration = flashes * flash_ms
+
+            def flicker(progress):
+                nonlocal phase
+                elapsed = progress * duration
+                count = min(int(elapsed // flash_ms), flashes - 1)
+                if elapsed >= swap_at:
+                    counter.set(new)
+                if count != phase:
+                    phase = count
                     # Alternate between visible and invisible
-                    color = visible_color if count % 2 == 0 else invisible_color
-                    label_widget.configure(text_color=color)
-                    count += 1
-                    self.after(70, flicker)
-                else:
-                    # Final state — show new value
-                    label_widget.configure(text_color=visible_color, text=str(new))
+                    counter.set_color(None if count % 2 == 0 else invisible_color)
+
+            def finish():
+                # Final state — show new value
+                counter.set(new)
+                counter.set_color(None)
 
-            flicker()
+            self.animator.animate(key, duration, flicker, finish, owner=self)
 
         # -----------------------------
         # HEALING: Pulse font size
         # -----------------------------
         elif is_heal:
-            base_font = ("Arial", 36)
-            pulse_up = 42  # larger size
-            pulse_down = 36  # normal size
+            pulse_up = 42 / 36  # larger size
+            pulse_down = 1.0  # normal size
             pulses = 3
-            count = 0
-
-            total_duration = pulses * 2 * animation_duration
-
-            self.after(total_duration // 2, lambda: life_var.set(str(new)))
-
-            def pulse():
-                nonlocal count
-                if count < pulses * 2:
-                    new_size = pulse_up if count % 2 == 0 else pulse_down
-                    label_widget.configure(font=("Arial", new_size))
-                    count += 1
-                    self.after(120, pulse)
-                else:
-                    # Final update with new number at normal size
-                    label_widget.configure(font=base_font, text=str(new))
-
-            pulse()
+            pulse_ms = 120
+            swap_at = 450  # ms, when the new total appears
+            duration = pulses * 2 * pulse_ms
+
+            def pulse(progress):
+                nonlocal phase
+                elapsed = progress * duration
+                count = min(int(elapsed // pulse_ms), pulses * 2 - 1)
+                if elapsed >= swap_at:
+                    counter.set(new)
+                if count != phase:
+                    phase = count
+                    counter.set_scale(pulse_up if count % 2 == 0 else pulse_down)
+
+            def finish():
+                # Final update with new number at normal size
+                counter.set(new)
+                counter.set_scale(pulse_down)
+
+            self.animator.animate(key, duration, pulse, finish, owner=self)
 
         # -----------------------------
         # No change or neutral update
         # -----------------------------
         else:
-            label_widget.configure(text=str(new))
-    
+            counter.set(new)
+
+
+    # ----------------------------
+    # Game events
+    # ----------------------------
+    def on_life_reset(self, event):
+        # Changes still waiting for the frame are superseded by the reset
+        self.life_updates.clear()
+        self.life_updates.push("reset", event)
+
+    def apply_life_updates(self, updates):
+        """Apply one frame's worth of coalesced life events."""
+        if "reset" in updates:
+            self.update_display()
+        for player_num in (1, 2):
+            event = updates.get(player_num)
+            if event is not None and event.old != event.new:
+                self.animate_life_change(player_num, event.old, event.new)
 
     def update_display(self):
-        self.p1_life.set(self.game.player1.life)
-        self.p2_life.set(self.game.player2.life)
+        # Stop any flicker/pulse and put both counters back to rest
+        self.animator.cancel_owner(self)
+        for player_num, counter in self.life_counters.items():
+            counter.reset_effects()
+            counter.set(self.game.player1.life if player_num == 1 else self.game.player2.life)
 
     # ----------------------------
     # Helpers
     # ----------------------------
-    def clear_screen(self):
-        for widget in self.winfo_children():
-            widget.destroy()
-
-    def change_screen(self, function):
-        self.clear_screen()
-        function()
+    def change_screen(self, name, *args):
+        self.screens.show(name, *args)
+
+    def open_journal(self):
+        """Start this game's journal, offering to restore the last one if it was cut short."""
+        def resume(path):
+            if not messagebox.askyesno("Resume Game", "The last game didn't finish properly. Restore its life totals?"):
+                return False
+            journal.replay(path, self.game, lambda player_num, life: setattr(self.game.get_player(player_num), "life", life))
+            return True
+
+        header = journal.match_header("mtg", self.game.starting_life, (self.game.player1.name, self.game.player2.name))
+        try:
+            match_journal = journal.open_match(get_config_path("journals"), "mtg", header, resume)
+        except (OSError, RuntimeError) as e:
+            print(f"⚠️ Game journal unavailable: {e}")
+            return None
+        match_journal.attach(self.controller.bus)
+        return match_journal
+
+    def destroy(self):
+        if self.journal is not None:
+            self.journal.close()  # a clean end; not offered for recovery next time
+        super().destroy()
+
+    def bind_keys(self):
+        # Key bindings for keyboard control
+        self.master.bind("<Up>", lambda e: self.increment())
+        self.master.bind("<Down>", lambda e: self.decrement())
+        self.master.bind("<Return>", lambda e: self.confirm_change())
+        for key, action in UNDO_KEYS.items():
+            self.master.bind(key, lambda e, action=action: self.screens.current == "main" and action(self.controller))
+
+    def on_suspend(self):
+        """Called when the app goes back to the main menu; life totals are kept."""
+        for key in ("<Up>", "<Down>", "<Return>", *UNDO_KEYS):
+            self.master.unbind(key)
+
+    def on_resume(self):
+        """Called when the suspended game is shown again."""
+        self.bind_keys()
+        self.on_settings_changed({"mtg"})
+        if self.screens.current is None:
+            self.change_screen("main")
+
+    def on_settings_changed(self, sections):
+        """Apply settings written by another app instance without resetting the game."""
+        if "mtg" in sections:
+            self.game.starting_life = self.settings["starting_life"]
+            self.game.player1.name = self.settings["player1_name"]
+            self.game.player2.name = self.settings["player2_name"]
+
+        if "global" in sections:
+            self.clear_selection()
+            self.screens.invalidate()
+        else:
+            self.screens.refresh()
 
     def clear_selection(self):
         self.selected_player = None
@@ -391,11 +503,11 @@ class MTGFrame(ctk.CTkFrame):
         self.p2_pending_label.configure(text="")
         self.temp_value = ctk.IntVar(value=0)
 
-    def show_settings_screen(self):
+    def build_settings_screen(self, screen):
         # ----------------------------
         # Top Bar
         # ----------------------------
-        top_bar = ctk.CTkFrame(self, fg_color="transparent")
+        top_bar = ctk.CTkFrame(screen, fg_color="transparent")
         top_bar.pack(fill="x", side="top", pady=(10, 0), padx=5)
         top_bar.grid_columnconfigure(0, weight=1)
         top_bar.grid_columnconfigure(1, weight=3)
@@ -412,7 +524,7 @@ class MTGFrame(ctk.CTkFrame):
             width=40,
             height=40,
             corner_radius=8,
-            command=lambda: self.change_screen(self.build_ui)
+            command=lambda: self.change_screen("main")
         )
         back_button.grid(row=0, column=0, sticky="w", padx=5)
 
@@ -432,8 +544,9 @@ class MTGFrame(ctk.CTkFrame):
         # ----------------------------
         # Settings Content 
         # ----------------------------
-        content = ctk.CTkFrame(self, fg_color="transparent")
+        content = ctk.CTkFrame(screen, fg_color="transparent")
         content.pack(expand=True, fill="both", padx=20, pady=12)
+        controls = {}
 
         def add_row(label_text, widget_factory, stretch_right=False):
             row = ctk.CTkFrame(content, fg_color="transparent")
@@ -467,10 +580,9 @@ class MTGFrame(ctk.CTkFrame):
             switch = ctk.CTkSwitch(parent, text="")
             def on_toggle():
                 # toggle app theme using your existing API
-                self.master.toggle_theme(switch, lambda: self.change_screen(self.show_settings_screen))
+                self.master.toggle_theme(switch, self.screens.invalidate)
             switch.configure(command=on_toggle)
-            if self.master.config_data["global"]["selected_theme"] == "dark":
-                switch.select()
+            controls["theme_switch"] = switch
             return switch
 
         add_row("Appearance (Dark Mode)", make_theme_switch)
@@ -483,20 +595,18 @@ class MTGFrame(ctk.CTkFrame):
                 to=1,
                 number_of_steps=100,
             )
-            slider.set(self.master.config_data["global"].get("volume", 1.0))
 
             # Save current value on release
             def on_release(event):
                 value = round(slider.get(), 2)
                 self.master.set_volume(value)  # save to config + update global volume
-                if hasattr(self, "sfx") and hasattr(self.sfx, "sounds"):
-                    # Apply new volume to all loaded sounds
-                    for sound in self.sfx.sounds.values():
-                        sound.set_volume(value)
+                if hasattr(self, "sfx"):
+                    self.sfx.set_volume(value)  # apply to all loaded sounds
 
             # Bind left mouse release to commit
             slider.bind("<ButtonRelease-1>", on_release)
 
+            controls["volume_slider"] = slider
             return slider
         add_row("Sound Volume", make_volume_slider, stretch_right=True)
 
@@ -520,6 +630,16 @@ class MTGFrame(ctk.CTkFrame):
             width=90,
             command= self.open_starting_life_editor
         ))
+
+        def refresh():
+            # Sync controls with the current config each time the screen is shown
+            if self.master.config_data["global"]["selected_theme"] == "dark":
+                controls["theme_switch"].select()
+            else:
+                controls["theme_switch"].deselect()
+            controls["volume_slider"].set(self.master.config_data["global"].get("volume", 1.0))
+
+        return refresh
     
     # ----------------------------
     # Player editing popups
@@ -550,11 +670,9 @@ class MTGFrame(ctk.CTkFrame):
             name2 = p2_entry.get().strip() or "Player 2"
             self.game.player1.name = name1
             self.game.player2.name = name2
-            self.settings["player1_name"] = name1
-            self.settings["player2_name"] = name2
 
             # Save and refresh
-            save_settings({"mtg": self.settings})
+            save_settings({"mtg": {"player1_name": name1, "player2_name": name2}})
             popup.destroy()
 
         ctk.CTkButton(popup, text="Save", command=save_names).pack(pady=15)
@@ -589,18 +707,12 @@ class MTGFrame(ctk.CTkFrame):
                 if new_life <= 0:
                     raise ValueError
 
-                # Update game state
+                # Update game state; the reset event redraws the counters and is journaled
                 self.game.starting_life = new_life
-                self.game.reset()
-
-                # Update display variables (labels)
-                self.p1_life.set(str(self.game.player1.life))
-                self.p2_life.set(str(self.game.player2.life))
+                self.controller.reset_life()
 
                 # Save to config under "mtg"
-                self.settings["starting_life"] = new_life
-                from utils.helpers import save_settings
-                save_settings({"mtg": self.settings})
+                save_settings({"mtg": {"starting_life": new_life}})
 
                 # Optional: play refresh sound if available
                 if hasattr(self, "sfx"):
@@ -1,4 +1,11 @@
 # Marks this directory as a package
 
-from .gui import YuGiOhFrame
-from .game import Game
\ No newline at end of file
+from .game import Game
+
+
+def __getattr__(name):
+    # The GUI pulls in customtkinter and pygame; only import it when asked for
+    if name == "YuGiOhFrame":
+        from .gui import YuGiOhFrame
+        return YuGiOhFrame
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
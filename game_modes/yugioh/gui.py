@@ -1,30 +1,31 @@
 import customtkinter as ctk
 from tkinter import messagebox
-from utils.helpers import save_settings
+from utils.helpers import save_settings, get_config_path, UNDO_KEYS
+from utils.screens import ScreenManager
+from utils.animation import get_animator, FrameBatcher
+from utils.counter import LifeCounter
 from game_modes.yugioh.game import Game
 from game_modes.yugioh.logic import LifePointController
-from game_modes.yugioh.theme import SoundThemeManager
+from core.events import LifeChanged, LifeReset, coalesce
+from core import journal
+from game_modes.yugioh.theme import SoundThemeManager, THEME_MAP, prefetch_themes
+from utils.sound_packs import pack_themes
 
 
 class YuGiOhFrame(ctk.CTkFrame):
+    LP_ANIMATION_MS = 1200
+    LP_ANIMATION_DELAY_MS = 100  # the counting sound starts straight away, the digits after this
+
     def __init__(self, master, config_data):
         super().__init__(master)
         self.master = master
-        self.settings = config_data["yugioh"]
         self.current_overrides = self.settings.get("sound_paths", {})
         self.current_theme = self.settings["theme"]
         self.messagebox = messagebox
 
-        # Theme map (for sound folders)
-        self.theme_map = {
-            "Basic": "basic",
-            "Duel Monsters": "dm",
-            "GX": "gx",
-            "5DS": "5ds",
-            "Zexal": "zexal",
-            "Arc-V": "arcv",
-            "Vrains": "vrains",
-        }
+        # Theme map (for sound folders), plus any user sound packs
+        self.theme_map = dict(THEME_MAP)
+        self.theme_map.update(pack_themes(taken=set(self.theme_map) | {"Custom"}))
 
         # Game setup
         self.game = Game(starting_lp=self.settings["starting_lp"])
@@ -32,26 +33,54 @@ class YuGiOhFrame(ctk.CTkFrame):
         self.game.player2.name = self.settings["player2_name"]
 
         # Sound + LP controller
-        self.sfx = SoundThemeManager(config_data, self.theme_map)
-        self.lp_controller = LifePointController(self)
-
-        # StringVars for UI
-        self.lp1_var = ctk.StringVar(value=str(self.game.player1.lp))
-        self.lp2_var = ctk.StringVar(value=str(self.game.player2.lp))
+        self.sfx = SoundThemeManager(self.theme_map, counting_ms=self.LP_ANIMATION_DELAY_MS + self.LP_ANIMATION_MS)
+        if self.sfx.pending_transcode:
+            # A pack's clips aren't cached yet; play Basic until the worker has transcoded them
+            self.sfx.load_theme_async(self.current_theme, self)
+        self.lp_controller = LifePointController(self.game)
+
+        # Game changes arrive as events and reach the screen at most once per frame
+        self.lp_updates = FrameBatcher(self, self.apply_lp_updates)
+        self.lp_controller.bus.subscribe(
+            LifeChanged, lambda event: self.lp_updates.push(event.player_num, event, merge=coalesce))
+        self.lp_controller.bus.subscribe(LifeReset, self.on_lp_reset)
+
+        # Every LP change goes to an on-disk journal, so a crash doesn't lose the duel
+        self.journal = self.open_journal()
+
+        # LP counters (created with the main screen)
+        self.lp_counters = {}
+        self.lp_shown = {1: self.game.player1.lp, 2: self.game.player2.lp}  # value on screen mid-animation
+        self.animator = get_animator(master)
+
+        # Screens are built once and switched with pack_forget / pack
+        self.screens = ScreenManager(self)
+        self.screens.register("main", self.build_main_screen)
+        self.screens.register("settings", self.build_settings_screen)
+        self.screens.register("calc", self.build_calc_screen)
 
         # Build main screen
-        self.show_main_screen()
+        self.change_screen("main")
+        self.bind_keys()
         self.sfx.play_sound("Refresh")
 
+        # 🔊 Warm up the other sound themes once the duel screen is idle
+        self.after_idle(prefetch_themes)
+
+
+    @property
+    def settings(self):
+        """Read-only view of the current Yu-Gi-Oh settings."""
+        return self.master.config_data["yugioh"]
 
     # ----------------------------
     # Main game screen
     # ----------------------------
-    def show_main_screen(self):
+    def build_main_screen(self, screen):
         # ----------------------------
         # Top Bar
         # ----------------------------
-        top_bar = ctk.CTkFrame(self, fg_color="transparent")
+        top_bar = ctk.CTkFrame(screen, fg_color="transparent")
         top_bar.pack(fill="x", side="top", pady=(10, 0), padx=5)
         top_bar.grid_columnconfigure(0, weight=1)  # left spacer
         top_bar.grid_columnconfigure(1, weight=3)  # title area
@@ -91,59 +120,79 @@ class YuGiOhFrame(ctk.CTkFrame):
             width=40,
             height=40,
             corner_radius=8,
-            command=lambda: self.change_screen(self.show_settings_screen)
+            command=lambda: self.change_screen("settings")
         )
         settings_button.grid(row=0, column=2, sticky="e", padx=5)
 
         # ----------------------------
         # Reset Button
         # ----------------------------
-        reset_button = ctk.CTkButton(
-            self,
-            text="",
-            image=self.master.icons["reset"],
-            fg_color="transparent",
-            hover_color=self.master.colour_theme["button_hover"],
-            font=("Arial", 12),
-            width=40,
-            height=40,
-            corner_radius=8,
-            command=self.lp_controller.reset_all_lp
-        )
-        reset_button.pack(side="top")
+        # Undo and redo sit either side of it
+        actions = ctk.CTkFrame(screen, fg_color="transparent")
+        actions.pack(side="top")
+
+        def action_button(command, image=None, text=""):
+            return ctk.CTkButton(
+                actions,
+                text=text,
+                image=image,
+                text_color=self.master.colour_theme["text_primary"],
+                fg_color="transparent",
+                hover_color=self.master.colour_theme["button_hover"],
+                font=("Arial", 20),
+                width=40,
+                height=40,
+                corner_radius=8,
+                command=command
+            )
+
+        action_button(self.lp_controller.undo, text="↶").pack(side="left")
+        action_button(self.confirm_reset, image=self.master.icons["reset"]).pack(side="left")
+        action_button(self.lp_controller.redo, text="↷").pack(side="left")
 
         # Player 1
-        ctk.CTkLabel(self, text=self.game.player1.name, font=("Arial", 14, "bold"), pady=6).pack(pady=(10, 0))
-        ctk.CTkLabel(self, textvariable=self.lp1_var, font=("Arial", 20)).pack()
-        p1_frame = ctk.CTkFrame(self)
+        p1_name = ctk.CTkLabel(screen, text=self.game.player1.name, font=("Arial", 14, "bold"), pady=6)
+        p1_name.pack(pady=(10, 0))
+        self.lp_counters[1] = LifeCounter(screen, value=self.lp_shown[1], font=("Arial", 20))
+        self.lp_counters[1].pack()
+        p1_frame = ctk.CTkFrame(screen)
         p1_frame.pack(pady=5)
         ctk.CTkButton(p1_frame, text="Damage -",
-                      command=lambda: self.change_screen(lambda: self.show_calc_screen(1, "damage"))).pack(side="left", padx=2)
+                      command=lambda: self.change_screen("calc", 1, "damage")).pack(side="left", padx=2)
         ctk.CTkButton(p1_frame, text="Heal +",
-                      command=lambda: self.change_screen(lambda: self.show_calc_screen(1, "heal"))).pack(side="left", padx=2)
+                      command=lambda: self.change_screen("calc", 1, "heal")).pack(side="left", padx=2)
         ctk.CTkButton(p1_frame, text="Halve",
                       command=lambda: self.lp_controller.halve_lp(1)).pack(side="left", padx=2)
 
         # Player 2
-        ctk.CTkLabel(self, text=self.game.player2.name, font=("Arial", 14, "bold"), pady=6).pack(pady=(15, 0))
-        ctk.CTkLabel(self, textvariable=self.lp2_var, font=("Arial", 20)).pack()
-        p2_frame = ctk.CTkFrame(self)
+        p2_name = ctk.CTkLabel(screen, text=self.game.player2.name, font=("Arial", 14, "bold"), pady=6)
+        p2_name.pack(pady=(15, 0))
+        self.lp_counters[2] = LifeCounter(screen, value=self.lp_shown[2], font=("Arial", 20))
+        self.lp_counters[2].pack()
+        p2_frame = ctk.CTkFrame(screen)
         p2_frame.pack(pady=5)
         ctk.CTkButton(p2_frame, text="Damage -",
-                      command=lambda: self.change_screen(lambda: self.show_calc_screen(2, "damage"))).pack(side="left", padx=2)
+                      command=lambda: self.change_screen("calc", 2, "damage")).pack(side="left", padx=2)
         ctk.CTkButton(p2_frame, text="Heal +",
-                      command=lambda: self.change_screen(lambda: self.show_calc_screen(2, "heal"))).pack(side="left", padx=2)
+                      command=lambda: self.change_screen("calc", 2, "heal")).pack(side="left", padx=2)
         ctk.CTkButton(p2_frame, text="Halve",
                       command=lambda: self.lp_controller.halve_lp(2)).pack(side="left", padx=2)
 
+        def refresh():
+            # Names can change from the settings screen
+            p1_name.configure(text=self.game.player1.name)
+            p2_name.configure(text=self.game.player2.name)
+
+        return refresh
+
     # ----------------------------
     # Settings screen 
     # ----------------------------
-    def show_settings_screen(self):
+    def build_settings_screen(self, screen):
         # ----------------------------
         # Top Bar
         # ----------------------------
-        top_bar = ctk.CTkFrame(self, fg_color="transparent")
+        top_bar = ctk.CTkFrame(screen, fg_color="transparent")
         top_bar.pack(fill="x", side="top", pady=(10, 0), padx=5)
         top_bar.grid_columnconfigure(0, weight=1)  # left spacer
         top_bar.grid_columnconfigure(1, weight=3)  # title area
@@ -161,7 +210,7 @@ class YuGiOhFrame(ctk.CTkFrame):
             width=40,
             height=40,
             corner_radius=8,
-            command=lambda: self.change_screen(self.show_main_screen)
+            command=lambda: self.change_screen("main")
         )
         back_button.grid(row=0, column=0, sticky="w", padx=5)
 
@@ -181,8 +230,9 @@ class YuGiOhFrame(ctk.CTkFrame):
         # ----------------------------
         # Settings Content (rows)
         # ----------------------------
-        content = ctk.CTkFrame(self, fg_color="transparent")
+        content = ctk.CTkFrame(screen, fg_color="transparent")
         content.pack(expand=True, fill="both", padx=20, pady=12)
+        controls = {}
 
         def add_row(label_text, widget_factory, stretch_right=False):
             """Adds a new row (label + widget) using pack layout."""
@@ -214,12 +264,10 @@ class YuGiOhFrame(ctk.CTkFrame):
 
             def on_toggle():
                 # toggle app theme using your existing API
-                self.master.toggle_theme(switch, lambda: self.change_screen(self.show_settings_screen))
+                self.master.toggle_theme(switch, self.screens.invalidate)
 
             switch.configure(command=on_toggle)
-
-            if self.master.config_data["global"]["selected_theme"] == "dark":
-                switch.select()
+            controls["theme_switch"] = switch
             return switch
 
         add_row("Appearance (Dark Mode)", make_theme_switch)
@@ -232,20 +280,17 @@ class YuGiOhFrame(ctk.CTkFrame):
                 to=1,
                 number_of_steps=100,
             )
-            slider.set(self.master.config_data["global"].get("volume", 1.0))
 
             # Save current value on release
             def on_release(event):
                 value = round(slider.get(), 2)
                 self.master.set_volume(value)  # save to config + update global volume
-                if hasattr(self, "sfx") and hasattr(self.sfx, "sounds"):
-                    # Apply new volume to all loaded sounds
-                    for sound in self.sfx.sounds.values():
-                        sound.set_volume(value)
+                self.sfx.set_volume(value)  # apply to all loaded sounds
 
             # Bind left mouse release to commit
             slider.bind("<ButtonRelease-1>", on_release)
 
+            controls["volume_slider"] = slider
             return slider
 
         add_row("Sound Volume", make_volume_slider, stretch_right=True)
@@ -287,24 +332,35 @@ class YuGiOhFrame(ctk.CTkFrame):
 
         add_row("Sound Theme", make_sound_theme_row)
 
+        def refresh():
+            # Sync controls with the current config each time the screen is shown
+            if self.master.config_data["global"]["selected_theme"] == "dark":
+                controls["theme_switch"].select()
+            else:
+                controls["theme_switch"].deselect()
+            controls["volume_slider"].set(self.master.config_data["global"].get("volume", 1.0))
+            self.theme_var.set(self.current_theme)
+
+        return refresh
+
     # ----------------------------
     # Settings handlers
     # ----------------------------
     def on_theme_change(self, selected):
-        self.sfx.sounds = self.sfx.load_theme(selected)
         self.current_theme = selected
-        self.settings["theme"] = selected
+        changes = {"theme": selected}
 
         if selected != "Custom":
-            self.settings["sound_paths"] = {
+            changes["sound_paths"] = {
                 "LP_counting": self.theme_map[selected],
                 "LP_updated": self.theme_map[selected],
                 "LP_empty": self.theme_map[selected],
                 "Refresh": self.theme_map[selected]
             }
 
-        save_settings({"yugioh": self.settings})
-        self.sfx.play_sound("Refresh")
+        save_settings({"yugioh": changes})
+        self.current_overrides = changes.get("sound_paths", self.current_overrides)
+        self.sfx.load_theme_async(selected, self, on_ready=lambda: self.sfx.play_sound("Refresh"))
 
 
     # ----------------------------
@@ -336,11 +392,9 @@ class YuGiOhFrame(ctk.CTkFrame):
             name2 = p2_entry.get().strip() or "Player 2"
             self.game.player1.name = name1
             self.game.player2.name = name2
-            self.settings["player1_name"] = name1
-            self.settings["player2_name"] = name2
 
             # Save and refresh
-            save_settings({"yugioh": self.settings})
+            save_settings({"yugioh": {"player1_name": name1, "player2_name": name2}})
             popup.destroy()
 
         ctk.CTkButton(popup, text="Save", command=save_names).pack(pady=15)
@@ -367,14 +421,9 @@ class YuGiOhFrame(ctk.CTkFrame):
                 if new_lp <= 0:
                     raise ValueError
 
-                self.game.starting_lp = new_lp
-                self.game.player1.reset_lp(new_lp)
-                self.game.player2.reset_lp(new_lp)
-                self.settings["starting_lp"] = new_lp
+                self.lp_controller.reset_all_lp(new_lp)  # journaled like any other reset
 
-                save_settings({"yugioh": self.settings})
-                self.lp1_var.set(str(new_lp))
-                self.lp2_var.set(str(new_lp))
+                save_settings({"yugioh": {"starting_lp": new_lp}})
 
                 popup.destroy()
             except ValueError:
@@ -444,18 +493,15 @@ class YuGiOhFrame(ctk.CTkFrame):
                 new_sound_paths[key] = folder_name
 
             # Update config.json
-            self.settings["theme"] = "Custom"
-            self.settings["sound_paths"] = new_sound_paths
             self.current_overrides = new_sound_paths
             self.current_theme = "Custom"
 
-            save_settings({"yugioh": self.settings})
-            self.sfx.sounds = self.sfx.load_theme("Custom")
+            save_settings({"yugioh": {"theme": "Custom", "sound_paths": new_sound_paths}})
+            self.sfx.load_theme_async("Custom", self, on_ready=lambda: self.sfx.play_sound("Refresh"))
 
             if hasattr(self, 'theme_var'):
                 self.theme_var.set("Custom")
 
-            self.sfx.play_sound("Refresh")
             popup.destroy()
 
         ctk.CTkButton(
@@ -467,21 +513,19 @@ class YuGiOhFrame(ctk.CTkFrame):
             corner_radius=10
         ).pack(pady=20)
 
-    def show_calc_screen(self, player_num, action):
-        player = self.game.player1 if player_num == 1 else self.game.player2
+    def build_calc_screen(self, screen):
+        target = {"player_num": 1, "action": "damage"}
 
-        ctk.CTkLabel(
-            self,
-            text=f"{player.name} - {action.capitalize()}",
-            font=("Arial", 16, "bold")
-        ).pack(pady=20)
+        title_label = ctk.CTkLabel(screen, text="", font=("Arial", 16, "bold"))
+        title_label.pack(pady=20)
 
-        ctk.CTkLabel(self, text=f"Current LP: {player.lp}", font=("Arial", 12)).pack(pady=(0, 10))
-        ctk.CTkLabel(self, text=f"Enter value to {action}:").pack(pady=5)
+        current_label = ctk.CTkLabel(screen, text="", font=("Arial", 12))
+        current_label.pack(pady=(0, 10))
+        prompt_label = ctk.CTkLabel(screen, text="")
+        prompt_label.pack(pady=5)
 
-        entry = ctk.CTkEntry(self)
+        entry = ctk.CTkEntry(screen)
         entry.pack()
-        entry.focus_set()
 
         # ----------------------------
         # Button actions
@@ -489,24 +533,25 @@ class YuGiOhFrame(ctk.CTkFrame):
         def confirm(event=None):
             try:
                 value = int(entry.get())
-                if action == "damage":
-                    self.lp_controller.change_lp(player_num, -value)
-                elif action == "heal":
-                    self.lp_controller.change_lp(player_num, value)
-                self.change_screen(self.show_main_screen)
+                if target["action"] == "damage":
+                    self.lp_controller.change_lp(target["player_num"], -value)
+                elif target["action"] == "heal":
+                    self.lp_controller.change_lp(target["player_num"], value)
+                self.change_screen("main")
             except ValueError:
                 entry.delete(0, ctk.END)
                 entry.insert(0, "Invalid")
             return "break"
 
         def cancel(event=None):
-            self.change_screen(self.show_main_screen)
+            if self.screens.current == "calc":
+                self.change_screen("main")
 
         # ----------------------------
         # Buttons
         # ----------------------------
-        ctk.CTkButton(self, text="Confirm", command=confirm).pack(pady=10)
-        ctk.CTkButton(self, text="Cancel", command=cancel).pack()
+        ctk.CTkButton(screen, text="Confirm", command=confirm).pack(pady=10)
+        ctk.CTkButton(screen, text="Cancel", command=cancel).pack()
 
         # ----------------------------
         # Key bindings
@@ -516,61 +561,150 @@ class YuGiOhFrame(ctk.CTkFrame):
         entry.bind("<Escape>", cancel)   # ✅ also bind to entry
         self.bind("<Escape>", cancel)    # ✅ frame-level backup
 
+        def refresh(player_num, action):
+            player = self.game.player1 if player_num == 1 else self.game.player2
+            target["player_num"] = player_num
+            target["action"] = action
+
+            title_label.configure(text=f"{player.name} - {action.capitalize()}")
+            current_label.configure(text=f"Current LP: {player.lp}")
+            prompt_label.configure(text=f"Enter value to {action}:")
+            entry.delete(0, ctk.END)
+            entry.focus_set()
+
+        return refresh
+
 
     # ----------------------------
     # Helpers
     # ----------------------------
-    def clear_screen(self):
-        for widget in self.winfo_children():
-            widget.destroy()
-
-    def change_screen(self, function):
-        self.clear_screen()
-        function()
+    def change_screen(self, name, *args):
+        self.screens.show(name, *args)
+
+    def open_journal(self):
+        """Start this duel's journal, offering to restore the last one if it was cut short."""
+        def resume(path):
+            if not self.messagebox.askyesno("Resume Duel", "The last duel didn't finish properly. Restore its Life Points?"):
+                return False
+            journal.replay(path, self.game, lambda player_num, lp: setattr(self.game.get_player(player_num), "lp", lp))
+            return True
+
+        header = journal.match_header("yugioh", self.game.starting_lp, (self.game.player1.name, self.game.player2.name))
+        try:
+            match_journal = journal.open_match(get_config_path("journals"), "yugioh", header, resume)
+        except (OSError, RuntimeError) as e:
+            print(f"⚠️ Duel journal unavailable: {e}")
+            return None
+        match_journal.attach(self.lp_controller.bus)
+        return match_journal
+
+    def destroy(self):
+        if self.journal is not None:
+            self.journal.close()  # a clean end; not offered for recovery next time
+        super().destroy()
+
+    def bind_keys(self):
+        # Undo / redo; only on the duel screen so typing in the calculator isn't affected
+        for key, action in UNDO_KEYS.items():
+            self.master.bind(key, lambda e, action=action: self.screens.current == "main" and action(self.lp_controller))
+
+    def on_suspend(self):
+        """Called when the app goes back to the main menu; the duel is kept."""
+        self.sfx.stop_all()
+        for key in UNDO_KEYS:
+            self.master.unbind(key)
+
+    def on_resume(self):
+        """Called when the suspended duel is shown again."""
+        self.bind_keys()
+        self.sfx.set_volume(self.master.config_data["global"]["volume"])  # may have changed in the main menu
+        self.on_settings_changed({"yugioh"})
+        if self.screens.current is None:
+            self.change_screen("main")
+
+    def on_settings_changed(self, sections):
+        """Apply settings written by another app instance without resetting the duel."""
+        if "yugioh" in sections:
+            self.game.starting_lp = self.settings["starting_lp"]
+            self.game.player1.name = self.settings["player1_name"]
+            self.game.player2.name = self.settings["player2_name"]
+
+            sound_paths = dict(self.settings["sound_paths"])
+            if self.settings["theme"] != self.current_theme or sound_paths != dict(self.current_overrides):
+                self.current_theme = self.settings["theme"]
+                self.current_overrides = sound_paths
+                self.sfx.load_theme_async(self.current_theme, self)
+                if hasattr(self, "theme_var"):
+                    self.theme_var.set(self.current_theme)
+
+        # Rebuild for new theme colours, or just refresh names; never interrupt a calc entry
+        if self.screens.current == "calc":
+            return
+        if "global" in sections:
+            self.screens.invalidate()
+        else:
+            self.screens.refresh()
 
     # ----------------------------
     # LP Animation
     # ----------------------------
-    def animate_lp_change(self, player_num: int, old_value: int, new_value: int, duration: int = 1200):
-        """Smoothly animate LP change with sound."""
-        steps = 60
-        delay = duration // steps
-        delta = (new_value - old_value) / steps
-        current = old_value
-        count = 0
-
-        # Play counting sound
-        self.sfx.play_sound("LP_counting")
-
-        def update_step():
-            nonlocal current, count
-            if count < steps:
-                current += delta
-                display_value = int(round(current))
-                if player_num == 1:
-                    self.lp1_var.set(str(display_value))
-                else:
-                    self.lp2_var.set(str(display_value))
-                count += 1
-                self.after(delay, update_step)
+    def animate_lp_change(self, player_num: int, old_value: int, new_value: int, duration: int = LP_ANIMATION_MS):
+        """Smoothly animate LP change with sound.
+
+        A change that arrives while the same player is still counting retargets
+        the running animation from the value currently on screen.
+        """
+        key = (self, "lp", player_num)
+        start_value = self.lp_shown[player_num] if self.animator.is_running(key) else old_value
+
+        # Play the counting sound, fitted to end on the animation's last frame
+        self.sfx.play_sound("LP_counting", duration_ms=self.LP_ANIMATION_DELAY_MS + duration,
+                            delta=new_value - start_value, player_num=player_num)
+
+        def step(progress):
+            current = start_value + (new_value - start_value) * progress
+            self.lp_shown[player_num] = current
+            # Only the digits that changed are redrawn
+            self.lp_counters[player_num].set(current)
+
+        def finish():
+            self.lp_counters[player_num].set(new_value)
+
+            # Play ending sound
+            if new_value == 0:
+                self.sfx.play_sound("LP_empty")
             else:
-                # Final update
-                if player_num == 1:
-                    self.lp1_var.set(str(new_value))
-                else:
-                    self.lp2_var.set(str(new_value))
-
-                # Play ending sound
-                if new_value == 0:
-                    self.sfx.play_sound("LP_empty")
-                else:
-                    self.sfx.play_sound("LP_updated")
-
-        # Start animation
-        self.after(100, update_step)
-    
+                self.sfx.play_sound("LP_updated", player_num=player_num)  # leaves the other count running
+
+        self.lp_shown[player_num] = start_value
+        self.animator.animate(key, duration, step, finish, owner=self, delay_ms=self.LP_ANIMATION_DELAY_MS)
+
+    # ----------------------------
+    # Game events
+    # ----------------------------
+    def on_lp_reset(self, event):
+        # Changes still waiting for the frame are superseded by the reset
+        self.lp_updates.clear()
+        self.lp_updates.push("reset", event)
+
+    def apply_lp_updates(self, updates):
+        """Apply one frame's worth of coalesced LP events."""
+        if "reset" in updates:
+            self.update_display()
+            self.sfx.play_sound("Refresh")
+        for player_num in (1, 2):
+            event = updates.get(player_num)
+            if event is not None and event.old != event.new:
+                self.animate_lp_change(player_num, event.old, event.new)
+
+    def confirm_reset(self):
+        if self.messagebox.askyesno("Confirm Reset", f"Reset both players' Life Points to {self.game.starting_lp}?"):
+            self.lp_controller.reset_all_lp()
+
     def update_display(self):
         """Update both players' LP display."""
-        self.lp1_var.set(str(self.game.player1.lp))
-        self.lp2_var.set(str(self.game.player2.lp))
+        self.animator.cancel_owner(self)
+        self.lp_shown = {1: self.game.player1.lp, 2: self.game.player2.lp}
+        for player_num, counter in self.lp_counters.items():
+            counter.set(self.lp_shown[player_num])
 
@@ -1,52 +1,147 @@
-import os
-import pygame
-from utils import sound
-from utils.helpers import resource_path
+from utils import loudness, sound, sound_fit, sound_packs, synth
+from utils.audio_engine import get_engine
+from utils.helpers import call_when_done, get_settings_store
+
+# Display name -> sound folder under assets/sounds/yugioh
+THEME_MAP = {
+    "Basic": "basic",
+    "Duel Monsters": "dm",
+    "GX": "gx",
+    "5DS": "5ds",
+    "Zexal": "zexal",
+    "Arc-V": "arcv",
+    "Vrains": "vrains",
+}
+BUILT_IN_FOLDERS = list(THEME_MAP.values())  # folders with WAVs under assets/sounds/yugioh
+
+if synth.available():
+    # Generated at load time; the folder name doubles as a marker for Custom themes
+    THEME_MAP["Synth"] = synth.SYNTH_FOLDER
+
+SOUND_FILES = ["LP_counting.wav", "LP_updated.wav", "LP_empty.wav", "Refresh.wav"]
+
+
+def prefetch_themes():
+    """Decode every built-in theme in the background so theme switches are instant."""
+    sound.ensure_mixer()
+    return sound.prefetch_sounds("yugioh", BUILT_IN_FOLDERS, SOUND_FILES)
+
 
 class SoundThemeManager:
     """Handles sound effects and theme loading for Yu-Gi-Oh."""
 
-    def __init__(self, settings, theme_map):
-        self.settings = settings
+    def __init__(self, theme_map, counting_ms=None):
         self.theme_map = theme_map
-        pygame.mixer.init()
-        self.sounds = self.load_theme(settings["yugioh"]["theme"])
+        self.counting_ms = counting_ms  # LP_counting is fitted to this length when loaded
+        self.pending_transcode = False  # True when pack clips not yet in the cache were stood in for by Basic
+        self.sounds = self.load_theme(self.settings["yugioh"]["theme"], transcode=False)
+        self._pending_load = None
+
+    @property
+    def settings(self):
+        """Current read-only Config (volume, Custom sound paths)."""
+        return get_settings_store().config
+
+    def load_sound_effect(self, file_name: str, folder_name: str, transcode=True):
+        """Return the pygame sound object for a .wav file, decoding it only on first use.
 
-    def load_sound_effect(self, file_name: str, folder_name: str):
-        """Load a single .wav file and return a pygame sound object."""
-        path = resource_path(os.path.join('assets', 'sounds', 'yugioh', folder_name, file_name))
+        Sound-pack clips are transcoded on first use. With transcode=False an
+        uncached pack clip is replaced by the Basic one and pending_transcode set.
+        """
         try:
-            sound = pygame.mixer.Sound(path)
-            sound.set_volume(self.settings["global"]["volume"])
-            return sound
+            sound.ensure_mixer()  # reopens the device if it was closed while idle
+            if folder_name == synth.SYNTH_FOLDER:
+                snd = synth.load(file_name.rsplit(".", 1)[0])
+                if snd is None:
+                    raise LookupError("synth theme unavailable (numpy not installed)")
+            elif folder_name.startswith(sound_packs.PACK_PREFIX):
+                pack = sound_packs.get_pack(folder_name)
+                if pack is None:
+                    raise LookupError("sound pack not installed")
+                snd = sound_packs.load_clip(pack, file_name.rsplit(".", 1)[0], transcode=transcode)
+                if snd is None:
+                    self.pending_transcode = self.pending_transcode or not transcode
+                    return self.load_sound_effect(file_name, "basic")
+            else:
+                snd = sound.get_cached_sound("yugioh", folder_name, file_name)
+            snd.set_volume(self.settings["global"]["volume"])
+            return snd
         except Exception as e:
             print(f"⚠️ Error loading sound '{file_name}' from '{folder_name}': {e}")
             return None
 
-    def load_theme(self, theme_name: str):
+    def load_theme(self, theme_name: str, transcode=True):
         sounds = {}
 
         if theme_name == "Custom":
             sound_paths = self.settings["yugioh"].get("sound_paths", {})
-            sounds["LP_counting"] = self.load_sound_effect("LP_counting.wav", sound_paths.get("LP_counting", "basic"))
-            sounds["LP_updated"] = self.load_sound_effect("LP_updated.wav", sound_paths.get("LP_updated", "basic"))
-            sounds["LP_empty"] = self.load_sound_effect("LP_empty.wav", sound_paths.get("LP_empty", "basic"))
-            sounds["Refresh"] = self.load_sound_effect("Refresh.wav", sound_paths.get("Refresh", "basic"))
+            sounds["LP_counting"] = self.load_sound_effect("LP_counting.wav", sound_paths.get("LP_counting", "basic"), transcode)
+            sounds["LP_updated"] = self.load_sound_effect("LP_updated.wav", sound_paths.get("LP_updated", "basic"), transcode)
+            sounds["LP_empty"] = self.load_sound_effect("LP_empty.wav", sound_paths.get("LP_empty", "basic"), transcode)
+            sounds["Refresh"] = self.load_sound_effect("Refresh.wav", sound_paths.get("Refresh", "basic"), transcode)
         else:
             folder = self.theme_map.get(theme_name, theme_name.lower())
-            sounds["LP_counting"] = self.load_sound_effect("LP_counting.wav", folder)
-            sounds["LP_updated"] = self.load_sound_effect("LP_updated.wav", folder)
-            sounds["LP_empty"] = self.load_sound_effect("LP_empty.wav", folder)
-            sounds["Refresh"] = self.load_sound_effect("Refresh.wav", folder)
+            sounds["LP_counting"] = self.load_sound_effect("LP_counting.wav", folder, transcode)
+            sounds["LP_updated"] = self.load_sound_effect("LP_updated.wav", folder, transcode)
+            sounds["LP_empty"] = self.load_sound_effect("LP_empty.wav", folder, transcode)
+            sounds["Refresh"] = self.load_sound_effect("Refresh.wav", folder, transcode)
 
+        if self.counting_ms and not synth.is_synth(sounds["LP_counting"]):
+            # Fit now (on the loader thread for async loads) so the first count doesn't pay for it
+            sound_fit.fit_sound(sounds["LP_counting"], self.counting_ms)
+        loudness.save_cache()  # no-op unless a clip was analysed for the first time
         return sounds
 
-    def play_sound(self, sound_name: str):
+    def load_theme_async(self, theme_name: str, widget, on_ready=None):
+        """Decode a theme on the sound worker pool and swap it in on the Tk thread.
+
+        The current theme keeps playing until the new one is ready. If another
+        theme is requested in the meantime, the older result is discarded.
+        """
+        future = sound.load_async(self.load_theme, theme_name)
+        self._pending_load = future
+
+        def apply(sounds):
+            if self._pending_load is not future:
+                return
+            self._pending_load = None
+            self.pending_transcode = False
+            self.sounds = sounds
+            if on_ready:
+                on_ready()
+
+        call_when_done(widget, future, apply)
+        return future
+
+    def play_sound(self, sound_name: str, duration_ms=None, delta=None, player_num=None):
+        """Queue a sound on the audio engine; the sound name is also its channel role.
+
+        With duration_ms the clip is trimmed or looped to exactly that length.
+        Synth counting clips are generated for the LP delta instead. With
+        player_num, ducking only touches that player's sounds.
+        """
         snd = self.sounds.get(sound_name)
         if snd:
-            try:
-                snd.play()
-            except Exception as e:
-                print(f"⚠️ Failed to play sound '{sound_name}': {e}")
+            # Sounds need the device open, which only the engine thread may
+            # reopen after an idle suspend, so any fitting happens over there
+            prepare = None
+            if duration_ms and delta is not None and synth.is_synth(snd):
+                def prepare(snd):
+                    counting = synth.counting(delta, duration_ms)
+                    counting.set_volume(snd.get_volume())
+                    return counting
+            elif duration_ms:
+                def prepare(snd):
+                    fitted = sound_fit.fit_sound(snd, duration_ms)
+                    fitted.set_volume(snd.get_volume())  # follow volume changes made since fitting
+                    return fitted
+            get_engine().play(sound_name, snd, owner=player_num, prepare=prepare)
         else:
-            print(f"⚠️ Sound '{sound_name}' not found in current theme.")
\ No newline at end of file
+            print(f"⚠️ Sound '{sound_name}' not found in current theme.")
+
+    def set_volume(self, value):
+        """Apply a new global volume to every loaded sound (on the engine thread)."""
+        get_engine().set_volume([snd for snd in self.sounds.values() if snd], value)
+
+    def stop_all(self):
+        get_engine().stop_all()
\ No newline at end of file
@@ -1,5 +1,40 @@
-from app import CardGameApp
+import argparse
+from utils.profiler import profiler
 
-if __name__ == "__main__": 
-    app = CardGameApp() #create and run the GUI app
-    app.mainloop() #start the main event loop
\ No newline at end of file
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Card Game Life Points Tracker")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="-",
+        metavar="PATH",
+        help="time startup and navigation phases; write a JSON report to PATH on exit (default: print it)",
+    )
+    parser.add_argument(
+        "--cprofile-dir",
+        metavar="DIR",
+        help="with --profile, also dump a cProfile .prof file per phase into DIR",
+    )
+    # PyInstaller / IDE launchers can pass extra arguments; ignore them
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.profile is not None:
+        profiler.enable(report_path=None if args.profile == "-" else args.profile, cprofile_dir=args.cprofile_dir)
+
+    try:
+        with profiler.phase("imports"):
+            from app import CardGameApp
+
+        app = CardGameApp() #create and run the GUI app
+        app.mainloop() #start the main event loop
+    finally:
+        profiler.write_report()
+
+
+if __name__ == "__main__":
+    main()
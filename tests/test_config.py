@@ -0,0 +1,67 @@
+import json
+
+from utils.config import CONFIG_VERSION, DEFAULT_CONFIG, parse_config
+from utils.settings_store import SettingsStore
+
+
+def test_current_version_takes_the_fast_path():
+    config, migrated = parse_config(json.loads(json.dumps(DEFAULT_CONFIG)))
+
+    assert not migrated
+    for section in ("version", "global", "yugioh", "mtg"):
+        assert config.to_dict()[section] == DEFAULT_CONFIG[section]
+
+
+def test_v1_is_migrated_to_the_current_version():
+    data = json.loads(json.dumps(DEFAULT_CONFIG))
+    data["version"] = 1
+    for key in ("low_latency", "audio_buffer", "audio_idle_timeout"):
+        del data["global"][key]
+    data["global"]["volume"] = 0.8
+
+    config, migrated = parse_config(data)
+
+    assert migrated
+    assert config["version"] == CONFIG_VERSION
+    assert config["global"]["volume"] == 0.8
+    assert config["global"]["low_latency"] is False
+    assert config["global"]["audio_buffer"] == 0
+
+
+def test_unversioned_file_is_merged_over_the_defaults():
+    config, migrated = parse_config({"yugioh": {"starting_lp": 4000}})
+
+    assert migrated
+    assert config["yugioh"]["starting_lp"] == 4000
+    assert config["yugioh"]["player1_name"] == "Player 1"
+
+
+def test_newer_version_is_read_best_effort_and_not_flagged():
+    config, migrated = parse_config({"version": CONFIG_VERSION + 1, "global": {"volume": 0.3, "new_key": True}})
+
+    assert not migrated
+    assert config["global"]["volume"] == 0.3
+    assert config["global"]["selected_theme"] == DEFAULT_CONFIG["global"]["selected_theme"]
+
+
+def test_malformed_file_falls_back_to_the_defaults():
+    for data in ({"global": "x"}, {"version": CONFIG_VERSION, "global": "x"}, {"version": "x"}, None, []):
+        config, _ = parse_config(data)
+        assert config["global"]["volume"] == DEFAULT_CONFIG["global"]["volume"]
+
+
+def test_saving_keeps_a_newer_files_version_and_unknown_keys(tmp_path):
+    path = tmp_path / "config.json"
+    newer = {"version": CONFIG_VERSION + 1, "future": {"x": 1}, "global": {"volume": 0.3, "new_key": True}}
+    path.write_text(json.dumps(newer))
+
+    config, _ = parse_config(newer)
+    store = SettingsStore(str(path), config)
+    store.update({"global": {"volume": 0.7}})
+    store.flush()
+
+    assert json.loads(path.read_text()) == {
+        "version": CONFIG_VERSION + 1,
+        "future": {"x": 1},
+        "global": {"volume": 0.7, "new_key": True},
+    }
@@ -0,0 +1,76 @@
+import pytest
+
+from core.history import History, TOTAL_MAX
+from core.yugioh import Game, LifePointController
+
+
+def test_undo_redo_steps_back_and_forth():
+    history = History()
+    history.record(1, 8000, 7000, "damage")
+    history.record(2, 8000, 8500, "heal")
+
+    assert history.undo() == (2, 8000, 8500, "heal")
+    assert history.undo() == (1, 8000, 7000, "damage")
+    assert history.undo() is None
+    assert history.redo() == (1, 8000, 7000, "damage")
+    assert history.can_redo()
+
+
+def test_record_after_undo_drops_the_redo_tail():
+    history = History()
+    history.record(1, 8000, 7000, "damage")
+    history.record(1, 7000, 6000, "damage")
+    history.undo()
+    history.record(1, 7000, 3500, "halve")
+
+    assert not history.can_redo()
+    assert len(history) == 2
+    assert history.undo() == (1, 7000, 3500, "halve")
+
+
+def test_ring_buffer_wraps_and_keeps_the_newest():
+    history = History(capacity=3)
+    for value in range(5):
+        history.record(1, value, value + 1, "adjust")
+
+    assert len(history) == 3
+    assert [history.undo()[1] for _ in range(3)] == [4, 3, 2]
+    assert history.undo() is None
+    assert [history.redo()[1] for _ in range(3)] == [2, 3, 4]
+
+
+def test_out_of_range_total_records_nothing():
+    history = History()
+    with pytest.raises(OverflowError):
+        history.record(1, 0, TOTAL_MAX + 1, "heal")
+    assert len(history) == 0
+
+
+def test_controller_undo_redo_restores_lp():
+    game = Game(8000)
+    controller = LifePointController(game)
+    controller.change_lp(1, -1000)
+    controller.halve_lp(1)
+
+    assert controller.undo() and game.player1.lp == 7000
+    assert controller.undo() and game.player1.lp == 8000
+    assert not controller.undo()
+    assert controller.redo() and game.player1.lp == 7000
+
+
+def test_controller_clamps_huge_amounts():
+    game = Game(8000)
+    controller = LifePointController(game)
+
+    assert controller.change_lp(1, 2 ** 64) == TOTAL_MAX
+    assert controller.undo() and game.player1.lp == 8000
+
+
+def test_controller_rolls_back_a_change_it_cannot_record():
+    game = Game(2 ** 70)
+    controller = LifePointController(game)
+
+    with pytest.raises(ValueError):
+        controller.change_lp(1, -5)
+    assert game.player1.lp == 2 ** 70
+    assert len(game.history) == 0
@@ -0,0 +1,105 @@
+import json
+
+from core import journal
+from core.yugioh import Game, LifePointController
+
+
+def _write(path, records, tail=""):
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+        f.write(tail)
+
+
+def _replay(path):
+    game = Game(8000)
+    header = journal.replay(path, game, lambda player_num, total: setattr(game.get_player(player_num), "lp", total))
+    return game, header
+
+
+HEADER = journal.match_header("yugioh", 8000, ("Player 1", "Player 2"))
+
+
+def test_replay_ignores_a_torn_last_line(tmp_path):
+    path = str(tmp_path / "yugioh-1.jsonl")
+    _write(path, [HEADER, {"p": 1, "old": 8000, "new": 7000, "c": "damage"}], tail='{"p": 2, "old": 80')
+
+    game, header = _replay(path)
+
+    assert header["start"] == "yugioh"
+    assert (game.player1.lp, game.player2.lp) == (7000, 8000)
+    assert len(game.history) == 1
+
+
+def test_reopening_truncates_the_torn_tail(tmp_path):
+    path = str(tmp_path / "yugioh-1.jsonl")
+    _write(path, [HEADER], tail='{"p": 2, "old": 80')
+
+    journal.Journal(path).close()
+
+    assert journal.read_records(path) == [HEADER, {"end": True}]
+
+
+def test_replay_rebuilds_undo_and_redo(tmp_path):
+    path = str(tmp_path / "yugioh-1.jsonl")
+    _write(path, [
+        HEADER,
+        {"p": 1, "old": 8000, "new": 7000, "c": "damage"},
+        {"p": 1, "old": 7000, "new": 3500, "c": "halve"},
+        {"p": 1, "old": 3500, "new": 7000, "c": "undo"},
+        {"p": 1, "old": 7000, "new": 8000, "c": "undo"},
+        {"p": 1, "old": 8000, "new": 7000, "c": "redo"},
+    ])
+
+    game, _ = _replay(path)
+
+    assert game.player1.lp == 7000
+    assert game.history.can_undo() and game.history.can_redo()
+    assert game.redo() == (1, 7000, 3500, "halve")
+
+
+def test_replay_after_reset_starts_a_fresh_history(tmp_path):
+    path = str(tmp_path / "yugioh-1.jsonl")
+    _write(path, [HEADER, {"p": 2, "old": 8000, "new": 6000, "c": "damage"}, {"reset": [4000, 4000]}])
+
+    game, _ = _replay(path)
+
+    assert (game.player1.lp, game.player2.lp) == (4000, 4000)
+    assert len(game.history) == 0
+
+
+def test_journal_records_controller_changes(tmp_path):
+    game = Game(8000)
+    controller = LifePointController(game)
+    match = journal.open_match(str(tmp_path), "yugioh", HEADER)
+    match.attach(controller.bus)
+    controller.change_lp(1, -1000)
+    controller.undo()
+    match.close()
+
+    records = journal.read_records(match.path)
+    assert records[1:] == [
+        {"p": 1, "old": 8000, "new": 7000, "c": "damage"},
+        {"p": 1, "old": 7000, "new": 8000, "c": "undo"},
+        {"end": True},
+    ]
+
+
+def test_find_incomplete_skips_a_journal_in_use(tmp_path):
+    directory = str(tmp_path)
+    match = journal.open_match(directory, "yugioh", HEADER)
+    try:
+        assert journal.in_use(match.path)
+        assert journal.find_incomplete(directory, "yugioh") is None
+    finally:
+        match.close(finished=False)
+
+    assert not journal.in_use(match.path)
+    assert journal.find_incomplete(directory, "yugioh") == match.path
+
+
+def test_find_incomplete_skips_finished_journals(tmp_path):
+    match = journal.open_match(str(tmp_path), "yugioh", HEADER)
+    match.close()
+
+    assert journal.find_incomplete(str(tmp_path), "yugioh") is None
@@ -0,0 +1,147 @@
+import time
+import tkinter as tk
+
+FRAME_MS = 16  # ~60 fps
+
+
+class Animation:
+    __slots__ = ("owner", "start", "duration", "on_step", "on_done")
+
+    def __init__(self, owner, start, duration, on_step, on_done):
+        self.owner = owner
+        self.start = start
+        self.duration = duration
+        self.on_step = on_step
+        self.on_done = on_done
+
+
+class Animator:
+    """One frame clock shared by every animation in the app.
+
+    A single after() tick drives all running animations. Each step gets its
+    progress (0.0 - 1.0) from the monotonic clock, so a late tick skips ahead
+    instead of stretching the animation. Animations are keyed: starting a new
+    one with a running key replaces it, which is how callers retarget. When an
+    owner widget is destroyed, its animations are dropped.
+    """
+
+    def __init__(self, root, frame_ms=FRAME_MS):
+        self.root = root
+        self.frame_ms = frame_ms
+        self.animations = {}  # key -> Animation
+        self._after_id = None
+        self._watched = set()
+
+    def animate(self, key, duration_ms, on_step, on_done=None, owner=None, delay_ms=0):
+        """Run on_step(progress) every frame for duration_ms, then on_done()."""
+        start = time.perf_counter() + delay_ms / 1000
+        self.animations[key] = Animation(owner, start, max(duration_ms, 1) / 1000, on_step, on_done)
+        if owner is not None:
+            self._watch(owner)
+        if self._after_id is None:
+            self._after_id = self.root.after(self.frame_ms, self._tick)
+
+    def is_running(self, key):
+        return key in self.animations
+
+    def cancel(self, key):
+        self.animations.pop(key, None)
+
+    def cancel_owner(self, owner):
+        for key, animation in list(self.animations.items()):
+            if animation.owner is owner:
+                del self.animations[key]
+
+    def _watch(self, owner):
+        if id(owner) in self._watched:
+            return
+        self._watched.add(id(owner))
+
+        def on_destroy(event):
+            if event.widget is owner:
+                self._watched.discard(id(owner))
+                self.cancel_owner(owner)
+
+        # Bind on the widget itself (CTk widgets redirect bind() to their canvas)
+        tk.Misc.bind(owner, "<Destroy>", on_destroy, "+")
+
+    def _tick(self):
+        self._after_id = None
+        now = time.perf_counter()
+
+        for key, animation in list(self.animations.items()):
+            if self.animations.get(key) is not animation:
+                continue  # replaced or cancelled by an earlier callback this tick
+            if now < animation.start:
+                continue
+            progress = min(1.0, (now - animation.start) / animation.duration)
+            try:
+                animation.on_step(progress)
+                if progress >= 1.0:
+                    if self.animations.get(key) is animation:
+                        del self.animations[key]
+                    if animation.on_done:
+                        animation.on_done()
+            except tk.TclError:
+                # Widget went away mid-animation
+                self._drop(key, animation)
+            except Exception as e:
+                # Drop only the failing animation; the others keep ticking
+                print(f"⚠️ Animation {key!r} failed: {e!r}")
+                self._drop(key, animation)
+
+        if self.animations:
+            self._after_id = self.root.after(self.frame_ms, self._tick)
+
+    def _drop(self, key, animation):
+        if self.animations.get(key) is animation:  # not if a callback already started a new one under key
+            del self.animations[key]
+
+
+class FrameBatcher:
+    """Collects updates between frames and hands them over once per frame.
+
+    push() stores an update under a key; a later push to the same key merges
+    into it (or replaces it without a merge function). At most one flush runs
+    per frame_ms, with every pending update, so a burst of changes (keyboard
+    repeat, several arriving in one tick) becomes one UI update per key.
+    Call from the Tk thread.
+    """
+
+    def __init__(self, widget, on_flush, frame_ms=FRAME_MS):
+        self.widget = widget
+        self.on_flush = on_flush  # on_flush({key: update})
+        self.frame_ms = frame_ms
+        self.pending = {}
+        self._after_id = None
+
+    def push(self, key, update, merge=None):
+        if merge is not None and key in self.pending:
+            update = merge(self.pending[key], update)
+        self.pending[key] = update
+        if self._after_id is None:
+            self._after_id = self.widget.after(self.frame_ms, self.flush)
+
+    def clear(self):
+        self.pending.clear()
+
+    def flush(self):
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        pending, self.pending = self.pending, {}
+        if pending:
+            try:
+                self.on_flush(pending)
+            except tk.TclError:
+                pass  # widget went away before the frame
+
+
+def get_animator(widget):
+    """Return the Animator shared by every widget under widget's root window."""
+    root = widget.winfo_toplevel()
+    animator = getattr(root, "_animator", None)
+    if animator is None:
+        animator = Animator(root)
+        root._animator = animator
+    return animator
@@ -0,0 +1,266 @@
+import time, queue, threading
+from collections import Counter
+import pygame
+from utils import sound
+
+# ----------------------------
+# Sound roles
+# ----------------------------
+# Every role owns a fixed set of reserved mixer channels, so one sound type can
+# never starve another. When a role's channels are all busy, the new sound
+# replaces the oldest one if its priority is at least as high; otherwise it is
+# dropped and counted. A role can also duck others while it plays: "stop"
+# fades them out, "duck" lowers their volume until it has finished. A sound
+# played for an owner (a player number) only ducks sounds of the same owner,
+# and replaces that owner's sound in its role before taking another channel.
+DUCK_FADE_MS = 60
+DUCK_VOLUME = 0.25
+DUCK_POLL_S = 0.05  # how often ducked channels are checked for restoring
+IDLE_POLL_S = 1.0  # how late the idle check may run after the timeout has passed
+
+
+class Role:
+    __slots__ = ("name", "channels", "priority", "ducks", "duck_mode")
+
+    def __init__(self, name, channels=1, priority=1, ducks=(), duck_mode="stop"):
+        self.name = name
+        self.channels = channels
+        self.priority = priority
+        self.ducks = ducks  # roles silenced while this one plays
+        self.duck_mode = duck_mode  # what happens to this role when it is ducked
+
+
+DEFAULT_ROLE = "effects"
+
+ROLES = (
+    Role("LP_counting", channels=2, priority=1, duck_mode="stop"),  # one per player
+    Role("LP_updated", channels=2, priority=2, ducks=("LP_counting",)),  # stops its player's count
+    Role("LP_empty", channels=1, priority=3, ducks=("LP_counting",)),
+    Role("Refresh", channels=1, priority=2),
+    Role(DEFAULT_ROLE, channels=2, priority=1),
+)
+
+
+class Slot:
+    __slots__ = ("channel", "priority", "started", "owner", "ducked_by")
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.priority = 0
+        self.started = 0.0
+        self.owner = None  # who the playing sound is for, e.g. a player number
+        self.ducked_by = None  # Slot whose sound lowered this one's volume
+
+
+# ----------------------------
+# Engine
+# ----------------------------
+class AudioEngine:
+    """Plays sounds on a dedicated thread fed by a command queue.
+
+    play() and stop_all() only put a command on a SimpleQueue, so the Tk
+    thread never waits on the mixer lock or the audio device. The engine
+    thread opens the mixer, reserves each role's channels and handles
+    stealing, ducking and drop accounting. After audio_idle_timeout seconds
+    without sound it also closes the device; the next play reopens it.
+    """
+
+    def __init__(self, roles=ROLES):
+        self.roles = {role.name: role for role in roles}
+        self.played = Counter()
+        self.dropped = Counter()
+        self._commands = queue.SimpleQueue()
+        self._pools = {}  # role name -> [Slot]
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._available = False
+        self._generation = None  # sound.mixer_generation() the pools were set up for
+        self._pending_volume = None  # (sounds, volume) set while the device was closed
+        self.suspensions = 0
+
+    # ----------------------------
+    # Tk-thread API (never blocks)
+    # ----------------------------
+    def play(self, role, snd, priority=None, owner=None, prepare=None):
+        """Queue snd to play in a role's channels (unknown roles use the shared effects pool).
+
+        With an owner, only that owner's sounds are ducked; without one, every
+        sound in the ducked roles is. prepare(snd), if given, runs on the
+        engine thread with the device open and returns the Sound to play.
+        """
+        self._ensure_started()
+        self._commands.put(("play", role, snd, priority, owner, prepare))
+
+    def set_volume(self, sounds, value):
+        """Queue a volume change for sounds; applied now if the device is open, else when it reopens."""
+        self._ensure_started()
+        self._commands.put(("volume", tuple(sounds), value))
+
+    def stop_all(self):
+        self._ensure_started()
+        self._commands.put(("stop",))
+
+    def shutdown(self):
+        if self._thread is not None:
+            self._commands.put(None)
+
+    def stats(self):
+        """Played and dropped counts per role."""
+        return {"played": dict(self.played), "dropped": dict(self.dropped), "suspensions": self.suspensions}
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="audio-engine", daemon=True)
+                self._thread.start()
+
+    # ----------------------------
+    # Engine thread
+    # ----------------------------
+    def _run(self):
+        self._resume()
+
+        while True:
+            try:
+                command = self._commands.get(timeout=self._wait_timeout())
+            except queue.Empty:
+                self._restore_ducked()
+                self._suspend_if_idle()
+                continue
+            if command is None:
+                break
+
+            try:
+                if command[0] == "play":
+                    self._resume()
+                    self._play(*command[1:])
+                elif command[0] == "volume":
+                    # Don't wake a suspended device just for this
+                    self._pending_volume = command[1:]
+                    if sound.mixer_is_open():
+                        self._apply_volume()
+                elif command[0] == "stop" and sound.mixer_is_open():
+                    pygame.mixer.stop()
+            except pygame.error as e:
+                print(f"⚠️ Audio engine error: {e}")
+            self._restore_ducked()
+
+    def _resume(self):
+        """Open the device if it is closed, and redo the channel setup after any reopen."""
+        self._available = sound.ensure_mixer()
+        if self._available and self._generation != sound.mixer_generation():
+            self._allocate_channels()
+            self._generation = sound.mixer_generation()
+        if self._available:
+            self._apply_volume()
+
+    def _apply_volume(self):
+        if self._pending_volume is None:
+            return
+        sounds, value = self._pending_volume
+        self._pending_volume = None
+        for snd in sounds:
+            snd.set_volume(value)
+
+    def _wait_timeout(self):
+        if self._has_ducked():
+            return DUCK_POLL_S
+        idle_timeout = sound.mixer_idle_timeout()
+        if not idle_timeout or not sound.mixer_is_open():
+            return None  # nothing to do until the next command
+        return max(idle_timeout - sound.mixer_idle_for(), IDLE_POLL_S)
+
+    def _suspend_if_idle(self):
+        idle_timeout = sound.mixer_idle_timeout()
+        if idle_timeout and sound.suspend_mixer(idle_timeout):
+            self._pools.clear()
+            self.suspensions += 1
+
+    def _allocate_channels(self):
+        total = sum(role.channels for role in self.roles.values())
+        # Reserved channels are never handed out by pygame's own allocation
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), total))
+        pygame.mixer.set_reserved(total)
+
+        index = 0
+        for role in self.roles.values():
+            self._pools[role.name] = [Slot(pygame.mixer.Channel(index + i)) for i in range(role.channels)]
+            index += role.channels
+
+    def _play(self, role_name, snd, priority, owner=None, prepare=None):
+        role = self.roles.get(role_name) or self.roles[DEFAULT_ROLE]
+        if not self._available:
+            self._drop(role, "no audio device")
+            return
+        if prepare is not None:
+            try:
+                snd = prepare(snd)
+            except Exception as e:  # play the clip as it is rather than lose the engine thread
+                print(f"⚠️ Could not prepare '{role.name}' sound: {e}")
+        priority = role.priority if priority is None else priority
+
+        slots = self._pools[role.name]
+        slot = None
+        if owner is not None:
+            # A newer sound for the same owner supersedes the one still playing
+            slot = next((s for s in slots if s.owner == owner and s.channel.get_busy()), None)
+        if slot is None:
+            slot = next((s for s in slots if not s.channel.get_busy()), None)
+        if slot is None:
+            # Steal the oldest, lowest-priority channel if we outrank it
+            victim = min(slots, key=lambda s: (s.priority, s.started))
+            if victim.priority > priority:
+                self._drop(role, "channels busy with higher-priority sounds")
+                return
+            slot = victim
+
+        for ducked_name in role.ducks:
+            ducked_role = self.roles[ducked_name]
+            for other in self._pools.get(ducked_name, ()):
+                if not other.channel.get_busy() or other is slot:
+                    continue
+                if owner is not None and other.owner != owner:
+                    continue
+                if ducked_role.duck_mode == "duck":
+                    other.channel.set_volume(DUCK_VOLUME)
+                    other.ducked_by = slot
+                else:
+                    other.channel.fadeout(DUCK_FADE_MS)
+
+        slot.ducked_by = None
+        slot.channel.set_volume(1.0)
+        slot.channel.play(snd)
+        slot.priority = priority
+        slot.started = time.monotonic()
+        slot.owner = owner
+        self.played[role.name] += 1
+
+    def _has_ducked(self):
+        return any(slot.ducked_by is not None for slots in self._pools.values() for slot in slots)
+
+    def _restore_ducked(self):
+        for slots in self._pools.values():
+            for slot in slots:
+                if slot.ducked_by is not None and not slot.ducked_by.channel.get_busy():
+                    slot.ducked_by = None
+                    slot.channel.set_volume(1.0)
+
+    def _drop(self, role, reason):
+        self.dropped[role.name] += 1
+        print(f"⚠️ Dropped '{role.name}' sound ({reason}); {self.dropped[role.name]} dropped so far")
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    """Return the process-wide AudioEngine; its thread starts on the first command."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = AudioEngine()
+    return _engine
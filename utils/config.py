@@ -0,0 +1,322 @@
+import copy
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+
+# ----------------------------
+# Schema
+# ----------------------------
+# Bump CONFIG_VERSION whenever the shape of config.json changes and register a
+# migration from the previous version in MIGRATIONS. A file whose "version"
+# matches is loaded as-is, without merging it against DEFAULT_CONFIG.
+CONFIG_VERSION = 3
+
+_FONTS = {
+    "heading": {"family": "Arial", "size": 20, "weight": "bold"},
+    "subheading": {"family": "Arial", "size": 16, "weight": "bold"},
+    "body": {"family": "Arial", "size": 14},
+    "lp_counter": {"family": "Arial", "size": 36, "weight": "bold"},
+}
+
+DEFAULT_CONFIG = {
+    "version": CONFIG_VERSION,
+    "global": {
+        "selected_theme": "dark",
+        "volume": 0.5,
+        "low_latency": False,
+        "audio_buffer": 0,  # samples; 0 = not calibrated yet
+        "audio_idle_timeout": 60  # seconds of silence before the audio device is closed; 0 = never
+    },
+    "yugioh": {
+        "player1_name": "Player 1",
+        "player2_name": "Player 2",
+        "starting_lp": 8000,
+        "theme": "Basic",
+        "sound_paths": {
+            "LP_counting": "basic",
+            "LP_updated": "basic",
+            "LP_empty": "basic",
+            "Refresh": "basic"
+        }
+    },
+    "mtg": {
+        "player1_name": "Player 1",
+        "player2_name": "Player 2",
+        "starting_life": 20,
+        "theme": "Default",
+        "sound_paths": {}
+    },
+    "themes": {
+        "dark": {
+            "background": "#1e1e1e",
+            "frame_bg": "#2a2a2a",
+            "text_primary": "white",
+            "text_secondary": "black",
+            "container_bg": "#3a3a3a",
+            "button_bg": "#2c2c2c",
+            "button_hover": "#3a3a3a",
+            "button_text": "#ffffff",
+            "accent": "#00b4d8",
+            "warning": "#ff4b4b",
+            "fonts": copy.deepcopy(_FONTS)
+        },
+        "light": {
+            "background": "#f4f4f4",
+            "frame_bg": "#ffffff",
+            "text_primary": "black",
+            "text_secondary": "white",
+            "container_bg": "#e0e0e0",
+            "button_bg": "#e0e0e0",
+            "button_hover": "#d0d0d0",
+            "button_text": "#000000",
+            "accent": "#0077b6",
+            "warning": "#d90429",
+            "fonts": copy.deepcopy(_FONTS)
+        }
+    }
+}
+
+
+def merge_dicts(target: dict, updates: dict):
+    """Recursively merge updates into target in place."""
+    for key, value in updates.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            merge_dicts(target[key], value)
+        else:
+            target[key] = value
+
+
+def _frozen(mapping):
+    return MappingProxyType(dict(mapping))
+
+
+# ----------------------------
+# Typed, read-only sections
+# ----------------------------
+class ConfigSection:
+    """Base for the frozen settings classes.
+
+    Sections are read-only. They still allow section["key"] and section.get(key)
+    so call sites can treat them like the dicts they replace. Changes go through
+    replace() (or save_settings), which returns a new section.
+    """
+
+    __slots__ = ()
+    _key_aliases = {}
+
+    @classmethod
+    def _attr(cls, key):
+        return cls._key_aliases.get(key, key)
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, self._attr(key))
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        return hasattr(self, self._attr(key))
+
+    def get(self, key, default=None):
+        return getattr(self, self._attr(key), default)
+
+    def keys(self):
+        reverse = {attr: key for key, attr in self._key_aliases.items()}
+        return [reverse.get(f.name, f.name) for f in fields(self)]
+
+    def to_dict(self):
+        def plain(value):
+            if isinstance(value, ConfigSection):
+                return value.to_dict()
+            if isinstance(value, MappingProxyType):
+                return {k: plain(v) for k, v in value.items()}
+            return value
+
+        return {key: plain(self[key]) for key in self.keys()}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build the section from a plain dict. Unknown keys are ignored and missing keys raise TypeError."""
+        names = {f.name for f in fields(cls)}
+        values = {cls._attr(k): v for k, v in data.items() if cls._attr(k) in names}
+        return cls(**values)
+
+    def replace(self, **changes):
+        """Return a copy of this section with the given keys changed."""
+        return type(self).from_dict({**self.to_dict(), **changes})
+
+
+@dataclass(frozen=True, slots=True)
+class FontSpec(ConfigSection):
+    family: str = "Arial"
+    size: int = 12
+    weight: str = "normal"
+
+
+@dataclass(frozen=True, slots=True)
+class ColourTheme(ConfigSection):
+    background: str
+    frame_bg: str
+    text_primary: str
+    text_secondary: str
+    container_bg: str
+    button_bg: str
+    button_hover: str
+    button_text: str
+    accent: str
+    warning: str
+    fonts: MappingProxyType
+
+    @classmethod
+    def from_dict(cls, data):
+        data = dict(data)
+        data["fonts"] = _frozen({name: FontSpec.from_dict(spec) for name, spec in data.get("fonts", {}).items()})
+        return super(ColourTheme, cls).from_dict(data)
+
+
+@dataclass(frozen=True, slots=True)
+class GlobalSettings(ConfigSection):
+    selected_theme: str
+    volume: float
+    low_latency: bool
+    audio_buffer: int
+    audio_idle_timeout: int
+
+
+@dataclass(frozen=True, slots=True)
+class YuGiOhSettings(ConfigSection):
+    player1_name: str
+    player2_name: str
+    starting_lp: int
+    theme: str
+    sound_paths: MappingProxyType
+
+    @classmethod
+    def from_dict(cls, data):
+        return super(YuGiOhSettings, cls).from_dict({**data, "sound_paths": _frozen(data.get("sound_paths", {}))})
+
+
+@dataclass(frozen=True, slots=True)
+class MTGSettings(ConfigSection):
+    player1_name: str
+    player2_name: str
+    starting_life: int
+    theme: str
+    sound_paths: MappingProxyType
+
+    @classmethod
+    def from_dict(cls, data):
+        return super(MTGSettings, cls).from_dict({**data, "sound_paths": _frozen(data.get("sound_paths", {}))})
+
+
+@dataclass(frozen=True, slots=True)
+class Config(ConfigSection):
+    """The whole config.json as an immutable snapshot."""
+
+    version: int
+    global_settings: GlobalSettings
+    yugioh: YuGiOhSettings
+    mtg: MTGSettings
+    themes: MappingProxyType
+
+    _key_aliases = {"global": "global_settings"}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            version=data["version"],
+            global_settings=GlobalSettings.from_dict(data["global"]),
+            yugioh=YuGiOhSettings.from_dict(data["yugioh"]),
+            mtg=MTGSettings.from_dict(data["mtg"]),
+            themes=_frozen({name: ColourTheme.from_dict(theme) for name, theme in data["themes"].items()}),
+        )
+
+    def updated(self, section: str, **changes):
+        """Return a new Config with keys of one section changed."""
+        return self.with_sections({section: self[section].replace(**changes)})
+
+    def with_sections(self, sections: dict):
+        """Return a new Config with whole sections swapped out."""
+        replaced = {self._attr(key): value for key, value in sections.items()}
+        return Config(**{f.name: replaced.get(f.name, getattr(self, f.name)) for f in fields(self)})
+
+
+# ----------------------------
+# Migrations
+# ----------------------------
+def _migrate_v0(data: dict):
+    """Unversioned files: fill every missing key from the defaults."""
+    merged = copy.deepcopy(DEFAULT_CONFIG)
+    merge_dicts(merged, data)
+    merged["version"] = 1
+    return merged
+
+
+def _migrate_v1(data: dict):
+    """v2 adds the low-latency audio profile."""
+    data.setdefault("global", {})
+    data["global"].setdefault("low_latency", False)
+    data["global"].setdefault("audio_buffer", 0)
+    data["version"] = 2
+    return data
+
+
+def _migrate_v2(data: dict):
+    """v3 adds the audio idle timeout."""
+    data.setdefault("global", {})
+    data["global"].setdefault("audio_idle_timeout", DEFAULT_CONFIG["global"]["audio_idle_timeout"])
+    data["version"] = 3
+    return data
+
+
+MIGRATIONS = {
+    0: _migrate_v0,
+    1: _migrate_v1,
+    2: _migrate_v2,
+}
+
+
+def migrate(data: dict):
+    """Upgrade a raw config dict to CONFIG_VERSION, one version step at a time."""
+    data = copy.deepcopy(data)
+    version = data.get("version", 0)
+    while version < CONFIG_VERSION:
+        data = MIGRATIONS[version](data)
+        version = data["version"]
+    return data
+
+
+# What a malformed file raises on its way through migrate() / from_dict()
+SHAPE_ERRORS = (KeyError, TypeError, AttributeError, ValueError)
+
+
+def parse_config(data, fallback=True):
+    """Turn raw JSON into a Config.
+
+    Returns (config, migrated). Files already at CONFIG_VERSION take the fast
+    path with no default merge. Anything else, including a current-version file
+    with missing keys, goes through migrate() once and is flagged for saving.
+    A file from a newer build is merged over the defaults as best it can and
+    not flagged; SettingsStore keeps its version and unknown keys when saving. With fallback, a file of the wrong shape gives the
+    defaults instead of raising one of SHAPE_ERRORS.
+    """
+    if not isinstance(data, dict):
+        data = {}
+    version = data.get("version", 0)
+    newer = isinstance(version, int) and version > CONFIG_VERSION
+    try:
+        if version == CONFIG_VERSION:
+            try:
+                return Config.from_dict(data), False
+            except SHAPE_ERRORS:
+                data = {k: v for k, v in data.items() if k != "version"}
+        if newer:
+            merged = copy.deepcopy(DEFAULT_CONFIG)
+            merge_dicts(merged, data)
+            merged["version"] = CONFIG_VERSION
+            return Config.from_dict(merged), False
+        return Config.from_dict(migrate(data)), True
+    except SHAPE_ERRORS as e:
+        if not fallback:
+            raise
+        print(f"⚠️ Settings file is malformed ({type(e).__name__}: {e}), using defaults.")
+        return Config.from_dict(migrate({})), not newer
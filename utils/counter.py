@@ -0,0 +1,156 @@
+import tkinter as tk
+import tkinter.font as tkfont
+import customtkinter as ctk
+
+# ----------------------------
+# Glyph atlas
+# ----------------------------
+# One entry per (family, size, weight): the Tk font object plus the width of
+# every glyph a counter can show. Counters share entries, so fonts are built
+# and measured once no matter how many counters or pulse sizes are on screen.
+GLYPHS = "0123456789-"
+
+_glyph_cache = {}  # (family, size, weight) -> Glyphs
+
+
+class Glyphs:
+    __slots__ = ("font", "widths", "height")
+
+    def __init__(self, font, widths, height):
+        self.font = font
+        self.widths = widths
+        self.height = height
+
+
+def get_glyphs(widget, family, size, weight="normal"):
+    """Return the cached font and glyph widths for one font spec."""
+    key = (family, size, weight)
+    glyphs = _glyph_cache.get(key)
+    if glyphs is None:
+        font = tkfont.Font(root=widget, family=family, size=size, weight=weight)
+        # Every digit gets the widest digit's advance so changing values never shift
+        digit = max(font.measure(ch) for ch in GLYPHS if ch.isdigit())
+        widths = {ch: digit if ch.isdigit() else font.measure(ch) for ch in GLYPHS}
+        glyphs = Glyphs(font, widths, font.metrics("linespace"))
+        _glyph_cache[key] = glyphs
+    return glyphs
+
+
+# ----------------------------
+# Counter widget
+# ----------------------------
+class LifeCounter(ctk.CTkFrame):
+    """Draws a life total on a Tk Canvas with one text item per character.
+
+    set() only touches the items whose character changed, so a counting
+    animation costs one or two itemconfigure calls per frame instead of a full
+    label redraw. Colour and scale effects are itemconfigure calls on every
+    item. The canvas is sized for max_scale up front, so a pulse never changes
+    the layout around it.
+    """
+
+    def __init__(self, master, value=0, font=("Arial", 36), text_color=None, max_scale=1.0, **kwargs):
+        super().__init__(master, fg_color="transparent", corner_radius=0, border_width=0, **kwargs)
+        family, size, weight = (tuple(font) + ("normal",))[:3]
+        self._font_spec = (family, size, weight)
+        self._max_scale = max(max_scale, 1.0)
+        self._scale = 1.0
+        self._text_color = text_color or ctk.ThemeManager.theme["CTkLabel"]["text_color"]
+        self._fill = None  # temporary colour set by an effect
+        self._text = ""
+        self._items = []
+
+        largest = self._glyphs(self._max_scale)
+        self.canvas = tk.Canvas(
+            self,
+            height=largest.height,
+            width=0,
+            highlightthickness=0,
+            borderwidth=0,
+            bg=self._apply_appearance_mode(self._bg_color),
+        )
+        self.canvas.pack()
+        self.set(value)
+
+    def _glyphs(self, scale):
+        family, size, weight = self._font_spec
+        return get_glyphs(self, family, round(size * scale), weight)
+
+    # ----------------------------
+    # Value
+    # ----------------------------
+    def get(self):
+        return int(self._text)
+
+    def set(self, value):
+        text = str(int(round(value)))
+        if text == self._text:
+            return
+
+        old = self._text
+        self._text = text
+        if len(old) != len(text) or old.startswith("-") != text.startswith("-"):
+            self._layout()
+            return
+
+        for item, before, after in zip(self._items, old, text):
+            if before != after:
+                self.canvas.itemconfigure(item, text=after)
+
+    # ----------------------------
+    # Effects
+    # ----------------------------
+    def set_color(self, color=None):
+        """Recolour the digits; None goes back to the normal text colour."""
+        self._fill = color
+        self.canvas.itemconfigure("digit", fill=self._current_fill())
+
+    def set_scale(self, scale):
+        """Draw the digits at scale times the base font size (up to max_scale)."""
+        scale = min(scale, self._max_scale)
+        if scale == self._scale:
+            return
+        self._scale = scale
+        self.canvas.itemconfigure("digit", font=self._glyphs(scale).font)
+        self._place_items()
+
+    def reset_effects(self):
+        self.set_color(None)
+        self.set_scale(1.0)
+
+    # ----------------------------
+    # Drawing
+    # ----------------------------
+    def _current_fill(self):
+        return self._apply_appearance_mode(self._fill or self._text_color)
+
+    def _layout(self):
+        """Create or drop items to match the text length, then reposition them."""
+        while len(self._items) < len(self._text):
+            self._items.append(self.canvas.create_text(0, 0, anchor="center", tags="digit"))
+        while len(self._items) > len(self._text):
+            self.canvas.delete(self._items.pop())
+
+        font = self._glyphs(self._scale).font
+        fill = self._current_fill()
+        for item, ch in zip(self._items, self._text):
+            self.canvas.itemconfigure(item, text=ch, font=font, fill=fill)
+
+        largest = self._glyphs(self._max_scale)
+        self.canvas.configure(width=sum(largest.widths.get(ch, 0) for ch in self._text))
+        self._place_items()
+
+    def _place_items(self):
+        glyphs = self._glyphs(self._scale)
+        total = sum(glyphs.widths.get(ch, 0) for ch in self._text)
+        x = (int(self.canvas.cget("width")) - total) / 2
+        y = int(self.canvas.cget("height")) / 2
+        for item, ch in zip(self._items, self._text):
+            width = glyphs.widths.get(ch, 0)
+            self.canvas.coords(item, x + width / 2, y)
+            x += width
+
+    def _set_appearance_mode(self, mode_string):
+        super()._set_appearance_mode(mode_string)
+        self.canvas.configure(bg=self._apply_appearance_mode(self._bg_color))
+        self.canvas.itemconfigure("digit", fill=self._current_fill())
@@ -1,6 +1,9 @@
-import os, json, sys
-from PIL import Image, ImageOps
+import os, sys, atexit
+from PIL import Image
 import customtkinter as ctk
+from utils.config import DEFAULT_CONFIG
+from utils.settings_store import SettingsStore, read_config
+from utils.profiler import profiler
 
 def resource_path(relative_path: str):
     try:
@@ -25,169 +28,77 @@ def get_config_path(filename="config.json"):
 
 CONFIG_FILE = resource_path("config.json")
 
-DEFAULT_CONFIG = {
-    "global": {
-        "selected_theme": "dark",
-        "volume": 0.5
-    },
-    "yugioh": {
-        "player1_name": "Player 1",
-        "player2_name": "Player 2",
-        "starting_lp": 8000,
-        "theme": "Basic",
-        "sound_paths": {
-            "LP_counting": "basic",
-            "LP_updated": "basic",
-            "LP_empty": "basic",
-            "Refresh": "basic"
-        }
-    },
-    "mtg": {
-        "player1_name": "Player 1",
-        "player2_name": "Player 2",
-        "starting_life": 20,
-        "theme": "Default",
-        "sound_paths": {}
-    },
-    "themes": {
-        "dark": {
-            "background": "#1e1e1e",
-            "frame_bg": "#2a2a2a",
-            "text_primary": "white",
-            "text_secondary": "black",
-            "container_bg": "#3a3a3a",
-            "button_bg": "#2c2c2c",
-            "button_hover": "#3a3a3a",
-            "button_text": "#ffffff",
-            "accent": "#00b4d8",
-            "warning": "#ff4b4b",
-            "fonts": {
-                "heading": {
-                    "family": "Arial",
-                    "size": 20,
-                    "weight": "bold"
-                },
-                "subheading": {
-                    "family": "Arial",
-                    "size": 16,
-                    "weight": "bold"
-                },
-                "body": {
-                    "family": "Arial",
-                    "size": 14
-                },
-                "lp_counter": {
-                    "family": "Arial",
-                    "size": 36,
-                    "weight": "bold"
-                }
-            }
-        },
-        "light": {
-            "background": "#f4f4f4",
-            "frame_bg": "#ffffff",
-            "text_primary": "black",
-            "text_secondary": "white",
-            "container_bg": "#e0e0e0",
-            "button_bg": "#e0e0e0",
-            "button_hover": "#d0d0d0",
-            "button_text": "#000000",
-            "accent": "#0077b6",
-            "warning": "#d90429",
-            "fonts": {
-                "heading": {
-                    "family": "Arial",
-                    "size": 20,
-                    "weight": "bold"
-                },
-                "subheading": {
-                    "family": "Arial",
-                    "size": 16,
-                    "weight": "bold"
-                },
-                "body": {
-                    "family": "Arial",
-                    "size": 14
-                },
-                "lp_counter": {
-                    "family": "Arial",
-                    "size": 36,
-                    "weight": "bold"
-                }
-            }
-        }
-    }
-}
+
+_settings_store = None
+
+
+def get_settings_store():
+    """Return the process-wide SettingsStore, loading config.json on first use."""
+    if _settings_store is None:
+        load_settings()
+    return _settings_store
+
 
 def load_settings():
+    """Load config.json into the settings store and return it as a read-only Config."""
+    global _settings_store
     config_path = get_config_path()
-    data = {}
-
-    # 1️⃣ Load existing config file (if available)
-    if os.path.exists(config_path):
-        try:
-            with open(config_path, "r") as f:
-                data = json.load(f)
-        except Exception as e:
-            print(f"⚠️ Error reading settings file: {e}")
-            data = {}
-    else:
-        print("ℹ️ No config file found, creating new one with defaults.")
-        data = DEFAULT_CONFIG.copy()
-        save_settings(data)
-
-    # 2️⃣ Ensure all sections exist and safely merge dict sections
-    for section, defaults in DEFAULT_CONFIG.items():
-        if section not in data:
-            # Safe shallow copy for dicts, direct assignment for primitives
-            data[section] = defaults.copy() if isinstance(defaults, dict) else defaults
-        elif isinstance(defaults, dict) and isinstance(data[section], dict):
-            # Merge missing keys inside dict sections
-            for key, default_value in defaults.items():
-                if key not in data[section]:
-                    data[section][key] = default_value
-
-    # ✅ Ensure critical global defaults (in case missing)
-    if "global" not in data:
-        data["global"] = DEFAULT_CONFIG["global"].copy()
-    if "selected_theme" not in data["global"]:
-        data["global"]["selected_theme"] = "dark"
-    if "volume" not in data["global"]:
-        data["global"]["volume"] = 1.0
-
-    return data
+    if _settings_store is not None:
+        # Replaced by this reload: write what it still holds first and let it go
+        _settings_store.stop_watching()
+        _settings_store.flush()
+    config, needs_save = read_config(config_path)
+
+    _settings_store = SettingsStore(config_path, config)
+    if needs_save:
+        # Write the migrated file once so the next start takes the fast path
+        _settings_store.mark_dirty()
+
+    return config
 
 
 def save_settings(new_data: dict):
-    config_path = get_config_path()
-    current_data = {}
-
-    # Load current config
-    if os.path.exists(config_path):
-        try:
-            with open(config_path, "r") as f:
-                current_data = json.load(f)
-        except Exception as e:
-            print(f"⚠️ Error reading settings file before saving: {e}")
-            current_data = {}
-
-    # Deep merge helper
-    def merge_dicts(target, updates):
-        for key, value in updates.items():
-            if isinstance(value, dict) and isinstance(target.get(key), dict):
-                merge_dicts(target[key], value)
-            else:
-                target[key] = value
-
-    # Merge the new data safely
-    merge_dicts(current_data, new_data)
-
-    # Save updated config
-    try:
-        with open(config_path, "w") as f:
-            json.dump(current_data, f, indent=4)
-    except Exception as e:
-        print(f"⚠️ Error saving settings: {e}")
+    """Apply {section: {key: value}} changes and return the new Config.
+
+    The write happens shortly after on a background thread.
+    """
+    return get_settings_store().update(new_data)
+
+
+def flush_settings():
+    """Write any pending settings immediately (called on exit)."""
+    if _settings_store is not None:
+        _settings_store.flush()
+
+
+atexit.register(flush_settings)  # once per process, for whichever store is current then
+
+
+def call_when_done(widget, future, callback, poll_ms=15):
+    """Poll a Future from the Tk loop and hand its result to callback on the Tk thread."""
+    def poll():
+        if not widget.winfo_exists():
+            return
+        if future.done():
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"⚠️ Background task failed: {e}")
+                return
+            callback(result)
+        else:
+            widget.after(poll_ms, poll)
+
+    poll()
+
+
+# Keyboard shortcuts shared by the game screens: key -> action on the game's controller
+_MOD = "Command" if sys.platform == "darwin" else "Control"
+UNDO_KEYS = {
+    f"<{_MOD}-z>": lambda controller: controller.undo(),
+    f"<{_MOD}-y>": lambda controller: controller.redo(),
+    f"<{_MOD}-Z>": lambda controller: controller.redo(),  # with Shift
+}
 
 
 def get_theme(config_data: dict):
@@ -199,6 +110,11 @@ def get_theme(config_data: dict):
         theme = config_data["themes"]["light"]
         return theme
 
+def font_tuple(selected_theme: dict, key: str):
+    """Plain (family, size, weight) tuple for a theme font, usable before build_fonts() has run."""
+    props = selected_theme.get("fonts", {}).get(key, {})
+    return (props.get("family", "Arial"), props.get("size", 12), props.get("weight", "normal"))
+
 def build_fonts(selected_theme:dict):
     font_defs = selected_theme.get("fonts", {})
     fonts = {}
@@ -211,26 +127,65 @@ def build_fonts(selected_theme:dict):
         )
     return fonts
 
-def load_icon(name: str, size=(24, 24), mode="dark"):
+# ----------------------------
+# Icons
+# ----------------------------
+ICON_SIZES = [(17, 17), (20, 20), (24, 24)]
+
+_icon_variants = {}  # name -> {"light": black PIL image, "dark": white PIL image}
+_icon_cache = {}  # (name, size, mode) -> CTkImage
+
+
+def _load_icon_variants(name: str):
+    """Decode an icon once and build its black and white recolours from the alpha channel."""
+    variants = _icon_variants.get(name)
+    if variants is not None:
+        return variants
 
     path = resource_path(os.path.join("assets", "icons", f"{name}.png"))
     if not os.path.exists(path):
         raise FileNotFoundError(f"Icon not found: {path}")
 
-    img = Image.open(path).convert("RGBA")
-
     # --- Extract alpha channel ---
-    alpha = img.getchannel("A")
-
-    # --- Convert color ---
-    if mode == "dark":
-        # White icon
-        recolored = Image.new("RGBA", img.size, (255, 255, 255, 255))
-    else:
-        # Black icon
-        recolored = Image.new("RGBA", img.size, (0, 0, 0, 255))
+    alpha = Image.open(path).convert("RGBA").getchannel("A")
+
+    # --- Build both colours in one merge per variant, keeping transparency ---
+    white = Image.new("L", alpha.size, 255)
+    black = Image.new("L", alpha.size, 0)
+    variants = {
+        "dark": Image.merge("RGBA", (white, white, white, alpha)),  # white icon
+        "light": Image.merge("RGBA", (black, black, black, alpha)),  # black icon
+    }
+    _icon_variants[name] = variants
+    return variants
 
-    # --- Reapply alpha to keep transparency ---
-    recolored.putalpha(alpha)
 
-    return ctk.CTkImage(light_image=recolored, dark_image=recolored, size=size)
+def load_icon(name: str, size=(24, 24), mode="dark"):
+    """Return a cached CTkImage for an icon.
+
+    mode "dark" gives a white icon and "light" a black one. mode "auto" carries
+    both, so the icon follows the appearance mode without being rebuilt.
+    """
+    key = (name, tuple(size), mode)
+    icon = _icon_cache.get(key)
+    if icon is not None:
+        return icon
+
+    with profiler.phase(f"load_icon {name}"):
+        variants = _load_icon_variants(name)
+        if mode == "auto":
+            icon = ctk.CTkImage(light_image=variants["light"], dark_image=variants["dark"], size=size)
+        else:
+            recolored = variants["dark"] if mode == "dark" else variants["light"]
+            icon = ctk.CTkImage(light_image=recolored, dark_image=recolored, size=size)
+
+    _icon_cache[key] = icon
+    return icon
+
+
+def preload_icons(names, sizes=ICON_SIZES, modes=("auto", "dark")):
+    """Build every (name, size, mode) icon up front so later lookups are dictionary hits."""
+    for name in names:
+        for size in sizes:
+            for mode in modes:
+                load_icon(name, size=size, mode=mode)
@@ -0,0 +1,128 @@
+import os, sys, json, time, statistics, subprocess
+
+# ----------------------------
+# Buffer calibration
+# ----------------------------
+# pygame doesn't report mixer underruns, so calibration can't detect them
+# directly. It rejects a buffer size that fails either of two proxies:
+#
+#   wake-up lateness  how late the OS wakes a thread that has to refill the
+#                     device every buffer period; the 99th percentile must
+#                     stay under HEADROOM of the period
+#   play-to-busy      a fresh interpreter opens the mixer at that size and
+#                     queues a silent clip through the AudioEngine; the 95th
+#                     percentile until a channel reports busy must not exceed
+#                     one buffer period
+BUFFER_SIZES = (128, 256, 512, 1024, 2048)
+HEADROOM = 0.5
+PROBE_SAMPLES = 20
+PROBE_TIMEOUT_S = 1.0
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def wake_lateness(period_s: float, duration_s: float = 0.25):
+    """Sleep in steps of period_s for duration_s and return how late each wake-up was (seconds)."""
+    lateness = []
+    now = time.perf_counter()
+    deadline, end = now + period_s, now + duration_s
+    while deadline < end:
+        time.sleep(max(0.0, deadline - time.perf_counter()))
+        woke = time.perf_counter()
+        lateness.append(woke - deadline)
+        deadline += period_s
+        if woke > deadline:
+            deadline = woke + period_s  # a missed period is a late wake-up, not a backlog
+    return lateness
+
+
+# ----------------------------
+# Play-to-busy probe
+# ----------------------------
+def wait_for(condition, timeout_s=PROBE_TIMEOUT_S):
+    deadline = time.perf_counter() + timeout_s
+    while not condition():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("mixer never changed state")
+        time.sleep(0)  # let the engine thread have the GIL
+
+
+def probe(buffer_size, samples=PROBE_SAMPLES):
+    """Measure play-to-busy latency at one buffer size and print it as JSON.
+
+    Run it in a fresh interpreter (see run_probe): the buffer is fixed once
+    the mixer is open. The clip is silent, so probing the real device is inaudible.
+    """
+    import pygame
+    from utils import sound
+    from utils.audio_engine import AudioEngine
+
+    pygame.mixer.pre_init(sound.MIXER_FREQUENCY, sound.MIXER_SIZE, sound.MIXER_CHANNELS, buffer_size)
+    pygame.mixer.init()
+    engine = AudioEngine()
+    frame_bytes = abs(sound.MIXER_SIZE) // 8 * sound.MIXER_CHANNELS
+    clip = pygame.mixer.Sound(buffer=bytes(frame_bytes * sound.MIXER_FREQUENCY // 10))  # 100 ms of silence
+
+    timings = []
+    for i in range(samples + 1):
+        engine.stop_all()
+        wait_for(lambda: not pygame.mixer.get_busy())
+        start = time.perf_counter()
+        engine.play("LP_counting", clip)
+        wait_for(pygame.mixer.get_busy)
+        if i:  # the first play also starts the engine thread
+            timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    print(json.dumps({
+        "buffer": buffer_size,
+        "buffer_ms": round(buffer_size / sound.MIXER_FREQUENCY * 1000, 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[max(0, int(len(timings) * 0.95) - 1)], 3),
+        "samples": samples,
+    }))
+
+
+def run_python(code):
+    """Run code in a fresh interpreter with the project on sys.path and return the JSON it printed last."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])))
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run_probe(buffer_size, samples=PROBE_SAMPLES):
+    return run_python(f"from utils.latency import probe; probe({buffer_size}, {samples})")
+
+
+def calibrate_buffer(frequency: int, sizes=BUFFER_SIZES, duration_s: float = 0.25, play_probe=True):
+    """Return (smallest buffer size that passes both proxies, per-size measurements).
+
+    Neither proxy sees an actual underrun; see the notes above. Sizes are
+    tried smallest first and calibration stops at the first that passes;
+    if none does, the largest size is returned. A packaged build can't start
+    a fresh interpreter, so there only the wake-up check runs.
+    """
+    play_probe = play_probe and not getattr(sys, "frozen", False)
+    results = {}
+    for size in sorted(sizes):
+        period = size / frequency
+        lateness = sorted(wake_lateness(period, duration_s))
+        p99 = lateness[min(len(lateness) - 1, int(len(lateness) * 0.99))] if lateness else 0.0
+        passed = p99 < period * HEADROOM
+        result = results[size] = {
+            "period_ms": round(period * 1000, 3),
+            "p99_late_ms": round(p99 * 1000, 3),
+        }
+        if passed and play_probe:
+            try:
+                p95 = run_probe(size)["p95_ms"]
+            except (OSError, ValueError, IndexError, subprocess.CalledProcessError) as e:
+                print(f"⚠️ Play-to-busy probe failed ({e}); calibrating on wake-up lateness only")
+                play_probe = False
+            else:
+                result["p95_play_ms"] = p95
+                passed = p95 <= period * 1000
+        result["passed"] = passed
+        if passed:
+            return size, results
+    return max(sizes), results
@@ -0,0 +1,228 @@
+"""Loudness analysis and per-clip normalization gain.
+
+Every clip is measured once (gated RMS and peak) and given the gain that
+brings it to TARGET_DBFS without clipping. Results live in loudness.json next
+to config.json:
+
+    clips  sha256 of the clip's bytes -> {"rms_db", "peak_db"}
+    files  asset path -> {"mtime", "size", "sha256"}, so unchanged files
+           aren't even re-hashed. Bundled assets are keyed relative to
+           resource_path(""), which moves on every launch of a onefile build
+
+Gain is worked out from the stored levels, so changing the target needs no
+re-analysis. It is baked into the decoded sound when it enters the sound cache, so
+playing it costs nothing extra. Pre-analyse every bundled clip with:
+
+    python -m utils.loudness
+"""
+import os, sys, json, math, hashlib, tempfile, threading
+import pygame
+from utils.helpers import get_config_path, resource_path
+
+try:
+    import numpy as np
+    import pygame.sndarray
+except ImportError:  # numpy is optional; clips then play at their recorded level
+    np = None
+
+CACHE_FILE = "loudness.json"
+TARGET_DBFS = -16.0  # gated RMS every clip is brought to; about the middle of the bundled clips
+PEAK_CEILING_DBFS = -1.0  # gain never pushes a peak above this
+MAX_GAIN_DB = 12.0  # don't drag near-silent clips all the way up
+WINDOW_MS = 50
+GATE_DBFS = -50.0  # windows quieter than this (silence, tails) don't count
+
+_cache = None
+_cache_dirty = False
+_cache_lock = threading.Lock()
+
+
+# ----------------------------
+# Analysis
+# ----------------------------
+def _db(value):
+    return round(20 * math.log10(value), 2) if value > 0 else None
+
+
+def analyse(snd):
+    """Return (rms_db, peak_db) of a Sound, in dBFS (None for silence), or None without numpy."""
+    if np is None:
+        return None
+    samples = pygame.sndarray.array(snd)
+    scale = float(np.iinfo(samples.dtype).max) if samples.dtype.kind == "i" else 1.0
+    mono = np.abs(samples.astype(np.float32) / scale)
+    if mono.ndim > 1:
+        mono = mono.max(axis=1)
+    if not len(mono):
+        return None, None
+
+    # RMS per window, averaged over the windows above the gate
+    window = max(1, pygame.mixer.get_init()[0] * WINDOW_MS // 1000)
+    usable = len(mono) // window * window or len(mono)
+    frames = mono[:usable].reshape(-1, min(window, usable))
+    power = (frames ** 2).mean(axis=1)
+    loud = power[power > 10 ** (GATE_DBFS / 10)]
+    rms = math.sqrt(float(loud.mean())) if len(loud) else 0.0
+    return _db(rms), _db(float(mono.max()))
+
+
+def gain_for(rms_db, peak_db):
+    """Linear gain taking rms_db to TARGET_DBFS, limited by the peak ceiling and MAX_GAIN_DB."""
+    if rms_db is None or peak_db is None:  # silent clip
+        return 1.0
+    gain_db = min(TARGET_DBFS - rms_db, PEAK_CEILING_DBFS - peak_db, MAX_GAIN_DB)
+    return round(10 ** (gain_db / 20), 4)
+
+
+# ----------------------------
+# Cache
+# ----------------------------
+def _load_cache():
+    global _cache
+    if _cache is None:
+        _cache = {"clips": {}, "files": {}}
+        try:
+            with open(get_config_path(CACHE_FILE), "r") as f:
+                data = json.load(f)
+            _cache["clips"].update(data.get("clips", {}))
+            _cache["files"].update(data.get("files", {}))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Ignoring unreadable loudness cache: {e}")
+    return _cache
+
+
+def _file_key(path):
+    """Cache key for path: relative for bundled assets, absolute for anything else."""
+    path = os.path.abspath(path)
+    base = os.path.abspath(resource_path(""))
+    try:
+        if os.path.commonpath([path, base]) == base:
+            return os.path.relpath(path, base).replace(os.sep, "/")
+    except ValueError:  # different drives
+        pass
+    return path
+
+
+def _key_path(key):
+    return key if os.path.isabs(key) else resource_path(key)
+
+
+def save_cache():
+    """Write the cache if anything was analysed since the last save, dropping files that are gone."""
+    global _cache_dirty
+    with _cache_lock:
+        if not _cache_dirty:
+            return
+        files = _cache["files"]
+        for key in [key for key in files if not os.path.exists(_key_path(key))]:
+            del files[key]
+        path = get_config_path(CACHE_FILE)
+        try:
+            fd, tmp_path = tempfile.mkstemp(prefix=".loudness-", dir=os.path.dirname(path))
+            with os.fdopen(fd, "w") as f:
+                json.dump(_cache, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, path)
+            _cache_dirty = False
+        except OSError as e:
+            print(f"⚠️ Could not save loudness cache: {e}")
+
+
+def file_digest(path):
+    """sha256 of a file, re-hashed only when its mtime or size changed."""
+    global _cache_dirty
+    stat = os.stat(path)
+    key = _file_key(path)
+    with _cache_lock:
+        entry = _load_cache()["files"].get(key)
+        if entry and entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size:
+            return entry["sha256"]
+
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    with _cache_lock:
+        _load_cache()["files"][key] = {"mtime": stat.st_mtime, "size": stat.st_size, "sha256": digest}
+        _cache_dirty = True
+    return digest
+
+
+def clip_gain(digest, snd):
+    """Gain for the clip with this content hash, analysing snd only on a cache miss."""
+    global _cache_dirty
+    with _cache_lock:
+        entry = _load_cache()["clips"].get(digest)
+    if entry is None:
+        measured = analyse(snd)
+        if measured is None:
+            return 1.0
+        entry = {"rms_db": measured[0], "peak_db": measured[1]}
+        with _cache_lock:
+            _load_cache()["clips"][digest] = entry
+            _cache_dirty = True
+    return gain_for(entry["rms_db"], entry["peak_db"])
+
+
+# ----------------------------
+# Applying gain
+# ----------------------------
+def apply_gain(snd, gain):
+    """Scale snd's samples by gain in place and return it. Only use on a freshly decoded Sound."""
+    if np is None or abs(gain - 1.0) < 0.01:
+        return snd
+    # gain_for keeps peaks under the ceiling, so the int16 samples can't overflow
+    samples = pygame.sndarray.samples(snd)
+    np.multiply(samples, gain, out=samples, casting="unsafe")
+    return snd
+
+
+def normalize(snd, path=None, digest=None):
+    """Bake the normalization gain into a freshly decoded snd, identified by its source file or content hash."""
+    if np is None or snd is None:
+        return snd
+    try:
+        digest = digest or file_digest(path)
+    except OSError as e:
+        print(f"⚠️ Could not analyse loudness of '{path}': {e}")
+        return snd
+    return apply_gain(snd, clip_gain(digest, snd))
+
+
+def analyse_all(sounds_root):
+    """Measure every bundled clip not yet in the cache. Returns {path: (rms_db, peak_db, gain)}."""
+    from utils.sound import ensure_mixer
+    from utils.sound_bank import collect_clips
+    ensure_mixer()
+    report = {}
+    for _, path in collect_clips(sounds_root):
+        digest = file_digest(path)
+        gain = clip_gain(digest, pygame.mixer.Sound(path))
+        entry = _load_cache()["clips"][digest]
+        report[path] = (entry["rms_db"], entry["peak_db"], gain)
+    save_cache()
+    return report
+
+
+def main(argv=None):
+    import argparse
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description="Measure the loudness of every bundled sound.")
+    parser.add_argument("--sounds", default=os.path.join(root, "assets", "sounds"), help="sound asset folder")
+    args = parser.parse_args(argv)
+
+    if np is None:
+        print("⚠️ Loudness analysis needs numpy.")
+        return 1
+    silent = -math.inf
+    for path, (rms_db, peak_db, gain) in analyse_all(args.sounds).items():
+        rms_db = silent if rms_db is None else rms_db
+        peak_db = silent if peak_db is None else peak_db
+        print(f"{os.path.relpath(path, args.sounds):32} rms {rms_db:7.2f} dBFS  peak {peak_db:6.2f} dBFS  gain {gain:.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+import os, re, sys, json, time, cProfile, threading
+from contextlib import contextmanager, nullcontext
+
+# ----------------------------
+# Phase profiler
+# ----------------------------
+# Off by default; main.py --profile turns it on. While off, phase() hands back
+# a shared no-op context so instrumented code costs one attribute check.
+_PROCESS_START = time.perf_counter()
+_NO_PHASE = nullcontext()
+
+
+class Profiler:
+    """Records monotonic timings for named startup and navigation phases.
+
+    Phases can nest and repeat (every screen switch is one). Nesting is
+    tracked per thread, so phases on the loader and sound worker threads don't
+    disturb the Tk thread's. With a cProfile directory set, the outermost
+    running phase (on whichever thread starts first) is also profiled and
+    dumped to <dir>/<index>-<phase>.prof, which pstats and snakeviz can open.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.report_path = None  # None prints the report to stdout
+        self.cprofile_dir = None
+        self.phases = []  # {"name", "start_ms", "duration_ms", "depth", "thread"}
+        self.marks = []  # {"name", "at_ms"}
+        self._local = threading.local()  # .depth: this thread's phase nesting
+        self._lock = threading.Lock()  # guards phases, marks and _profiling
+        self._profiling = False
+
+    def enable(self, report_path=None, cprofile_dir=None):
+        self.enabled = True
+        self.report_path = report_path
+        self.cprofile_dir = cprofile_dir
+        if cprofile_dir:
+            os.makedirs(cprofile_dir, exist_ok=True)
+
+    def phase(self, name: str):
+        """Context manager timing one phase; a no-op unless profiling is enabled."""
+        if not self.enabled:
+            return _NO_PHASE
+        return self._timed(name)
+
+    @contextmanager
+    def _timed(self, name):
+        profile = None
+        if self.cprofile_dir:
+            with self._lock:
+                if not self._profiling:
+                    profile = cProfile.Profile()
+                    self._profiling = True
+
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        start = time.perf_counter()
+        if profile:
+            profile.enable()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            if profile:
+                profile.disable()
+            self._local.depth = depth
+            entry = {
+                "name": name,
+                "start_ms": round((start - _PROCESS_START) * 1000, 3),
+                "duration_ms": round((end - start) * 1000, 3),
+                "depth": depth,
+                "thread": threading.current_thread().name,
+            }
+            with self._lock:
+                index = len(self.phases)
+                self.phases.append(entry)
+            if profile:
+                safe_name = re.sub(r"[^\w.-]+", "_", name)
+                profile.dump_stats(os.path.join(self.cprofile_dir, f"{index:03d}-{safe_name}.prof"))
+                with self._lock:
+                    self._profiling = False
+
+    def mark(self, name: str):
+        """Record a point in time since startup (e.g. the first paint)."""
+        if self.enabled:
+            with self._lock:
+                self.marks.append({"name": name, "at_ms": round((time.perf_counter() - _PROCESS_START) * 1000, 3)})
+
+    # ----------------------------
+    # Reporting
+    # ----------------------------
+    def report(self):
+        with self._lock:
+            phases, marks = list(self.phases), list(self.marks)
+        summary = {}
+        for entry in phases:
+            stats = summary.setdefault(entry["name"], {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            stats["count"] += 1
+            stats["total_ms"] = round(stats["total_ms"] + entry["duration_ms"], 3)
+            stats["max_ms"] = max(stats["max_ms"], entry["duration_ms"])
+
+        return {
+            "frozen": hasattr(sys, "_MEIPASS"),
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "uptime_ms": round((time.perf_counter() - _PROCESS_START) * 1000, 3),
+            "marks": marks,
+            "phases": sorted(phases, key=lambda entry: entry["start_ms"]),
+            "summary": summary,
+        }
+
+    def write_report(self):
+        """Write the JSON report to report_path, or print it when no path (or no console) is available."""
+        if not self.enabled:
+            return
+        text = json.dumps(self.report(), indent=2)
+        path = self.report_path
+        if path is None and sys.stdout is None:
+            # Windowed builds have no console to print to
+            from utils.helpers import get_config_path
+            path = get_config_path("profile.json")
+
+        if path is None:
+            print(text)
+            return
+        try:
+            with open(path, "w") as f:
+                f.write(text)
+            print(f"ℹ️ Profile written to {path}")
+        except OSError as e:
+            print(f"⚠️ Could not write profile report: {e}")
+
+
+profiler = Profiler()
+
+
+def phase(name: str):
+    """Shorthand for profiler.phase(name)."""
+    return profiler.phase(name)
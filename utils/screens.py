@@ -0,0 +1,106 @@
+import time
+from collections import OrderedDict
+import customtkinter as ctk
+from utils.profiler import profiler
+
+
+class ScreenManager:
+    """Builds each screen once and switches between them with pack_forget / pack.
+
+    A screen is registered with a build function. It receives an empty container
+    frame and may return a refresh function, which is called with the arguments
+    given to show() every time the screen is shown. That way only data-dependent
+    labels are touched on navigation, never the whole widget tree.
+    """
+
+    def __init__(self, host):
+        self.host = host
+        self.builders = {}  # name -> build(parent) -> refresh(*args) | None
+        self.screens = {}  # name -> (container, refresh)
+        self.current = None
+        self.current_args = ()
+        self.last_switch_ms = None  # latency of the most recent show(), for profiling
+
+    def register(self, name, build):
+        self.builders[name] = build
+
+    def show(self, name, *args):
+        """Show a screen, building it on first use, and refresh its data."""
+        with profiler.phase(f"change_screen {type(self.host).__name__}.{name}"):
+            self._show(name, *args)
+
+    def _show(self, name, *args):
+        start = time.perf_counter()
+
+        if name not in self.screens:
+            container = ctk.CTkFrame(self.host, fg_color="transparent")
+            refresh = self.builders[name](container)
+            self.screens[name] = (container, refresh)
+        container, refresh = self.screens[name]
+
+        if self.current != name:
+            self.hide()
+            container.pack(fill="both", expand=True)
+            self.current = name
+
+        self.current_args = args
+        if refresh:
+            refresh(*args)
+
+        self.last_switch_ms = (time.perf_counter() - start) * 1000
+
+    def hide(self):
+        """Unpack the current screen, keeping its widgets for next time."""
+        if self.current in self.screens:
+            self.screens[self.current][0].pack_forget()
+        self.current = None
+
+    def refresh(self):
+        """Re-run the current screen's refresh with the arguments it was last shown with."""
+        if self.current in self.screens:
+            refresh = self.screens[self.current][1]
+            if refresh:
+                refresh(*self.current_args)
+
+    def invalidate(self, rebuild=True):
+        """Destroy every cached screen (e.g. after a colour theme change).
+
+        With rebuild=True the visible screen is built again straight away.
+        Otherwise nothing is shown until the next show().
+        """
+        current, args = self.current, self.current_args
+        self.hide()
+        for container, _ in self.screens.values():
+            container.destroy()
+        self.screens.clear()
+        if rebuild and current is not None:
+            self.show(current, *args)
+
+
+class FrameRegistry:
+    """Keeps suspended game frames alive so resuming a game is a re-pack.
+
+    Frames are kept in least-recently-used order. Once more than max_frames
+    are held, the oldest is destroyed. Tk gives no usable per-widget memory
+    figure, so the cap counts frames.
+    """
+
+    def __init__(self, max_frames=2):
+        self.max_frames = max_frames
+        self.frames = OrderedDict()  # key -> frame
+
+    def get(self, key):
+        frame = self.frames.get(key)
+        if frame is not None:
+            self.frames.move_to_end(key)
+        return frame
+
+    def add(self, key, frame):
+        self.frames[key] = frame
+        self.frames.move_to_end(key)
+        while len(self.frames) > self.max_frames:
+            _, evicted = self.frames.popitem(last=False)
+            evicted.destroy()
+
+    def __iter__(self):
+        return iter(list(self.frames.values()))
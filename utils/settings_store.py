@@ -0,0 +1,261 @@
+import os, copy, json, time, tempfile, threading
+from contextlib import contextmanager
+from utils.config import CONFIG_VERSION, parse_config, SHAPE_ERRORS
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def write_json_atomic(path: str, data: dict):
+    """Write JSON to a temp file next to path and rename it over the original."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".config-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@contextmanager
+def file_lock(path: str):
+    """Hold an advisory lock on <path>.lock, shared by every app instance using path."""
+    with open(path + ".lock", "a+") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def read_config(path: str):
+    """Read config.json and return (Config, needs_save)."""
+    data = None
+    if os.path.exists(path):
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"⚠️ Error reading settings file: {e}")
+    else:
+        print("ℹ️ No config file found, creating new one with defaults.")
+
+    return parse_config(data)
+
+
+def _file_signature(path: str):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def _overlay(base, ours, dirty: dict):
+    """Return base with the dirty parts of ours laid on top.
+
+    dirty maps section -> set of keys, or None for the whole section.
+    """
+    sections = {}
+    for section, keys in dirty.items():
+        if keys is None:
+            sections[section] = ours[section]
+        else:
+            sections[section] = base[section].replace(**{key: ours[section][key] for key in keys})
+    return base.with_sections(sections) if sections else base
+
+
+def _is_newer(raw):
+    """True for a config.json written by a newer build than this one."""
+    version = raw.get("version") if isinstance(raw, dict) else None
+    return isinstance(version, int) and version > CONFIG_VERSION
+
+
+def _patch_raw(raw, ours: dict, dirty: dict):
+    """raw with only the dirty keys of ours (a to_dict()) written into it.
+
+    Used for a newer build's file, so its version and every key this build
+    doesn't know about survive a save.
+    """
+    data = copy.deepcopy(raw)
+    for section, keys in dirty.items():
+        if section == "version":
+            continue
+        values = ours[section]
+        if not isinstance(data.get(section), dict):
+            data[section] = {}
+        data[section].update(values if keys is None else {key: values[key] for key in keys})
+    return data
+
+
+class SettingsStore:
+    """Holds the current Config in memory and writes it back to disk behind the UI.
+
+    Updates mark the keys they touch dirty and (re)start a short debounce
+    timer. When it fires, the timer thread takes the config file lock, re-reads
+    the file, lays only our dirty keys over it and writes the result. Several
+    app instances can share one config.json without losing each other's
+    changes.
+
+    start_watching() polls the file's stat on a background thread and adopts
+    changes made by other instances. Listeners are called with
+    (config, changed_sections) on that thread.
+    """
+
+    def __init__(self, path: str, config, debounce: float = 0.4):
+        self.path = path
+        self.config = config  # immutable Config snapshot, replaced on every update
+        self.debounce = debounce
+        self._dirty = {}  # section -> set of keys, or None for the whole section
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._timer = None
+        self._listeners = []
+        self._signature = _file_signature(path)
+        self._watching = threading.Event()
+
+    @property
+    def dirty(self):
+        return bool(self._dirty)
+
+    def update(self, new_data: dict):
+        """Apply {section: {key: value}} changes, schedule a write and return the new Config."""
+        with self._lock:
+            config = self.config
+            for section, changes in new_data.items():
+                config = config.updated(section, **changes)
+                if self._dirty.get(section, set()) is not None:
+                    self._dirty.setdefault(section, set()).update(changes.keys())
+            self.config = config
+            self._schedule()
+        return config
+
+    def mark_dirty(self, *sections):
+        """Mark whole sections (default: all of them) for writing."""
+        with self._lock:
+            for section in sections or self.config.keys():
+                self._dirty[section] = None
+            self._schedule()
+
+    def _schedule(self):
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.debounce, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self):
+        """Write pending changes now. Safe to call from any thread and when nothing is dirty."""
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._dirty:
+                    return
+                ours, dirty = self.config, self._dirty
+                self._dirty = {}
+
+            try:
+                with file_lock(self.path):
+                    raw = self._read_raw()
+                    disk = self._parse(raw)
+                    merged = _overlay(disk, ours, dirty) if disk is not None else ours
+                    if _is_newer(raw):
+                        write_json_atomic(self.path, _patch_raw(raw, merged.to_dict(), dirty))
+                    else:
+                        write_json_atomic(self.path, merged.to_dict())
+                    self._signature = _file_signature(self.path)
+            except Exception as e:
+                print(f"⚠️ Error saving settings: {e}")
+                with self._lock:
+                    # Keep the changes pending for the next attempt
+                    for section, keys in dirty.items():
+                        pending = self._dirty.get(section, set())
+                        self._dirty[section] = None if keys is None or pending is None else pending | keys
+                return
+
+            # Pick up anything another instance wrote before we took the lock
+            self._adopt(merged)
+
+    # ----------------------------
+    # Cross-process sync
+    # ----------------------------
+    def add_listener(self, callback):
+        """callback(config, changed_sections) runs on a background thread after an external change."""
+        self._listeners.append(callback)
+
+    def start_watching(self, interval: float = 1.0):
+        """Poll the config file for changes made by other app instances."""
+        if self._watching.is_set():
+            return
+        self._watching.set()
+        threading.Thread(target=self._watch, args=(interval,), name="config-watcher", daemon=True).start()
+
+    def stop_watching(self):
+        self._watching.clear()
+
+    def _watch(self, interval):
+        while self._watching.is_set():
+            time.sleep(interval)
+            if _file_signature(self.path) == self._signature:
+                continue
+            with self._write_lock:
+                signature = _file_signature(self.path)
+                if signature is None or signature == self._signature:
+                    continue
+                disk = self._read_disk()
+                self._signature = signature
+            if disk is not None:
+                self._adopt(disk)
+
+    def _read_disk(self):
+        return self._parse(self._read_raw())
+
+    def _read_raw(self):
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):  # missing or half-written
+            return None
+
+    @staticmethod
+    def _parse(raw):
+        if raw is None:
+            return None
+        try:
+            return parse_config(raw, fallback=False)[0]
+        except SHAPE_ERRORS:  # malformed: keep what we have
+            return None
+
+    def _adopt(self, disk):
+        """Take every value from disk that we don't have a pending change for."""
+        with self._lock:
+            current = self.config
+            updated = _overlay(disk, current, self._dirty)
+            changed = [key for key in current.keys() if updated[key] != current[key]]
+            self.config = updated
+
+        if changed:
+            for callback in list(self._listeners):
+                try:
+                    callback(updated, changed)
+                except Exception as e:
+                    print(f"⚠️ Settings listener failed: {e}")
@@ -1,20 +1,196 @@
-import pygame, os
-from utils.helpers import resource_path
+import pygame, os, time, threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from utils.helpers import resource_path, get_settings_store, save_settings
+from utils.profiler import profiler
+from utils.sound_bank import get_bank, bank_key
+from utils import loudness
+
+# ----------------------------
+# Audio device
+# ----------------------------
+# Opened on first use rather than at import, so starting the app (or a game
+# mode without sound) never waits on the audio driver. The format matches the
+# bundled WAVs (44.1 kHz, 16-bit, stereo), so clips load without resampling.
+#
+# The audio engine closes the device again after a stretch of silence (see
+# suspend_mixer) so the audio thread stops waking the CPU. Decoded Sounds
+# survive that, and reopening at the same format makes them playable again.
+# Anything that touches a Sound or the mixer calls ensure_mixer() first,
+# which both reopens the device and counts as activity.
+MIXER_FREQUENCY = 44100
+MIXER_SIZE = -16
+MIXER_CHANNELS = 2
+DEFAULT_BUFFER = 512  # pygame 2's own default
+LOW_LATENCY_BUFFER = 256  # used until calibration has picked one
+
+_mixer_lock = threading.Lock()
+_mixer_last_used = 0.0  # time.monotonic() of the last ensure_mixer()
+_mixer_generation = 0  # bumped every time the device is (re)opened
+
+
+def mixer_buffer():
+    """Buffer size in samples for the configured audio profile."""
+    settings = get_settings_store().config["global"]
+    if not settings["low_latency"]:
+        return DEFAULT_BUFFER
+    return settings["audio_buffer"] or LOW_LATENCY_BUFFER
+
+
+def calibrate_low_latency():
+    """Pick the smallest buffer that passes utils.latency's checks and store it. Slow; run it off the Tk thread.
+
+    pygame reports no underruns, so this is a proxy, not a guarantee.
+    """
+    from utils.latency import calibrate_buffer
+    size, results = calibrate_buffer(MIXER_FREQUENCY)
+    save_settings({"global": {"audio_buffer": size}})
+    print(f"ℹ️ Low-latency audio buffer calibrated to {size} samples")
+    return size, results
+
+
+def mixer_is_open():
+    return bool(pygame.mixer.get_init())
+
+
+def mixer_generation():
+    """Changes whenever the device is reopened, so channel setup can be redone."""
+    return _mixer_generation
+
+
+def ensure_mixer():
+    """Open (or resume) the audio device if it isn't open yet. Returns False if that failed.
+
+    The lock only keeps opening and closing from interleaving; it is released
+    on return. What stops suspend_mixer() closing the device before the caller
+    uses it is the refreshed last-used time: suspend only closes after a full
+    idle timeout with nothing touching the mixer, far longer than any caller
+    holds on between ensure_mixer() and using the Sound.
+    """
+    global _mixer_last_used, _mixer_generation
+    with _mixer_lock:
+        _mixer_last_used = time.monotonic()
+        if not pygame.mixer.get_init():
+            try:
+                with profiler.phase("pygame.mixer.init"):
+                    pygame.mixer.pre_init(MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS, mixer_buffer())
+                    pygame.mixer.init()
+            except pygame.error as e:
+                print(f"⚠️ Could not open audio device: {e}")
+                return False
+            _mixer_generation += 1
+    return True
+
+
+def mixer_idle_timeout():
+    """Seconds of silence before the device is closed; 0 keeps it open."""
+    return get_settings_store().config["global"]["audio_idle_timeout"]
+
+
+def mixer_idle_for():
+    return time.monotonic() - _mixer_last_used
+
+
+def suspend_mixer(idle_s):
+    """Close the device if nothing has used it for idle_s seconds and nothing is playing.
+
+    Returns True if it was closed. Decoded Sounds are kept; the next
+    ensure_mixer() reopens the device at the same format.
+    """
+    with _mixer_lock:
+        if not pygame.mixer.get_init() or mixer_idle_for() < idle_s or pygame.mixer.get_busy():
+            return False
+        pygame.mixer.quit()
+    return True
+
+# ----------------------------
+# Decoded sound cache
+# ----------------------------
+# Shared by every SoundThemeManager so revisiting a game screen or switching
+# themes reuses already decoded clips instead of hitting the disk again. Clips
+# come from the packed sound bank when one was built, else from the files,
+# and are stored with their loudness normalization gain already applied.
+SOUND_CACHE_SIZE = 32  # all seven Yu-Gi-Oh themes (28 clips) plus MTG fit
+
+_sound_cache = OrderedDict()  # (game, folder, file) -> pygame.mixer.Sound
+_cache_lock = threading.Lock()
+
+
+def get_cached_sound(game, folder_name, file_name):
+    """Return a decoded sound for assets/sounds/<game>/<folder>/<file>, decoding it at most once."""
+    # Decoding converts to the device format, and callers go on to use the
+    # Sound, so the device has to be open (or resumed) even on a cache hit
+    ensure_mixer()
+    key = (game, folder_name, file_name)
+    with _cache_lock:
+        sound = _sound_cache.get(key)
+        if sound is not None:
+            _sound_cache.move_to_end(key)
+            return sound
+
+    path = resource_path(os.path.join("assets", "sounds", game, folder_name, file_name))
+    bank = get_bank(pygame.mixer.get_init())
+    sound = bank.load(bank_key(game, folder_name, file_name)) if bank is not None else None
+    if sound is None:
+        sound = loudness.normalize(pygame.mixer.Sound(path), path=path)  # bank clips are normalized when packed
+
+    with _cache_lock:
+        _sound_cache[key] = sound
+        _sound_cache.move_to_end(key)
+        while len(_sound_cache) > SOUND_CACHE_SIZE:
+            _sound_cache.popitem(last=False)
+    return sound
+
+
+def clear_sound_cache():
+    with _cache_lock:
+        _sound_cache.clear()
+
+
+# ----------------------------
+# Background loading
+# ----------------------------
+_loader = None
+
+
+def get_loader():
+    """Return the shared worker pool used to decode sounds off the Tk thread."""
+    global _loader
+    if _loader is None:
+        _loader = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sound-loader")
+    return _loader
+
+
+def load_async(function, *args):
+    """Run a loading function on the sound worker pool and return its Future."""
+    return get_loader().submit(function, *args)
+
+
+def prefetch_sounds(game, folders, file_names):
+    """Queue every (folder, file) pair for decoding so later loads hit the cache."""
+    def warm(folder, file_name):
+        try:
+            get_cached_sound(game, folder, file_name)
+        except Exception as e:
+            print(f"⚠️ Could not prefetch sound '{file_name}' from '{folder}': {e}")
+
+    return [load_async(warm, folder, file_name) for folder in folders for file_name in file_names]
 
-pygame.mixer.init()
 
 def load_sound(file_name, folder_name):
     path = resource_path(os.path.join("assets", "sounds", folder_name, file_name))
     try:
-        sound = pygame.mixer.Sound(path)
-        return sound
+        game, _, folder = folder_name.replace("\\", "/").partition("/")
+        return get_cached_sound(game, folder, file_name)
     except Exception as e:
         print(f"⚠️ Could not load sound: {path} ({e})")
         return None
 
-def play_sound(sound):
+def play_sound(sound, role="effects"):
     if sound:
-        sound.play()
+        from utils.audio_engine import get_engine
+        get_engine().play(role, sound)
 
 def stop_all_sounds():
-    pygame.mixer.stop()
\ No newline at end of file
+    from utils.audio_engine import get_engine
+    get_engine().stop_all()
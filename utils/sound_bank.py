@@ -0,0 +1,182 @@
+"""Packed sound bank: every bundled clip as raw PCM in one file.
+
+Build it offline (before packaging) with:
+
+    python -m utils.sound_bank build
+
+Layout (little-endian):
+    header   magic b"CGUBANK2", frequency u32, size i16, channels u16, entry count u32
+    index    per entry: key length u16, key utf-8 ("game/folder/file"), offset u64, length u64
+    data     raw PCM in the mixer's native format with the loudness
+             normalization gain applied, each clip 16-byte aligned
+"""
+import os, sys, mmap, struct, threading
+
+MAGIC = b"CGUBANK2"  # 2: clips are loudness-normalized
+HEADER = struct.Struct("<8sIhHI")
+ENTRY = struct.Struct("<QQ")
+ALIGN = 16
+
+BANK_PATH = os.path.join("assets", "sounds", "sounds.bank")
+SOUND_EXTENSIONS = (".wav", ".mp3", ".ogg")
+
+
+def bank_key(game, folder_name, file_name):
+    return f"{game}/{folder_name}/{file_name}"
+
+
+# ----------------------------
+# Packer
+# ----------------------------
+def collect_clips(sounds_root):
+    """Yield (key, path) for every clip under assets/sounds/<game>/<folder>/."""
+    for game in sorted(os.listdir(sounds_root)):
+        game_dir = os.path.join(sounds_root, game)
+        if not os.path.isdir(game_dir):
+            continue
+        for folder in sorted(os.listdir(game_dir)):
+            folder_dir = os.path.join(game_dir, folder)
+            if not os.path.isdir(folder_dir):
+                continue
+            for file_name in sorted(os.listdir(folder_dir)):
+                if file_name.lower().endswith(SOUND_EXTENSIONS):
+                    yield bank_key(game, folder, file_name), os.path.join(folder_dir, file_name)
+
+
+def build_bank(sounds_root, output_path):
+    """Decode and normalize every clip at the mixer format and write them to one bank file. Returns the entry count."""
+    import pygame
+    from utils import loudness, sound
+
+    # The app opens the mixer at this same format, whatever the buffer size
+    if not pygame.mixer.get_init():
+        pygame.mixer.pre_init(sound.MIXER_FREQUENCY, sound.MIXER_SIZE, sound.MIXER_CHANNELS)
+        pygame.mixer.init()
+    frequency, size, channels = pygame.mixer.get_init()
+
+    clips = []
+    for key, path in collect_clips(sounds_root):
+        try:
+            clips.append((key, loudness.normalize(pygame.mixer.Sound(path), path=path).get_raw()))
+        except pygame.error as e:
+            print(f"⚠️ Skipping '{path}': {e}")
+    loudness.save_cache()
+
+    index_size = sum(2 + len(key.encode("utf-8")) + ENTRY.size for key, _ in clips)
+    offset = _aligned(HEADER.size + index_size)
+    entries = []
+    for key, pcm in clips:
+        entries.append((key, offset, len(pcm)))
+        offset = _aligned(offset + len(pcm))
+
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, frequency, size, channels, len(clips)))
+        for key, clip_offset, length in entries:
+            encoded = key.encode("utf-8")
+            f.write(struct.pack("<H", len(encoded)) + encoded + ENTRY.pack(clip_offset, length))
+        for (key, clip_offset, _), (_, pcm) in zip(entries, clips):
+            f.write(b"\0" * (clip_offset - f.tell()))
+            f.write(pcm)
+    os.replace(tmp_path, output_path)
+    return len(clips)
+
+
+def _aligned(offset):
+    return (offset + ALIGN - 1) // ALIGN * ALIGN
+
+
+# ----------------------------
+# Loader
+# ----------------------------
+class SoundBank:
+    """Read-only view of a bank file through mmap.
+
+    Clips are handed to pygame as memoryview slices of the mapping, so a load
+    is an index lookup plus pygame's own copy into its chunk; there is no
+    file parsing or decoding. The mapping is shared between app instances by
+    the OS page cache.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+
+        magic, frequency, size, channels, count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a sound bank")
+        self.format = (frequency, size, channels)
+
+        self.index = {}  # key -> (offset, length)
+        position = HEADER.size
+        for _ in range(count):
+            (key_length,) = struct.unpack_from("<H", self._map, position)
+            position += 2
+            key = bytes(self._map[position:position + key_length]).decode("utf-8")
+            position += key_length
+            self.index[key] = ENTRY.unpack_from(self._map, position)
+            position += ENTRY.size
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def load(self, key):
+        """Return a pygame Sound for key, or None when the bank doesn't have it."""
+        import pygame
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        offset, length = entry
+        return pygame.mixer.Sound(buffer=self._view[offset:offset + length])
+
+
+_bank = None
+_bank_checked = False
+_bank_lock = threading.Lock()
+
+
+def get_bank(mixer_format):
+    """Return the bundled SoundBank if it exists and matches the open mixer's format, else None."""
+    global _bank, _bank_checked
+    if _bank_checked:
+        return _bank
+    with _bank_lock:
+        if not _bank_checked:
+            from utils.helpers import resource_path
+            path = resource_path(BANK_PATH)
+            if os.path.exists(path):
+                try:
+                    bank = SoundBank(path)
+                    if bank.format == tuple(mixer_format):
+                        _bank = bank
+                    else:
+                        print(f"ℹ️ Sound bank format {bank.format} doesn't match the mixer {tuple(mixer_format)}; decoding files instead.")
+                except (OSError, ValueError, struct.error) as e:
+                    print(f"⚠️ Could not open sound bank: {e}")
+            _bank_checked = True
+    return _bank
+
+
+def main(argv=None):
+    import argparse
+
+    # Packing needs the mixer's format, not a sound card
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description="Pack every bundled sound into one bank file.")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("--sounds", default=os.path.join(root, "assets", "sounds"), help="sound asset folder")
+    parser.add_argument("--output", default=os.path.join(root, BANK_PATH), help="bank file to write")
+    args = parser.parse_args(argv)
+
+    count = build_bank(args.sounds, args.output)
+    print(f"ℹ️ Packed {count} clips into {args.output} ({os.path.getsize(args.output) // 1024} KiB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
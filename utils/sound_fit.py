@@ -0,0 +1,68 @@
+import math, threading
+from weakref import WeakKeyDictionary
+import pygame
+
+try:
+    import numpy as np
+    import pygame.sndarray
+except ImportError:  # numpy is optional; clips then play at their natural length
+    np = None
+
+# ----------------------------
+# Fitting clips to a duration
+# ----------------------------
+# Cached per (source clip, duration). The source Sound is a weak key, so a
+# theme's fitted clips go away together with the theme's decoded sounds.
+FADE_MS = 12  # ramp at the cut (and at loop seams) so there is no click
+
+_fitted = WeakKeyDictionary()  # source Sound -> {duration_ms: Sound}
+_fitted_lock = threading.Lock()
+
+
+def fit_sound(snd, duration_ms: int):
+    """Return snd trimmed or looped to last exactly duration_ms. Falls back to snd itself without numpy."""
+    if np is None or snd is None:
+        return snd
+
+    with _fitted_lock:
+        fitted = _fitted.get(snd, {}).get(duration_ms)
+    if fitted is not None:
+        return fitted
+
+    fitted = _build_fitted(snd, duration_ms)
+    with _fitted_lock:
+        _fitted.setdefault(snd, {})[duration_ms] = fitted
+    return fitted
+
+
+def _build_fitted(snd, duration_ms):
+    frequency = pygame.mixer.get_init()[0]
+    samples = pygame.sndarray.array(snd)
+    target = max(1, round(frequency * duration_ms / 1000))
+    fade = min(round(frequency * FADE_MS / 1000), target // 2)
+
+    if len(samples) >= target:
+        out = samples[:target].astype(np.float32)
+    else:
+        # Loop: soften both ends of the clip so the seams don't click, then tile
+        unit = samples.astype(np.float32)
+        ramp = _ramp(min(fade, len(unit) // 2), unit.ndim)
+        if len(ramp):
+            unit[:len(ramp)] *= ramp
+            unit[-len(ramp):] *= ramp[::-1]
+        reps = math.ceil(target / len(unit))
+        out = np.tile(unit, (reps,) + (1,) * (unit.ndim - 1))[:target]
+
+    if fade:
+        out[-fade:] *= _ramp(fade, out.ndim)[::-1]
+
+    info = np.iinfo(samples.dtype)
+    out = np.clip(out, info.min, info.max).astype(samples.dtype)
+    fitted = pygame.sndarray.make_sound(np.ascontiguousarray(out))
+    fitted.set_volume(snd.get_volume())
+    return fitted
+
+
+def _ramp(length, ndim):
+    ramp = np.linspace(0.0, 1.0, length, dtype=np.float32)
+    return ramp[:, None] if ndim > 1 else ramp
@@ -0,0 +1,251 @@
+import io, os, json, hashlib, tempfile, threading, zipfile
+import pygame
+from utils.helpers import get_config_path
+from utils.sound import ensure_mixer
+from utils import loudness
+
+# ----------------------------
+# User sound packs
+# ----------------------------
+# A pack is a folder or a .zip in the sound_packs directory (next to
+# config.json) holding any of LP_counting / LP_updated / LP_empty / Refresh as
+# OGG, FLAC, MP3 or WAV, optionally with a pack.json {"name": "..."}. Packs are
+# read in place; nothing is extracted. The first load of a clip decodes it and
+# stores the PCM, at the mixer's format, in sound_cache/ under its content hash,
+# so later loads (and identical clips in other packs) skip decoding. The hash of
+# each clip is indexed by the file's mtime and size in sound_cache/index.json,
+# so a cached clip loads without reading or hashing the encoded data at all.
+PACK_PREFIX = "pack:"  # sound folder names for packs look like "pack:<file name>"
+PACK_EXTENSIONS = (".ogg", ".flac", ".mp3", ".wav")
+SOUND_NAMES = ("LP_counting", "LP_updated", "LP_empty", "Refresh")
+
+
+def packs_dir():
+    return get_config_path("sound_packs")
+
+
+def cache_dir():
+    return get_config_path("sound_cache")
+
+
+class SoundPack:
+    """One pack on disk: a folder or a zip, with the member holding each sound."""
+
+    def __init__(self, path, name, members):
+        self.path = path
+        self.name = name
+        self.members = members  # sound name -> path inside the folder / zip
+
+    @property
+    def folder(self):
+        """The sound-folder value stored in config for this pack."""
+        return PACK_PREFIX + os.path.basename(self.path)
+
+    def signature(self, sound_name):
+        """(mtime_ns, size) of the file holding a clip: the zip itself, or the clip's own file."""
+        path = self.path if zipfile.is_zipfile(self.path) else os.path.join(self.path, self.members[sound_name])
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def read(self, sound_name):
+        """Return the raw (still encoded) bytes of one clip."""
+        member = self.members[sound_name]
+        if zipfile.is_zipfile(self.path):
+            with zipfile.ZipFile(self.path) as archive:
+                return archive.read(member)
+        with open(os.path.join(self.path, member), "rb") as f:
+            return f.read()
+
+
+def _match_members(names):
+    """Map sound names to member paths by file stem, ignoring case and sub-folders."""
+    members = {}
+    for name in names:
+        stem, ext = os.path.splitext(os.path.basename(name))
+        if ext.lower() not in PACK_EXTENSIONS:
+            continue
+        for sound_name in SOUND_NAMES:
+            if stem.lower() == sound_name.lower() and sound_name not in members:
+                members[sound_name] = name
+    return members
+
+
+def _read_pack(path):
+    default_name = os.path.splitext(os.path.basename(path))[0]
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            names = archive.namelist()
+            manifest = next((n for n in names if os.path.basename(n) == "pack.json"), None)
+            info = json.loads(archive.read(manifest)) if manifest else {}
+    elif os.path.isdir(path):
+        names = [os.path.relpath(os.path.join(root, f), path) for root, _, files in os.walk(path) for f in files]
+        manifest = os.path.join(path, "pack.json")
+        info = {}
+        if os.path.exists(manifest):
+            with open(manifest, "r") as f:
+                info = json.load(f)
+    else:
+        return None
+
+    members = _match_members(names)
+    if not members:
+        return None
+    return SoundPack(path, str(info.get("name") or default_name), members)
+
+
+def discover_packs():
+    """Return {folder: SoundPack} for every readable pack in the packs directory."""
+    directory = packs_dir()
+    if not os.path.isdir(directory):
+        return {}
+
+    packs = {}
+    for entry in sorted(os.listdir(directory)):
+        try:
+            pack = _read_pack(os.path.join(directory, entry))
+        except (OSError, ValueError, zipfile.BadZipFile) as e:
+            print(f"⚠️ Skipping sound pack '{entry}': {e}")
+            continue
+        if pack is not None:
+            packs[pack.folder] = pack
+    return packs
+
+
+# ----------------------------
+# Transcoding cache
+# ----------------------------
+_packs = None
+_packs_lock = threading.Lock()
+
+
+def get_pack(folder):
+    """Return the SoundPack for a "pack:<name>" folder, discovering packs on first use."""
+    global _packs
+    with _packs_lock:
+        if _packs is None:
+            _packs = discover_packs()
+        return _packs.get(folder)
+
+
+def refresh_packs():
+    global _packs
+    with _packs_lock:
+        _packs = discover_packs()
+        return dict(_packs)
+
+
+def pack_themes(taken=()):
+    """Return {display name: folder} for the installed packs, renaming any that clash with taken names."""
+    themes = {}
+    for folder, pack in refresh_packs().items():
+        name = pack.name
+        if name in taken or name in themes:
+            name = f"{name} ({os.path.basename(pack.path)})"
+        themes[name] = folder
+    return themes
+
+
+INDEX_FILE = "index.json"
+_index = None  # "<pack path>|<member>" -> {"mtime", "size", "sha256"}
+_index_lock = threading.Lock()
+
+
+def _load_index():
+    global _index
+    if _index is None:
+        _index = {}
+        try:
+            with open(os.path.join(cache_dir(), INDEX_FILE), "r") as f:
+                _index.update(json.load(f))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Ignoring unreadable sound cache index: {e}")
+    return _index
+
+
+def _indexed_digest(pack, sound_name):
+    """The clip's content hash if its file is unchanged since it was indexed, else None."""
+    try:
+        mtime, size = pack.signature(sound_name)
+    except OSError:
+        return None
+    with _index_lock:
+        entry = _load_index().get(f"{pack.path}|{pack.members[sound_name]}")
+    if entry and entry["mtime"] == mtime and entry["size"] == size:
+        return entry["sha256"]
+    return None
+
+
+def _index_digest(pack, sound_name, digest):
+    try:
+        mtime, size = pack.signature(sound_name)
+    except OSError:
+        return
+    with _index_lock:
+        index = _load_index()
+        index[f"{pack.path}|{pack.members[sound_name]}"] = {"mtime": mtime, "size": size, "sha256": digest}
+        try:
+            os.makedirs(cache_dir(), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=".index-", dir=cache_dir())
+            with os.fdopen(fd, "w") as f:
+                json.dump(index, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, os.path.join(cache_dir(), INDEX_FILE))
+        except OSError as e:
+            print(f"⚠️ Could not save sound cache index: {e}")
+
+
+def _cache_path(digest):
+    frequency, size, channels = pygame.mixer.get_init()
+    return os.path.join(cache_dir(), f"{digest}.{frequency}_{size}_{channels}.pcm")
+
+
+def load_clip(pack, sound_name, transcode=True):
+    """Return a Sound for one clip of a pack.
+
+    Cached PCM is used when present. Otherwise the clip is decoded and cached,
+    unless transcode is False (on the Tk thread), in which case None is
+    returned and the caller should load the theme in the background.
+    """
+    if sound_name not in pack.members:
+        return None
+    ensure_mixer()
+    digest = _indexed_digest(pack, sound_name)
+    if digest is not None:
+        snd = _load_cached(digest)
+        if snd is not None:
+            return snd
+
+    data = pack.read(sound_name)
+    digest = hashlib.sha256(data).hexdigest()
+    _index_digest(pack, sound_name, digest)
+    snd = _load_cached(digest)
+    if snd is not None:
+        return snd
+    if not transcode:
+        return None
+
+    snd = pygame.mixer.Sound(file=io.BytesIO(data))  # SDL_mixer detects the format from the data
+    _write_cache(_cache_path(digest), snd.get_raw())
+    return loudness.normalize(snd, digest=digest)
+
+
+def _load_cached(digest):
+    """The cached PCM for a content hash as a normalized Sound, or None if it isn't cached."""
+    try:
+        with open(_cache_path(digest), "rb") as f:
+            return loudness.normalize(pygame.mixer.Sound(buffer=f.read()), digest=digest)
+    except FileNotFoundError:
+        return None
+
+
+def _write_cache(path, pcm):
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".pcm-", dir=directory)
+        with os.fdopen(fd, "wb") as f:
+            f.write(pcm)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️ Could not cache transcoded sound: {e}")
@@ -0,0 +1,141 @@
+import math, threading
+from functools import lru_cache
+from weakref import WeakSet
+import pygame
+
+try:
+    import numpy as np
+    import pygame.sndarray
+except ImportError:  # numpy is optional; the synth theme is hidden without it
+    np = None
+
+# ----------------------------
+# Synthesised sound theme
+# ----------------------------
+# Generated at load time instead of shipped as WAVs. Counting ticks follow the
+# LP change: bigger changes tick faster and higher, damage sits a fourth below
+# healing. Every clip is memoised, so each variant is generated once.
+SYNTH_FOLDER = "synth"
+
+TICK_MS = 18
+BASE_TICK_HZ = 660.0
+AMPLITUDE = 0.35
+
+_generated = WeakSet()  # every Sound made here, to recognise synth clips at play time
+_generated_lock = threading.Lock()
+
+
+def available():
+    return np is not None
+
+
+def is_synth(snd):
+    with _generated_lock:
+        return snd in _generated
+
+
+def _format():
+    frequency, _, channels = pygame.mixer.get_init()
+    return frequency, channels
+
+
+def _to_sound(wave):
+    """Turn a mono float wave in -1..1 into a Sound at the mixer's format."""
+    frequency, channels = _format()
+    pcm = np.clip(wave * AMPLITUDE * 32767, -32768, 32767).astype(np.int16)
+    if channels > 1:
+        pcm = np.repeat(pcm[:, None], channels, axis=1)
+    snd = pygame.sndarray.make_sound(np.ascontiguousarray(pcm))
+    with _generated_lock:
+        _generated.add(snd)
+    return snd
+
+
+def _tones(freqs, length_s, frequency, decay):
+    """One decaying sine per row, all generated in a single vectorised pass."""
+    t = np.arange(int(length_s * frequency), dtype=np.float32) / frequency
+    freqs = np.asarray(freqs, dtype=np.float32)[:, None]
+    return np.sin(2 * np.pi * freqs * t) * np.exp(-decay * t)
+
+
+def _stagger(notes, offsets_s, frequency):
+    """Delay each row by its offset, padding the start with silence."""
+    for row, offset in enumerate(offsets_s):
+        shift = int(offset * frequency)
+        if shift:
+            notes[row, shift:] = notes[row, :-shift].copy()
+            notes[row, :shift] = 0
+    return notes
+
+
+# ----------------------------
+# Clips
+# ----------------------------
+def delta_bucket(delta):
+    """Sizes of LP change that sound alike: 0 for under 10 LP, up to 4 for 10000+."""
+    return min(4, int(math.log10(max(1, abs(delta)))))
+
+
+@lru_cache(maxsize=64)
+def _counting(bucket, healing, duration_ms, fmt):
+    frequency, _ = fmt
+    length = max(1, round(frequency * duration_ms / 1000))
+    rate = 12 + 6 * bucket  # ticks per second
+    count = max(1, int(duration_ms / 1000 * rate))
+    pitch = BASE_TICK_HZ * 2 ** (bucket / 6) * (1.0 if healing else 0.75)
+
+    # Each tick glides up a little over the count; build them all at once
+    glide = np.linspace(1.0, 1.25, count, dtype=np.float32)
+    ticks = _tones(pitch * glide, TICK_MS / 1000, frequency, decay=180.0)
+    starts = (np.arange(count) * (length / count)).astype(np.int64)
+    index = starts[:, None] + np.arange(ticks.shape[1])[None, :]
+    inside = index < length
+
+    wave = np.zeros(length, dtype=np.float32)
+    np.add.at(wave, index[inside], ticks[inside])
+    return _to_sound(wave)
+
+
+def counting(delta, duration_ms):
+    """Ticks lasting exactly duration_ms whose rate and pitch follow the LP change."""
+    return _counting(delta_bucket(delta), delta > 0, int(duration_ms), _format())
+
+
+@lru_cache(maxsize=8)
+def _chime(fmt):
+    frequency, _ = fmt
+    # Major third, the upper note entering slightly later
+    notes = _stagger(_tones([880.0, 1108.7], 0.45, frequency, decay=7.0), (0.0, 0.06), frequency)
+    return _to_sound(notes.sum(axis=0) / 2)
+
+
+@lru_cache(maxsize=8)
+def _sting(fmt):
+    frequency, _ = fmt
+    # Falling minor arpeggio ending low
+    notes = _stagger(_tones([392.0, 311.1, 196.0], 0.8, frequency, decay=4.0), (0.0, 0.15, 0.3), frequency)
+    return _to_sound(notes.sum(axis=0) / 3)
+
+
+@lru_cache(maxsize=8)
+def _refresh(fmt):
+    frequency, _ = fmt
+    # Quick rising arpeggio
+    notes = _stagger(_tones([523.3, 659.3, 784.0], 0.35, frequency, decay=9.0), (0.0, 0.06, 0.12), frequency)
+    return _to_sound(notes.sum(axis=0) / 3)
+
+
+DEFAULT_COUNT_DELTA = -1000
+DEFAULT_COUNT_MS = 1300
+
+
+def load(sound_name):
+    """Return the synthesised clip standing in for <sound_name>.wav, or None without numpy."""
+    if np is None:
+        return None
+    fmt = _format()
+    if sound_name == "LP_counting":
+        return _counting(delta_bucket(DEFAULT_COUNT_DELTA), False, DEFAULT_COUNT_MS, fmt)
+    generators = {"LP_updated": _chime, "LP_empty": _sting, "Refresh": _refresh}
+    generator = generators.get(sound_name)
+    return generator(fmt) if generator else None